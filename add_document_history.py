@@ -6,45 +6,41 @@ that don't already have one.
 
 import os
 import re
-from pathlib import Path
 
-# Document History template
-DOCUMENT_HISTORY = """## Document History
-
-| Version | Date | Author | Changes |
-|---------|------|--------|---------|
-| 1.0.0 | 2025-11-19 | Documentation Team | Initial version |
-
-"""
+from doc_history import history_section, load_index
+from doc_metadata import MetadataIndex
+from docs_corpus import DOCS_APP_DIR, Corpus, rel
 
 def has_document_history(content):
     """Check if content already has Document History section"""
     return "## Document History" in content
 
-def add_document_history(content):
-    """Add Document History section to content"""
+def add_document_history(content, anchor=None, section=None):
+    """Add Document History section to content
+
+    anchor is the 1-based line of the **Status**: (or **Last Updated**:) line
+    from the metadata index; without it the lines are searched for here.
+    section is the section text (doc_history.history_section); by default a
+    single "Initial version" row for today.
+    """
     lines = content.split('\n')
 
     # Find insertion point
     insertion_index = None
 
     # Pattern 1: After **Status**: line
-    for i, line in enumerate(lines):
-        if line.strip().startswith('**Status**:'):
-            # Insert after this line and any blank lines
-            insertion_index = i + 1
-            while insertion_index < len(lines) and lines[insertion_index].strip() == '':
-                insertion_index += 1
-            break
-
     # Pattern 2: After **Last Updated**: line
-    if insertion_index is None:
-        for i, line in enumerate(lines):
-            if line.strip().startswith('**Last Updated**:'):
-                insertion_index = i + 1
-                while insertion_index < len(lines) and lines[insertion_index].strip() == '':
-                    insertion_index += 1
+    if anchor is None:
+        for label in ('**Status**:', '**Last Updated**:'):
+            anchor = next((i + 1 for i, line in enumerate(lines)
+                           if line.strip().startswith(label)), None)
+            if anchor is not None:
                 break
+    if anchor is not None:
+        # Insert after this line and any blank lines
+        insertion_index = anchor
+        while insertion_index < len(lines) and lines[insertion_index].strip() == '':
+            insertion_index += 1
 
     # Pattern 3: Before first --- separator
     if insertion_index is None:
@@ -65,43 +61,47 @@ def add_document_history(content):
 
     if insertion_index is not None:
         # Insert the Document History section
-        lines.insert(insertion_index, DOCUMENT_HISTORY.rstrip())
+        lines.insert(insertion_index, (section or history_section([])).rstrip())
         return '\n'.join(lines)
 
     return content
 
-def process_files():
+def process_files(corpus=None):
     """Process all markdown files"""
-    docs_dir = Path('/Users/peak/Documents/GitHub/carmen/docs/app')
-    template_dir = Path('/Users/peak/Documents/GitHub/carmen/docs/app/template-guide')
+    corpus = corpus or Corpus()
+    docs_dir = DOCS_APP_DIR
 
-    md_files = list(docs_dir.rglob('*.md'))
-
-    # Exclude template files
-    md_files = [f for f in md_files if not str(f).startswith(str(template_dir))]
+    # Template files are excluded by the docs root config
+    md_files = corpus.files(docs_dir)
 
     total_files = len(md_files)
     updated_files = 0
     skipped_files = 0
 
+    index = MetadataIndex()
+    index.refresh(corpus)
+    # Rows come from each file's commits; files git has not seen get one row for today
+    history = load_index()
+
     print(f"Found {total_files} documentation files")
     print("Processing...\n")
 
     for md_file in md_files:
         try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = corpus.read(md_file)
 
             if has_document_history(content):
                 skipped_files += 1
                 continue
 
-            # Add Document History
-            new_content = add_document_history(content)
+            # Add Document History after the indexed Status / Last Updated line
+            anchor = (index.first_line(md_file, ['Status'], bullet=False)
+                      or index.first_line(md_file, ['Last Updated'], bullet=False))
+            commits = history.history_of(rel(md_file)) if history else []
+            new_content = add_document_history(content, anchor, history_section(commits))
 
             # Write back
-            with open(md_file, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            corpus.write(md_file, new_content)
 
             updated_files += 1
             print(f"✅ Updated: {md_file.relative_to(docs_dir)}")
@@ -109,6 +109,8 @@ def process_files():
         except Exception as e:
             print(f"❌ Error processing {md_file}: {e}")
 
+    index.close()
+
     print(f"\n{'='*60}")
     print(f"Total files processed: {total_files}")
     print(f"Files updated: {updated_files}")
@@ -6,23 +6,16 @@ in the entire docs/ directory that don't already have one.
 
 import os
 import re
-from pathlib import Path
 
-# Document History template
-DOCUMENT_HISTORY = """## Document History
-
-| Version | Date | Author | Changes |
-|---------|------|--------|---------|
-| 1.0.0 | 2025-11-19 | Documentation Team | Initial version |
-
-"""
+from doc_history import history_section, load_index
+from docs_corpus import DOCS_DIR, Corpus, rel
 
 def has_document_history(content):
     """Check if content already has Document History section"""
     return "## Document History" in content
 
-def add_document_history(content):
-    """Add Document History section to content"""
+def add_document_history(content, section=None):
+    """Add Document History section to content (section defaults to one row for today)"""
     lines = content.split('\n')
 
     # Find insertion point
@@ -65,21 +58,19 @@ def add_document_history(content):
 
     if insertion_index is not None:
         # Insert the Document History section
-        lines.insert(insertion_index, DOCUMENT_HISTORY.rstrip())
+        lines.insert(insertion_index, (section or history_section([])).rstrip())
         return '\n'.join(lines)
 
     return content
 
 def process_files():
     """Process all markdown files in docs directory"""
-    docs_dir = Path('/Users/peak/Documents/GitHub/carmen/docs')
-
-    # Get all markdown files recursively
-    md_files = list(docs_dir.rglob('*.md'))
+    docs_dir = DOCS_DIR
 
-    # Exclude template-guide directory
-    template_dir = docs_dir / 'app' / 'template-guide'
-    md_files = [f for f in md_files if not str(f).startswith(str(template_dir))]
+    # Get all markdown files recursively (template-guide is excluded by the docs root config)
+    md_files = Corpus().files(docs_dir)
+    # Rows come from each file's commits; files git has not seen get one row for today
+    history = load_index()
 
     total_files = len(md_files)
     updated_files = 0
@@ -108,7 +99,8 @@ def process_files():
                 continue
 
             # Add Document History
-            new_content = add_document_history(content)
+            commits = history.history_of(rel(md_file)) if history else []
+            new_content = add_document_history(content, history_section(commits))
 
             # Write back
             with open(md_file, 'w', encoding='utf-8') as f:
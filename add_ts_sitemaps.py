@@ -6,24 +6,26 @@ Add standardized sitemap sections to TS files that are missing them
 import re
 from pathlib import Path
 
+from docs_corpus import DOCS_DIR
+
 # Files that need sitemaps added
 files_to_update = {
     # Inventory Management (3)
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/fractional-inventory/TS-fractional-inventory.md": {
+    str(DOCS_DIR / "app/inventory-management/fractional-inventory/TS-fractional-inventory.md"): {
         "module": "Inventory Management",
         "submodule": "Fractional Inventory",
         "route": "/inventory-management/fractional-inventory",
         "entity": "fractional inventory item",
         "entities": "fractional inventory items"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/lot-based-costing/TS-lot-based-costing.md": {
+    str(DOCS_DIR / "app/inventory-management/lot-based-costing/TS-lot-based-costing.md"): {
         "module": "Inventory Management",
         "submodule": "Lot-Based Costing",
         "route": "/inventory-management/lot-based-costing",
         "entity": "lot",
         "entities": "lots"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/period-end/TS-period-end.md": {
+    str(DOCS_DIR / "app/inventory-management/period-end/TS-period-end.md"): {
         "module": "Inventory Management",
         "submodule": "Period End",
         "route": "/inventory-management/period-end",
@@ -31,28 +33,28 @@ files_to_update = {
         "entities": "period closings"
     },
     # Operational Planning (4)
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/menu-engineering/TS-menu-engineering.md": {
+    str(DOCS_DIR / "app/operational-planning/menu-engineering/TS-menu-engineering.md"): {
         "module": "Operational Planning",
         "submodule": "Menu Engineering",
         "route": "/operational-planning/menu-engineering",
         "entity": "menu item",
         "entities": "menu items"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/recipe-management/categories/TS-categories.md": {
+    str(DOCS_DIR / "app/operational-planning/recipe-management/categories/TS-categories.md"): {
         "module": "Operational Planning",
         "submodule": "Recipe Categories",
         "route": "/operational-planning/recipe-management/categories",
         "entity": "recipe category",
         "entities": "recipe categories"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/recipe-management/cuisine-types/TS-cuisine-types.md": {
+    str(DOCS_DIR / "app/operational-planning/recipe-management/cuisine-types/TS-cuisine-types.md"): {
         "module": "Operational Planning",
         "submodule": "Cuisine Types",
         "route": "/operational-planning/recipe-management/cuisine-types",
         "entity": "cuisine type",
         "entities": "cuisine types"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/recipe-management/recipes/TS-recipes.md": {
+    str(DOCS_DIR / "app/operational-planning/recipe-management/recipes/TS-recipes.md"): {
         "module": "Operational Planning",
         "submodule": "Recipes",
         "route": "/operational-planning/recipe-management/recipes",
@@ -60,21 +62,21 @@ files_to_update = {
         "entities": "recipes"
     },
     # Procurement (3)
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/credit-note/TS-credit-note.md": {
+    str(DOCS_DIR / "app/procurement/credit-note/TS-credit-note.md"): {
         "module": "Procurement",
         "submodule": "Credit Notes",
         "route": "/procurement/credit-note",
         "entity": "credit note",
         "entities": "credit notes"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/my-approvals/TS-my-approvals.md": {
+    str(DOCS_DIR / "app/procurement/my-approvals/TS-my-approvals.md"): {
         "module": "Procurement",
         "submodule": "My Approvals",
         "route": "/procurement/my-approvals",
         "entity": "approval",
         "entities": "approvals"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/purchase-request-templates/TS-purchase-request-templates.md": {
+    str(DOCS_DIR / "app/procurement/purchase-request-templates/TS-purchase-request-templates.md"): {
         "module": "Procurement",
         "submodule": "Purchase Request Templates",
         "route": "/procurement/purchase-request-templates",
@@ -82,21 +84,21 @@ files_to_update = {
         "entities": "templates"
     },
     # Product Management (3)
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/categories/TS-categories.md": {
+    str(DOCS_DIR / "app/product-management/categories/TS-categories.md"): {
         "module": "Product Management",
         "submodule": "Categories",
         "route": "/product-management/categories",
         "entity": "category",
         "entities": "categories"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/products/TS-products.md": {
+    str(DOCS_DIR / "app/product-management/products/TS-products.md"): {
         "module": "Product Management",
         "submodule": "Products",
         "route": "/product-management/products",
         "entity": "product",
         "entities": "products"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/units/TS-units.md": {
+    str(DOCS_DIR / "app/product-management/units/TS-units.md"): {
         "module": "Product Management",
         "submodule": "Units",
         "route": "/product-management/units",
@@ -104,14 +106,14 @@ files_to_update = {
         "entities": "units"
     },
     # Store Operations (2)
-    "/Users/peak/Documents/GitHub/carmen/docs/app/store-operations/stock-replenishment/TS-stock-replenishment.md": {
+    str(DOCS_DIR / "app/store-operations/stock-replenishment/TS-stock-replenishment.md"): {
         "module": "Store Operations",
         "submodule": "Stock Replenishment",
         "route": "/store-operations/stock-replenishment",
         "entity": "replenishment request",
         "entities": "replenishment requests"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/store-operations/store-requisitions/TS-store-requisitions.md": {
+    str(DOCS_DIR / "app/store-operations/store-requisitions/TS-store-requisitions.md"): {
         "module": "Store Operations",
         "submodule": "Store Requisitions",
         "route": "/store-operations/store-requisitions",
@@ -119,49 +121,49 @@ files_to_update = {
         "entities": "requisitions"
     },
     # System Administration (7)
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/TS-system-administration.md": {
+    str(DOCS_DIR / "app/system-administration/TS-system-administration.md"): {
         "module": "System Administration",
         "submodule": "Overview",
         "route": "/system-administration",
         "entity": "configuration",
         "entities": "configurations"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/business-rules/TS-business-rules.md": {
+    str(DOCS_DIR / "app/system-administration/business-rules/TS-business-rules.md"): {
         "module": "System Administration",
         "submodule": "Business Rules",
         "route": "/system-administration/business-rules",
         "entity": "business rule",
         "entities": "business rules"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/monitoring/TS-monitoring.md": {
+    str(DOCS_DIR / "app/system-administration/monitoring/TS-monitoring.md"): {
         "module": "System Administration",
         "submodule": "Monitoring",
         "route": "/system-administration/monitoring",
         "entity": "metric",
         "entities": "metrics"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/permission-management/TS-permission-management.md": {
+    str(DOCS_DIR / "app/system-administration/permission-management/TS-permission-management.md"): {
         "module": "System Administration",
         "submodule": "Permission Management",
         "route": "/system-administration/permission-management",
         "entity": "permission",
         "entities": "permissions"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/settings/TS-settings.md": {
+    str(DOCS_DIR / "app/system-administration/settings/TS-settings.md"): {
         "module": "System Administration",
         "submodule": "Settings",
         "route": "/system-administration/settings",
         "entity": "setting",
         "entities": "settings"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/system-integrations/TS-system-integrations.md": {
+    str(DOCS_DIR / "app/system-administration/system-integrations/TS-system-integrations.md"): {
         "module": "System Administration",
         "submodule": "System Integrations",
         "route": "/system-administration/system-integrations",
         "entity": "integration",
         "entities": "integrations"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/workflow/TS-workflow.md": {
+    str(DOCS_DIR / "app/system-administration/workflow/TS-workflow.md"): {
         "module": "System Administration",
         "submodule": "Workflow",
         "route": "/system-administration/workflow",
@@ -169,35 +171,35 @@ files_to_update = {
         "entities": "workflows"
     },
     # Vendor Management (5)
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/price-lists/TS-price-lists.md": {
+    str(DOCS_DIR / "app/vendor-management/price-lists/TS-price-lists.md"): {
         "module": "Vendor Management",
         "submodule": "Price Lists",
         "route": "/vendor-management/price-lists",
         "entity": "price list",
         "entities": "price lists"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/pricelist-templates/TS-pricelist-templates.md": {
+    str(DOCS_DIR / "app/vendor-management/pricelist-templates/TS-pricelist-templates.md"): {
         "module": "Vendor Management",
         "submodule": "Pricelist Templates",
         "route": "/vendor-management/pricelist-templates",
         "entity": "template",
         "entities": "templates"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/requests-for-pricing/TS-requests-for-pricing.md": {
+    str(DOCS_DIR / "app/vendor-management/requests-for-pricing/TS-requests-for-pricing.md"): {
         "module": "Vendor Management",
         "submodule": "Requests for Pricing",
         "route": "/vendor-management/requests-for-pricing",
         "entity": "request",
         "entities": "requests"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-directory/TS-vendor-directory.md": {
+    str(DOCS_DIR / "app/vendor-management/vendor-directory/TS-vendor-directory.md"): {
         "module": "Vendor Management",
         "submodule": "Vendor Directory",
         "route": "/vendor-management/vendor-directory",
         "entity": "vendor",
         "entities": "vendors"
     },
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-portal/TS-vendor-portal.md": {
+    str(DOCS_DIR / "app/vendor-management/vendor-portal/TS-vendor-portal.md"): {
         "module": "Vendor Management",
         "submodule": "Vendor Portal",
         "route": "/vendor-management/vendor-portal",
@@ -404,7 +406,7 @@ def main():
 
     for file_path, config in files_to_update.items():
         path_obj = Path(file_path)
-        rel_path = path_obj.relative_to(Path('/Users/peak/Documents/GitHub/carmen/docs'))
+        rel_path = path_obj.relative_to(DOCS_DIR)
 
         if not path_obj.exists():
             error_count += 1
@@ -3,9 +3,14 @@
 
 import re
 import sys
+from pathlib import Path
 
-def main():
-    with open('mockPRListData.ts', 'r') as f:
+# Default target: the mock data module next to this script
+MOCK_DATA_PATH = Path(__file__).resolve().parent / 'mockPRListData.ts'
+
+def main(path=None):
+    path = Path(path or MOCK_DATA_PATH)
+    with open(path, 'r') as f:
         content = f.read()
 
     # Split into PR section and items section
@@ -149,11 +154,11 @@ def main():
     # Reassemble the file
     result = before_prs + pr_content + between_sections + items_content + after_items
 
-    with open('mockPRListData.ts', 'w') as f:
+    with open(path, 'w') as f:
         f.write(result)
 
     print("\n✅ All transformations complete!")
     print("Run: npm run checktypes to verify")
 
 if __name__ == '__main__':
-    main()
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
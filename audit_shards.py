@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Run the per-file docs audit in N deterministic shards and merge their partial results exactly
+- Audit: Document History position (docs/app), TS sitemaps, BR '---' after tables, and the
+  BR/UC/VAL rule-ID definitions and references of every doc
+- A file belongs to shard int(sha1(repo-relative path)[:8], 16) % N, so any runner, process or
+  machine computes the same split without coordination
+- --shard K/N audits one shard and writes .docs-cache/shards/shard-K-of-N.json: its findings,
+  counters and rule-ID extractions, plus a fingerprint of the whole file list
+- --merge combines every partial: findings are merged in (file, line, rule) order, counters are
+  summed, and the rule-ID index is rebuilt from the union so duplicate and dangling IDs are
+  judged corpus-wide, exactly as one unsharded run would; missing shards, overlapping files or
+  partials from another checkout are refused
+- --local N (the default, N = worker count) is the single-machine stand-in for N CI jobs:
+  N `carmen_docs.py --workers 1 audit-shards --shard K/N` processes, then the merge
+- Per-file results go through the content-addressed result_cache (keyed by AUDIT_VERSION, the
+  rule modules' source and the file's bytes), so a fresh clone or runner pointed at a shared
+  --cache directory only audits files nobody has audited before
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from check_br_markdown_errors import br_findings
+from check_doc_history_position import history_findings
+from check_ts_sitemaps import sitemap_findings
+import check_br_markdown_errors
+import check_doc_history_position
+import check_ts_sitemaps
+import findings as findings_module
+import markdown_tables
+import rule_id_index
+from docs_corpus import CACHE_DIR, DOCS_APP_DIR, REPO_ROOT, Corpus, rel
+from findings import Finding, finding, report, to_record
+from result_cache import DEFAULT_MAX_BYTES, RESULT_DIR, ResultCache, ruleset_digest
+from rule_id_index import analyze, build_index, doc_kind, extract_ids
+
+# Bump when the partial file layout or the audit itself changes; partials must agree on it
+AUDIT_VERSION = 1
+SHARD_DIR = CACHE_DIR / 'shards'
+# Modules whose code decides the per-file results; their source is part of the cache key
+RULE_MODULES = (check_doc_history_position, check_ts_sitemaps, check_br_markdown_errors,
+                markdown_tables, rule_id_index, findings_module)
+
+
+def shard_of(path, count):
+    """Shard index of a repo-relative path; stable across processes, machines and Python runs"""
+    return int(hashlib.sha1(path.encode('utf-8')).hexdigest()[:8], 16) % count
+
+
+def fingerprint(files):
+    """Digest of the full sorted file list, so shards from different checkouts never merge"""
+    digest = hashlib.sha1()
+    for path in sorted(rel(f) for f in files):
+        digest.update(path.encode('utf-8') + b'\n')
+    return digest.hexdigest()
+
+
+def partial_path(directory, shard, count):
+    return Path(directory) / f"shard-{shard:03d}-of-{count:03d}.json"
+
+
+def finding_key(record):
+    return (record['file'], record['span']['start'] if record['span'] else 0,
+            record['rule'], record['message'])
+
+
+def from_record(record):
+    span = (record['span']['start'], record['span']['end']) if record['span'] else None
+    return Finding(record['file'], record['rule'], record['severity'], span, record['message'])
+
+
+def checks_for(path):
+    """Checks that apply to a file, decided by its folder and name alone"""
+    checks = []
+    if DOCS_APP_DIR in path.parents:
+        checks.append('history')
+    if path.name.startswith('TS-'):
+        checks.append('sitemap')
+    if path.name.startswith('BR-'):
+        checks.append('br-lint')
+    if path.suffix == '.md':
+        checks.append('rule-ids')
+    return checks
+
+
+def profile(path):
+    """Everything besides the content that a file's results depend on (see checks_for, doc_kind)"""
+    return f"{','.join(checks_for(path))}:{doc_kind(path) or ''}"
+
+
+def audit_file(path, content):
+    """Process-pool worker: (checks run, finding records, rule-ID extraction or None) for one file"""
+    checks, found = checks_for(path), []
+    if 'history' in checks:
+        found += history_findings(path, content)
+    if 'sitemap' in checks:
+        found += sitemap_findings(path, content)
+    if 'br-lint' in checks:
+        found += br_findings(path, content)
+    extraction = extract_ids(path)[1] if 'rule-ids' in checks else None
+    return checks, [to_record(f) for f in found], extraction
+
+
+def cached_audit(paths, corpus, cache):
+    """audit_file() results in path order; only files the cache has never seen are audited.
+
+    Blobs leave out the file path, so identical files share one blob.
+    """
+    results, missing = {}, []
+    for path in paths:
+        found, data, key = cache.lookup(path, profile(path)) if cache else (False, None, None)
+        if found:
+            file = rel(path)
+            results[path] = (data['checks'], [dict(r, file=file) for r in data['findings']],
+                             data['rule_ids'])
+        else:
+            missing.append((path, key))
+    for (path, key), result in zip(missing, corpus.map_text(audit_file, [p for p, _ in missing])):
+        results[path] = result
+        if cache:
+            checks, found, extraction = result
+            cache.store(key, {'checks': checks, 'rule_ids': extraction,
+                              'findings': [{k: v for k, v in r.items() if k != 'file'} for r in found]})
+    return [results[p] for p in paths]
+
+
+def run_shard(corpus, shard, count, directory, cache=None):
+    """Audit one shard and write its partial file; returns the partial's path"""
+    files = corpus.files()
+    mine = [f for f in files if shard_of(rel(f), count) == shard]
+    counters = Counter(files=len(mine))
+    records, rule_ids = [], {}
+    for path, (checks, found, extraction) in zip(mine, cached_audit(mine, corpus, cache)):
+        counters.update(f"checked:{c}" for c in checks)
+        counters.update(f"rule:{r['rule']}" for r in found)
+        records += found
+        if extraction is not None:
+            rule_ids[rel(path)] = extraction
+    records.sort(key=finding_key)
+    if cache:
+        counters.update({'cache:hits': cache.hits, 'cache:misses': cache.misses})
+
+    out = partial_path(directory, shard, count)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'version': AUDIT_VERSION, 'shard': shard, 'of': count,
+                   'corpus': fingerprint(files), 'files': sorted(rel(p) for p in mine),
+                   'counters': dict(sorted(counters.items())), 'findings': records,
+                   'rule_ids': rule_ids}, f, ensure_ascii=False)
+    os.replace(tmp, out)
+    return out
+
+
+def load_partials(directory):
+    """Every partial in directory, checked to form one complete, consistent set of shards"""
+    partials = []
+    for path in sorted(Path(directory).glob('shard-*-of-*.json')):
+        with open(path, 'r', encoding='utf-8') as f:
+            partials.append(json.load(f))
+    if not partials:
+        raise ValueError(f"no shard results in {rel(directory)}")
+    first = partials[0]
+    for key in ('version', 'of', 'corpus'):
+        values = {p.get(key) for p in partials}
+        if len(values) > 1:
+            raise ValueError(f"shard results disagree on {key}: {', '.join(map(str, sorted(values)))}")
+    if first['version'] != AUDIT_VERSION:
+        raise ValueError(f"shard results are from audit version {first['version']}, not {AUDIT_VERSION}")
+    missing = set(range(first['of'])) - {p['shard'] for p in partials}
+    if missing:
+        raise ValueError(f"missing shard(s) {', '.join(map(str, sorted(missing)))} of {first['of']}")
+    seen = set()
+    for p in partials:
+        overlap = seen.intersection(p['files'])
+        if overlap:
+            raise ValueError(f"{len(overlap)} file(s) audited by more than one shard, e.g. {min(overlap)}")
+        seen.update(p['files'])
+    return partials
+
+
+def rule_id_findings(rule_ids):
+    """Corpus-wide rule-ID findings from the union of the shards' extractions"""
+    results = {REPO_ROOT / path: data for path, data in rule_ids.items()}
+    definitions, references, range_references = build_index(results)
+    analysis = analyze(definitions, references, range_references)
+    found = []
+    for dup in analysis['duplicates']:
+        places = ', '.join(f"{d['file']}:{d['line']}" for d in dup['definitions'])
+        for d in dup['definitions']:
+            found.append(finding(d['file'], 'duplicate-id', 'error',
+                                 f"{dup['id']} is defined more than once: {places}", d['line']))
+    for rule_id, places in analysis['dangling'].items():
+        for p in places:
+            found.append(finding(p['file'], 'dangling-id', 'error',
+                                 f"{rule_id} is not defined anywhere", p['line']))
+    for rule_id, places in analysis['ambiguous'].items():
+        for p in places:
+            found.append(finding(p['file'], 'ambiguous-id', 'warning',
+                                 f"{rule_id} is defined in several modules", p['line']))
+    coverage = {
+        'ids-defined': len(definitions),
+        'references': sum(len(r) for r in references.values()),
+        'unreferenced': sum(len(i) for i in analysis['unreferenced'].values()),
+        'foreign-ids': len(analysis['foreign']),
+    }
+    return sorted((to_record(f) for f in found), key=finding_key), coverage
+
+
+def merge(partials):
+    """(findings in order, counters, coverage) of a complete set of partials"""
+    counters = Counter()
+    rule_ids = {}
+    for p in partials:
+        counters.update(p['counters'])
+        rule_ids.update(p['rule_ids'])
+    global_records, coverage = rule_id_findings(rule_ids)
+    counters.update(f"rule:{r['rule']}" for r in global_records)
+    records = heapq.merge(*(p['findings'] for p in partials), global_records, key=finding_key)
+    return (from_record(r) for r in records), counters, coverage
+
+
+def run_local(corpus, count, directory, cache_args=()):
+    """Run every shard as its own process, like N independent CI jobs; returns failed shards"""
+    for stale in Path(directory).glob('shard-*-of-*.json'):
+        stale.unlink()
+    roots = ','.join(m.root.name for m in corpus.roots)
+    processes = [
+        subprocess.Popen([sys.executable, str(REPO_ROOT / 'carmen_docs.py'), '--workers', '1',
+                          '--roots', roots, 'audit-shards', '--shard', f"{k}/{count}",
+                          '--dir', str(directory), *cache_args],
+                         cwd=REPO_ROOT, stdout=subprocess.DEVNULL)
+        for k in range(count)
+    ]
+    return [k for k, proc in enumerate(processes) if proc.wait()]
+
+
+def parse_shard(text):
+    shard, _, count = text.partition('/')
+    try:
+        shard, count = int(shard), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected K/N, e.g. 0/4")
+    if not 0 <= shard < count:
+        raise argparse.ArgumentTypeError(f"shard {shard} is outside 0..{count - 1}")
+    return shard, count
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--shard', type=parse_shard, metavar='K/N',
+                        help="Audit shard K of N and write its partial result file")
+    parser.add_argument('--merge', action='store_true', help="Merge the partial results in --dir")
+    parser.add_argument('--local', type=int, metavar='N',
+                        help="Run N shard processes on this machine, then merge (default)")
+    parser.add_argument('--dir', type=Path, default=SHARD_DIR,
+                        help=f"Partial result directory (default: {rel(SHARD_DIR)})")
+    parser.add_argument('--cache', type=Path, default=RESULT_DIR,
+                        help=f"Shared result cache directory (default: {rel(RESULT_DIR)})")
+    parser.add_argument('--cache-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help="Evict least recently used results beyond this size (default: %(default).0f)")
+    parser.add_argument('--no-cache', action='store_true', help="Audit every file, ignoring the result cache")
+    parser.add_argument('--ndjson', action='store_true', help="Stream the merged findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    if args.shard:
+        shard, count = args.shard
+        cache = None if args.no_cache else ResultCache(
+            'audit-shards', AUDIT_VERSION, ruleset_digest(*RULE_MODULES), args.cache,
+            int(args.cache_mb * 1024 * 1024))
+        out = run_shard(corpus, shard, count, args.dir, cache)
+        if cache and cache.stored:
+            cache.evict()
+        print(f"✅ Shard {shard}/{count}: {rel(out)} ({(time.perf_counter() - started) * 1000:.0f} ms)")
+        return 0
+
+    if not args.merge:
+        count = args.local or corpus.workers
+        cache_args = ['--no-cache'] if args.no_cache else \
+            ['--cache', str(args.cache), '--cache-mb', str(args.cache_mb)]
+        failed = run_local(corpus, count, args.dir, cache_args)
+        if failed:
+            print(f"❌ Shard process(es) failed: {', '.join(map(str, failed))}", file=sys.stderr)
+            return 2
+
+    try:
+        partials = load_partials(args.dir)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    findings, counters, coverage = merge(partials)
+
+    if args.ndjson:
+        report(findings, ndjson=True)
+        return 0
+
+    summary = report(findings)
+    elapsed = time.perf_counter() - started
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Shards: {len(partials)} ({rel(args.dir)})")
+    print(f"Files audited: {counters['files']}")
+    if counters['cache:hits'] or counters['cache:misses']:
+        print(f"  from the result cache: {counters['cache:hits']} (audited: {counters['cache:misses']})")
+    for check in ('history', 'sitemap', 'br-lint', 'rule-ids'):
+        print(f"  {check}: {counters['checked:' + check]}")
+    print(f"Rule IDs: {coverage['ids-defined']} defined, {coverage['references']} reference(s), "
+          f"{coverage['unreferenced']} unreferenced")
+    print(f"Findings: {summary.total} in {summary.files} file(s)")
+    for severity in ('error', 'warning', 'info'):
+        print(f"  {severity}: {summary.by_severity[severity]}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*70}")
+    return 1 if summary.by_severity['error'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
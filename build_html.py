@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Incrementally build the HTML pages that sit next to the Markdown docs
+- Each page records its inputs (source, <!-- include: --> files, images, page template)
+  with their mtime/size and SHA-1 in .docs-cache/html-build.json
+- Only pages with a changed, added or removed input are re-rendered; a touched file whose
+  content hash is unchanged just refreshes its stamp
+- Stale pages render on the corpus process pool; outputs are written atomically
+- Pages embed the expanded Markdown and render it in the browser with marked (GFM, line breaks),
+  exactly as the committed pages do; the title, breadcrumb and TOC are built here
+- Replaces the full re-conversions of docs/convert-md-to-html-v2.js
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from string import Template
+
+from check_assets import MARKDOWN_IMAGE, resolve
+from docs_corpus import CACHE_DIR, DOCS_DIR, REPO_ROOT, Corpus, rel
+from export_bundle import HEADING_PATTERN, extract_title, heading_id
+
+# Bump when render_page() or the page layout changes so every page is rebuilt
+BUILD_VERSION = 2
+GRAPH_PATH = CACHE_DIR / 'html-build.json'
+TEMPLATE_PATH = DOCS_DIR / 'templates' / 'doc-page.html'
+DEFAULT_SOURCES = [DOCS_DIR / 'documents']
+
+INCLUDE_PATTERN = re.compile(r'^<!--\s*include:\s*(\S+?)\s*-->[ \t]*$', re.MULTILINE)
+MAX_INCLUDE_DEPTH = 5
+MD_LINK = re.compile(r'(?<!!)(\[[^\]]*\]\()([^)\s#]+)\.md((?:#[^)\s]*)?\))')
+TOC_LEVELS = (2, 3)
+
+
+def read_input(path, inputs):
+    """Text of an input file, recording [stamp, sha1] (stat first, so a racing edit forces a rebuild)"""
+    try:
+        st = os.stat(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        inputs[str(path)] = [None, None]
+        return None
+    inputs[str(path)] = [[st.st_mtime_ns, st.st_size], hashlib.sha1(data).hexdigest()]
+    return data
+
+
+def expand_includes(content, source, inputs, depth=0):
+    """Inline <!-- include: path.md --> lines (paths relative to the including file)"""
+    if 'include:' not in content or depth >= MAX_INCLUDE_DEPTH:
+        return content
+
+    def replace(match):
+        target = os.path.normpath(os.path.join(os.path.dirname(source), match.group(1)))
+        data = read_input(target, inputs)
+        if data is None:
+            return match.group(0)
+        text = data.decode('utf-8', errors='replace')
+        return expand_includes(text, target, inputs, depth + 1)
+
+    return INCLUDE_PATTERN.sub(replace, content)
+
+
+def version_images(content, source, inputs):
+    """Append ?v=<hash> to local images so a changed image is both a rebuild and a cache bust"""
+    if '![' not in content:
+        return content
+
+    def replace(match):
+        target = match.group(1)
+        if re.match(r'^[a-z][a-z0-9+.-]*:', target, re.IGNORECASE) or '?' in target:
+            return match.group(0)
+        path = resolve(target, source)
+        if path is None:
+            return match.group(0)
+        read_input(path, inputs)
+        digest = inputs[str(path)][1]
+        if digest is None:
+            return match.group(0)
+        start, end = match.span(1)
+        offset = match.start(0)
+        text = match.group(0)
+        return text[:start - offset] + f"{target}?v={digest[:10]}" + text[end - offset:]
+
+    return MARKDOWN_IMAGE.sub(replace, content)
+
+
+def html_links(content):
+    """Relative links to .md pages point at their generated .html siblings"""
+    def replace(match):
+        if re.match(r'^[a-z][a-z0-9+.-]*:', match.group(2), re.IGNORECASE):
+            return match.group(0)
+        return f"{match.group(1)}{match.group(2)}.html{match.group(3)}"
+
+    return MD_LINK.sub(replace, content) if '.md' in content else content
+
+
+def table_of_contents(content):
+    items = []
+    in_fence = False
+    for line in content.split('\n'):
+        if line.strip().startswith('```'):
+            in_fence = not in_fence
+            continue
+        heading = HEADING_PATTERN.match(line) if not in_fence and line.startswith('#') else None
+        if heading and len(heading.group(1)) in TOC_LEVELS:
+            text = heading.group(2).strip()
+            label = html.escape(re.sub(r'[*`]', '', text))
+            items.append(f'<li class="toc-h{len(heading.group(1))}">'
+                         f'<a href="#{heading_id(text)}">{label}</a></li>')
+    return '\n'.join(items)
+
+
+def script_json(text):
+    """JSON string literal that is safe inside a <script> element"""
+    return json.dumps(text, ensure_ascii=False).replace('<', '\\u003c')
+
+
+def render_page(path):
+    """Process-pool worker: (path, {'title', 'markdown', 'toc', 'inputs': {file: [stamp, sha1]}})"""
+    inputs = {}
+    content = read_input(path, inputs).decode('utf-8', errors='replace')
+    content = expand_includes(content, str(path), inputs)
+    content = version_images(content, path, inputs)
+    content = html_links(content)
+    return path, {
+        'title': extract_title(content, path),
+        'markdown': script_json(content),
+        'toc': table_of_contents(content),
+        'inputs': inputs,
+    }
+
+
+def output_of(page):
+    return Path(page).with_suffix('.html')
+
+
+def breadcrumb(page, source_root):
+    """Documentation / MODULE links back to the section index, as the JS converter did"""
+    parts = Path(page).relative_to(source_root).parts
+    up = '../' * (len(parts) - 1)
+    crumb = f'<a href="{up}index.html">Documentation</a>'
+    if len(parts) > 1:
+        crumb += f' / <a href="{up}index.html">{html.escape(parts[0].upper())}</a>'
+    return crumb
+
+
+def load_graph():
+    """{rel page: {'inputs': {rel file: [stamp, sha1]}}}, empty if missing or from another builder"""
+    try:
+        with open(GRAPH_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get('pages', {}) if data.get('version') == BUILD_VERSION else {}
+
+
+def write_text_atomic(path, text):
+    """Write via a temp file in the same folder and os.replace(); unchanged files are left alone"""
+    path = Path(path)
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+    return True
+
+
+class InputState:
+    """Current stamp / SHA-1 of input files, each stat'ed and hashed at most once per run"""
+
+    def __init__(self):
+        self._stamps = {}
+        self._digests = {}
+
+    def stamp(self, path):
+        if path not in self._stamps:
+            try:
+                st = os.stat(path)
+                self._stamps[path] = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                self._stamps[path] = None
+        return self._stamps[path]
+
+    def digest(self, path):
+        if path not in self._digests:
+            try:
+                with open(path, 'rb') as f:
+                    self._digests[path] = hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                self._digests[path] = None
+        return self._digests[path]
+
+
+def stale_reason(page, entry, state):
+    """Why page needs a rebuild, or None; refreshes stamps of touched-but-identical inputs"""
+    if entry is None:
+        return "new page"
+    if not output_of(page).exists():
+        return "output missing"
+    for key, (stamp, digest) in entry['inputs'].items():
+        path = str(REPO_ROOT / key)
+        current = state.stamp(path)
+        if current == stamp:
+            continue
+        if current is None or stamp is None or state.digest(path) != digest:
+            return f"{key} changed"
+        entry['inputs'][key] = [current, digest]
+    return None
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--source', type=Path, action='append',
+                        help="Folder of Markdown to build (repeatable; default: docs/documents)")
+    parser.add_argument('--force', action='store_true', help="Rebuild every page")
+    parser.add_argument('--dry-run', action='store_true', help="Only list pages that would be rebuilt")
+    parser.add_argument('--quiet', action='store_true', help="Only print the summary")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+    sources = [s.resolve() for s in (args.source or DEFAULT_SOURCES)]
+
+    started = time.perf_counter()
+    pages = {}
+    for source_root in sources:
+        for page in corpus.files(source_root):
+            if page.suffix == '.md':
+                pages.setdefault(page, source_root)
+
+    graph = {} if args.force else load_graph()
+    state = InputState()
+    stale = {}
+    for page in pages:
+        reason = "forced" if args.force else stale_reason(page, graph.get(rel(page)), state)
+        if reason:
+            stale[page] = reason
+
+    # Pages whose Markdown is gone: drop their generated HTML with them
+    removed = [key for key in graph
+               if any(s in (REPO_ROOT / key).parents for s in sources)
+               and not (REPO_ROOT / key).exists()]
+
+    if args.dry_run:
+        for page, reason in sorted(stale.items()):
+            print(f"🔨 {rel(page)}: {reason}")
+        for key in removed:
+            print(f"🗑️  {key}: source removed")
+        print(f"\n{len(stale)} of {len(pages)} page(s) would be rebuilt, {len(removed)} removed")
+        return 0
+
+    template_inputs = {}
+    template = Template(read_input(TEMPLATE_PATH, template_inputs).decode('utf-8'))
+    written = 0
+    for page, result in corpus.map(render_page, sorted(stale)):
+        text = template.substitute(
+            title=html.escape(result['title']),
+            breadcrumb=breadcrumb(page, pages[page]),
+            markdown=result['markdown'],
+            toc=result['toc'],
+        )
+        written += write_text_atomic(output_of(page), text)
+        inputs = {**result['inputs'], **template_inputs}
+        graph[rel(page)] = {'inputs': {rel(p): v for p, v in sorted(inputs.items())}}
+        if not args.quiet:
+            print(f"🔨 {rel(output_of(page))} ({stale[page]})")
+
+    for key in removed:
+        output = output_of(REPO_ROOT / key)
+        if output.exists():
+            output.unlink()
+        del graph[key]
+        if not args.quiet:
+            print(f"🗑️  {rel(output)}")
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp = GRAPH_PATH.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'version': BUILD_VERSION, 'pages': graph}, f)
+    os.replace(tmp, GRAPH_PATH)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Pages: {len(pages)}")
+    print(f"✅ Up to date: {len(pages) - len(stale)}")
+    print(f"🔨 Rebuilt: {len(stale)} ({written} written, {len(stale) - written} unchanged)")
+    print(f"🗑️  Removed: {len(removed)}")
+    print(f"Inputs tracked: {len({k for e in graph.values() for k in e['inputs']})}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*70}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+carmen-docs: single entry point for the documentation scripts
+
+Usage:
+    ./carmen-docs COMMAND [ARGS...] [+ COMMAND [ARGS...]]...
+    ./carmen-docs --list
+
+Commands separated by '+' run in one process over one shared corpus
+(a single walk of the documentation roots and at most one read per file).
+Each command's module is imported only when that command runs, so startup
+stays cheap.
+
+Global options (before the first command):
+    --time            print per-command timings
+    --roots A,B       limit the corpus to these roots (see docs_corpus.DEFAULT_ROOTS)
+    --workers N       size of the shared worker pool (default: CPU count)
+"""
+
+import sys
+import time
+
+# name -> (module, function, takes_args, summary)
+COMMANDS = {
+    'history': ('add_document_history', 'process_files', False,
+                "Add missing Document History sections under docs/app"),
+    'history-check': ('check_doc_history_position', 'main', True,
+                      "Report where Document History sits in docs/app documents"),
+    'sitemap': ('check_ts_sitemaps', 'main', True,
+                "Check TS documents for complete sitemaps"),
+    'br-lint': ('check_br_markdown_errors', 'main', True,
+                "Find '---' separators after tables in BR documents"),
+    'dd-verify': ('verify_dd_against_schema', 'main', True,
+                  "Verify DD table/field references against schema.prisma"),
+    'ds-to-dd': ('convert_ds_to_dd', 'main', False,
+                 "Rename DS-*.md to DD-*.md and update references"),
+    'mock-migrate': ('app/(main)/procurement/purchase-requests/components/add-required-fields.py',
+                     'main', True, "Add required fields to mockPRListData.ts [PATH]"),
+    'coverage': ('schema_coverage_report', 'main', True,
+                 "Regenerate the schema coverage report"),
+    'dd-types': ('verify_dd_field_types', 'main', True,
+                 "Compare DD field tables with Prisma types"),
+    'erd': ('generate_dd_erd', 'main', True,
+            "Generate Mermaid ERD blocks in DD documents"),
+    'tables': ('markdown_tables', 'main', True,
+               "Validate and realign Markdown tables"),
+    'duplicates': ('near_duplicates', 'main', True,
+                   "Find near-duplicate sections (MinHash/LSH)"),
+    'meta': ('doc_metadata', 'main', True,
+             "Query the document metadata index (Status, Version, ...)"),
+    'export': ('export_bundle', 'main', True,
+               "Export an NDJSON page bundle (full or delta) for WordPress/Wiki.js"),
+    'assets': ('check_assets', 'main', True,
+               "Check image references; report orphans, duplicates, oversized files"),
+    'rule-ids': ('rule_id_index', 'main', True,
+                 "Cross-check BR/FR/UC/VAL ID definitions and references"),
+    'matrix': ('completeness_matrix', 'main', True,
+               "Submodule x doc-type completeness matrix (md/json/csv)"),
+    'links': ('check_links', 'main', True,
+              "Check relative links and #anchors; --move renames and rewrites links"),
+    'html': ('build_html', 'main', True,
+             "Incrementally rebuild the HTML pages next to docs/documents Markdown"),
+    'prisma-indexes': ('prisma_index_advisor', 'main', True,
+                       "Report unindexed filter/sort/join columns in the DB services"),
+    'prisma-fetch': ('prisma_fetch_report', 'main', True,
+                     "Rank include trees by fan-out; find N+1 loops and over-fetching includes"),
+    'schema-lint': ('schema_lint', 'main', True,
+                    "Lint the schema.prisma copies: FK indexes, onDelete, key types, natural keys"),
+    'data-integrity': ('data_integrity', 'main', True,
+                       "Check ids and foreign keys across .data and lib/mock datasets"),
+    'val-rules': ('val_rules', 'main', True,
+                  "Compile VAL-*.md rules and evaluate them column-wise over the datasets"),
+    'staleness': ('doc_staleness', 'main', True,
+                  "Flag docs whose app/(main) code changed after the doc (git history index)"),
+    'history-sync': ('doc_history', 'main', True,
+                     "Fill Document History tables with rows from each doc's commits"),
+    'audit-shards': ('audit_shards', 'main', True,
+                     "Run the per-file audit as N hash-of-path shards and merge the partial results"),
+    'result-cache': ('result_cache', 'main', True,
+                     "Report on, trim (LRU) or clear the shared content-addressed result cache"),
+    'corpus-model': ('corpus_model', 'main', True,
+                     "Pack the corpus into the compact mmap-backed model and report its footprint"),
+}
+
+
+def load(module_name):
+    """Import a command module by name, or by repo-relative path for scripts outside the root"""
+    if not module_name.endswith('.py'):
+        import importlib
+        return importlib.import_module(module_name)
+
+    import importlib.util
+    from pathlib import Path
+    path = Path(__file__).resolve().parent / module_name
+    spec = importlib.util.spec_from_file_location(path.stem.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def split_commands(argv):
+    """['a', '-x', '+', 'b'] -> [['a', '-x'], ['b']]"""
+    groups = [[]]
+    for arg in argv:
+        if arg == '+':
+            groups.append([])
+        else:
+            groups[-1].append(arg)
+    return [g for g in groups if g]
+
+
+def usage():
+    print(__doc__.strip())
+    print("\nCommands:")
+    for name, (_, _, _, summary) in COMMANDS.items():
+        print(f"    {name:<14}{summary}")
+
+
+def run(name, args, corpus):
+    module_name, function, takes_args, _ = COMMANDS[name]
+    entry = getattr(load(module_name), function)
+
+    if module_name.endswith('.py'):
+        return entry(*args)
+    if takes_args:
+        return entry(args, corpus=corpus)
+    if args:
+        raise SystemExit(f"carmen-docs: '{name}' takes no arguments")
+    return entry(corpus=corpus)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    timed = False
+    roots = None
+    workers = None
+    while argv and argv[0] in ('--time', '--roots', '--workers'):
+        option = argv.pop(0)
+        if option == '--time':
+            timed = True
+        elif not argv:
+            print(f"carmen-docs: {option} needs a value", file=sys.stderr)
+            return 2
+        elif option == '--roots':
+            roots = argv.pop(0).split(',')
+        else:
+            value = argv.pop(0)
+            if not value.isdigit() or int(value) < 1:
+                print("carmen-docs: --workers needs a positive integer", file=sys.stderr)
+                return 2
+            workers = int(value)
+
+    if not argv or argv[0] in ('-h', '--help', '--list'):
+        usage()
+        return 0
+
+    groups = split_commands(argv)
+    unknown = [g[0] for g in groups if g[0] not in COMMANDS]
+    if unknown:
+        print(f"carmen-docs: unknown command(s): {', '.join(unknown)}", file=sys.stderr)
+        usage()
+        return 2
+
+    from docs_corpus import Corpus, load_roots
+    try:
+        corpus = Corpus(load_roots(roots), workers=workers)
+    except ValueError as e:
+        print(f"carmen-docs: {e}", file=sys.stderr)
+        return 2
+
+    status = 0
+    for name, *args in groups:
+        started = time.perf_counter()
+        result = run(name, args, corpus)
+        if isinstance(result, int) and result:
+            status = result
+        if timed:
+            print(f"⏱️  {name}: {(time.perf_counter() - started) * 1000:.0f} ms", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Validate image and asset references across the documentation
+- Index every image under the documentation roots once, hashing files on a thread pool
+- Resolve every Markdown ![](...) / HTML <img src> / reference-definition image against the index
+- Report broken references, orphaned files, duplicate images (same content hash) and oversized files
+- Cache hashes and per-document references by mtime/size, so reruns only touch edited files
+- Broken references stream document by document, then the corpus-wide orphan, duplicate and
+  size findings (--ndjson for one JSON object per line)
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+from docs_corpus import REPO_ROOT, Corpus, FileCache, Root, rel
+from findings import finding, report
+
+IMAGE_EXTENSIONS = ('png', 'jpg', 'jpeg', 'gif', 'svg', 'webp')
+DEFAULT_MAX_SIZE_KB = 500
+
+# Absolute references (/foo.png) are served from the app's public/ folder
+ABSOLUTE_BASES = (REPO_ROOT / 'public', REPO_ROOT)
+
+# Bump when extract_references() changes so cached entries are discarded
+EXTRACTOR_VERSION = 1
+
+MARKDOWN_IMAGE = re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+HTML_IMAGE = re.compile(r'<img\b[^>]*?\bsrc\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+REFERENCE_DEFINITION = re.compile(r'^\s{0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s+"[^"]*")?\s*$')
+PLACEHOLDER = re.compile(r'[\[\]{}]|\.\.\.')
+IMAGE_SUFFIX = re.compile(r'\.(' + '|'.join(IMAGE_EXTENSIONS) + r')$', re.IGNORECASE)
+
+
+def asset_roots(roots):
+    """Image roots mirroring the documentation roots (same folders and excludes)"""
+    out = []
+    for root in roots:
+        recursive = any('/' in p for p in root.include)
+        prefix = '**/' if recursive else ''
+        include = [f"{prefix}*.{ext}" for ext in IMAGE_EXTENSIONS]
+        include += [p.upper() for p in include]
+        out.append(Root(root.name, root.path, include, root.exclude))
+    return out
+
+
+def extract_references(path, content):
+    """Process-pool worker: (path, [(line, target)]) for every local image reference in a document"""
+    refs = []
+    in_fence = False
+    for line_no, line in enumerate(content.split('\n'), 1):
+        if line.lstrip().startswith('```'):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        targets = []
+        if '![' in line:
+            targets += MARKDOWN_IMAGE.findall(line)
+        if '<img' in line or '<IMG' in line:
+            targets += HTML_IMAGE.findall(line)
+        if line.lstrip().startswith('['):
+            match = REFERENCE_DEFINITION.match(line)
+            if match and IMAGE_SUFFIX.search(match.group(1).split('?')[0]):
+                targets.append(match.group(1))
+        for target in targets:
+            if re.match(r'^[a-z][a-z0-9+.-]*:', target, re.IGNORECASE) or target.startswith('#'):
+                continue
+            refs.append((line_no, target))
+    return path, refs
+
+
+def resolve(target, source):
+    """Candidate file for a reference, or None for placeholders like screenshots/[module].png"""
+    target = unquote(target.split('#')[0].split('?')[0])
+    if PLACEHOLDER.search(target):
+        return None
+    if target.startswith('/'):
+        for base in ABSOLUTE_BASES:
+            candidate = base / target.lstrip('/')
+            if candidate.exists():
+                return candidate.resolve()
+        return ABSOLUTE_BASES[0] / target.lstrip('/')
+    return (Path(source).parent / target).resolve()
+
+
+def sha1_file(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_assets(assets, cache, workers):
+    """{path: sha1}; cache misses are hashed concurrently (hashlib releases the GIL)"""
+    hashes = {}
+    missing = []
+    for path in assets:
+        found, digest = cache.lookup(path)
+        if found:
+            hashes[path] = digest
+        else:
+            missing.append(path)
+    with ThreadPoolExecutor(max_workers=max(workers, 4)) as pool:
+        for path, digest in zip(missing, pool.map(sha1_file, missing)):
+            hashes[path] = digest
+            cache.store(path, digest)
+    return hashes
+
+
+def collect_references(docs, cache, corpus):
+    """{doc: [(line, target)]}, extracting only documents that changed"""
+    refs = {}
+    missing = []
+    for doc in docs:
+        found, data = cache.lookup(doc)
+        if found:
+            refs[doc] = [tuple(r) for r in data]
+        else:
+            missing.append(doc)
+    for doc, data in corpus.map_text(extract_references, missing):
+        refs[doc] = data
+        cache.store(doc, data)
+    return refs
+
+
+def iter_results(docs, references, assets, hashes, max_kb):
+    """Yield (kind, item) in the --json shapes: each document's broken and placeholder
+    references as it is checked, then orphans, duplicate groups and oversized files"""
+    indexed = set(assets)
+    referenced = set()
+    for doc in docs:
+        for line_no, target in references.get(doc, ()):
+            resolved = resolve(target, doc)
+            if resolved is None:
+                yield 'placeholders', {'file': rel(doc), 'line': line_no, 'target': target}
+            elif resolved in indexed or resolved.is_file():
+                referenced.add(resolved)
+            else:
+                yield 'broken', {'file': rel(doc), 'line': line_no, 'target': target}
+
+    for orphan in sorted(rel(a) for a in assets if a not in referenced):
+        yield 'orphans', orphan
+    by_hash = defaultdict(list)
+    for path, digest in hashes.items():
+        by_hash[digest].append(rel(path))
+    for group in sorted(sorted(paths) for paths in by_hash.values() if len(paths) > 1):
+        yield 'duplicates', group
+    oversized = [{'file': rel(a), 'kb': a.stat().st_size // 1024} for a in assets
+                 if a.stat().st_size > max_kb * 1024]
+    for item in sorted(oversized, key=lambda o: -o['kb']):
+        yield 'oversized', item
+
+
+def iter_findings(results, max_kb, stats):
+    """Findings for iter_results(); placeholders are only counted in stats"""
+    for kind, item in results:
+        stats[kind] += 1
+        if kind == 'broken':
+            yield finding(item['file'], 'broken-image', 'error',
+                          f"broken image reference {item['target']}", item['line'])
+        elif kind == 'orphans':
+            yield finding(item, 'orphaned-asset', 'warning', "Orphaned asset")
+        elif kind == 'duplicates':
+            stats['redundant'] += len(item) - 1
+            yield finding(item[0], 'duplicate-image', 'warning',
+                          f"Duplicate images: {', '.join(item)}")
+        elif kind == 'oversized':
+            yield finding(item['file'], 'oversized-image', 'warning',
+                          f"{item['kb']} KB (> {max_kb} KB)")
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_SIZE_KB, metavar='KB',
+                        help="Flag images larger than this (default: %(default)s KB)")
+    parser.add_argument('--json', action='store_true', help="Print findings as JSON")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    parser.add_argument('--quiet', action='store_true', help="Only print the summary")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    doc_roots = [m.root for m in corpus.roots]
+    assets = Corpus(asset_roots(doc_roots), workers=corpus.workers).files()
+    docs = [f for f in corpus.files() if f.suffix == '.md']
+
+    hash_cache = FileCache('asset-hashes')
+    ref_cache = FileCache('asset-references', salt=str(EXTRACTOR_VERSION))
+    hashes = hash_assets(assets, hash_cache, corpus.workers)
+    references = collect_references(docs, ref_cache, corpus)
+    for cache, keep in ((hash_cache, assets), (ref_cache, docs)):
+        cache.prune(keep)
+        cache.save()
+    results = iter_results(docs, references, assets, hashes, args.max_size)
+
+    if args.json:
+        grouped = {'broken': [], 'orphans': [], 'duplicates': [], 'oversized': [], 'placeholders': []}
+        for kind, item in results:
+            grouped[kind].append(item)
+        print(json.dumps(grouped, indent=2))
+        return 1 if grouped['broken'] else 0
+
+    stats = defaultdict(int)
+    findings = iter_findings(results, args.max_size, stats)
+    if args.ndjson:
+        report(findings, ndjson=True)
+        return 1 if stats['broken'] else 0
+    report(findings, show=lambda f: not args.quiet)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Assets indexed: {len(assets)} ({hash_cache.misses} hashed, {hash_cache.hits} cached)")
+    print(f"Documents scanned: {len(docs)} ({ref_cache.misses} extracted, {ref_cache.hits} cached)")
+    print(f"Image references: {sum(len(r) for r in references.values())}")
+    print(f"❌ Broken references: {stats['broken']}")
+    print(f"⚠️  Orphaned assets: {stats['orphans']}")
+    print(f"🔁 Duplicate groups: {stats['duplicates']} ({stats['redundant']} redundant files)")
+    print(f"📏 Oversized (> {args.max_size} KB): {stats['oversized']}")
+    print(f"Placeholder references skipped: {stats['placeholders']}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*70}")
+    return 1 if stats['broken'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
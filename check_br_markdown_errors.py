@@ -2,83 +2,77 @@
 """
 Check all BR-*.md files for markdown format errors
 Specifically looking for '---' after Document History table
+- Findings stream as they are found (--ndjson for one JSON object per line)
 """
 
+import argparse
 import re
-from pathlib import Path
+import sys
 
-# Find all BR-*.md files
-br_files = list(Path('/Users/peak/Documents/GitHub/carmen/docs').rglob('BR-*.md'))
+from docs_corpus import Corpus, rel
+from findings import finding, report
+from markdown_tables import parse_tables
 
-def check_document_history_format(file_path):
+def separator_after_table(lines):
+    """1-based line of the first '---' right after a table (blank lines allowed), or None"""
+    for table in parse_tables(lines):
+        # Check next non-empty line after the last table row
+        next_line_idx = table.end
+        while next_line_idx < len(lines) and not lines[next_line_idx].strip():
+            next_line_idx += 1
+
+        if next_line_idx < len(lines) and lines[next_line_idx].strip() == '---':
+            return next_line_idx + 1
+    return None
+
+def check_document_history_format(file_path, corpus=None):
     """Check if file has '---' after Document History table"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
+        content = (corpus or Corpus()).read(file_path)
+        error_line = separator_after_table(content.split('\n'))
+        return error_line is not None, error_line
 
-        # Look for pattern: table row followed by '---'
-        has_error = False
-        error_line = None
+    except Exception as e:
+        return None, str(e)
 
-        for i, line in enumerate(lines, 1):
-            # Check if line is end of a table (contains pipes)
-            if '|' in line and i < len(lines):
-                # Check next non-empty line
-                next_line_idx = i
-                while next_line_idx < len(lines) and not lines[next_line_idx].strip():
-                    next_line_idx += 1
+def br_findings(file_path, content):
+    """Process-pool worker: findings for one BR file"""
+    line = separator_after_table(content.split('\n'))
+    if line is None:
+        return []
+    return [finding(rel(file_path), 'hr-after-table', 'error', "Found '---' after table", line)]
 
-                if next_line_idx < len(lines):
-                    next_line = lines[next_line_idx].strip()
-                    # If next line is '---' and not part of table separator
-                    if next_line == '---' and not lines[i-1].strip().startswith('|---'):
-                        has_error = True
-                        error_line = next_line_idx + 1
-                        break
+def iter_findings(br_files, corpus):
+    """Yield findings file by file, in order, as the workers finish"""
+    for found in corpus.map_text(br_findings, br_files):
+        yield from found
 
-        return has_error, error_line
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
 
-    except Exception as e:
-        return None, str(e)
+    # Find all BR-*.md files
+    br_files = sorted(corpus.find(('BR',)))
+
+    if args.ndjson:
+        report(iter_findings(br_files, corpus), ndjson=True)
+        return 0
 
-def main():
     print(f"Checking {len(br_files)} BR-*.md files for markdown format errors...")
     print("="*80)
 
-    files_with_errors = []
-    files_checked = 0
-    files_with_issues = 0
-
-    for br_file in sorted(br_files):
-        has_error, error_info = check_document_history_format(br_file)
-
-        if has_error is None:
-            print(f"⚠️  Error reading: {br_file.relative_to(Path('/Users/peak/Documents/GitHub/carmen/docs'))}")
-            print(f"   {error_info}")
-        elif has_error:
-            files_with_issues += 1
-            rel_path = br_file.relative_to(Path('/Users/peak/Documents/GitHub/carmen/docs'))
-            print(f"\n❌ {rel_path}")
-            print(f"   Line {error_info}: Found '---' after table")
-            files_with_errors.append(str(br_file))
-
-        files_checked += 1
+    summary = report(iter_findings(br_files, corpus))
 
     # Summary
     print(f"\n{'='*80}")
     print("SUMMARY")
     print(f"{'='*80}")
-    print(f"Files checked: {files_checked}")
-    print(f"Files with errors: {files_with_issues}")
-    print(f"Files OK: {files_checked - files_with_issues}")
-
-    if files_with_errors:
-        print(f"\n{'='*80}")
-        print("FILES NEEDING FIX:")
-        print(f"{'='*80}")
-        for file_path in files_with_errors:
-            print(f"  • {Path(file_path).relative_to(Path('/Users/peak/Documents/GitHub/carmen/docs'))}")
+    print(f"Files checked: {len(br_files)}")
+    print(f"Files with errors: {summary.by_rule['hr-after-table']}")
+    print(f"Files OK: {len(br_files) - summary.files}")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
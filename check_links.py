@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Check relative links and #anchors across the documentation, and rewrite them on renames
+- Extract every link and GitHub-style heading slug per document on the process pool
+- Build one index (corpus paths + {document: slugs}) and resolve each link with O(1) lookups
+- Targets outside the corpus (source files, folders) are checked on disk once and memoized
+- --move OLD NEW renames files and rewrites every relative link that pointed at, or from, them
+- Per-file extraction is cached by mtime/size so reruns only re-read edited documents
+- Broken links stream as findings (--ndjson for one JSON object per line)
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from urllib.parse import quote, unquote
+
+from check_assets import IMAGE_SUFFIX, PLACEHOLDER
+from docs_corpus import REPO_ROOT, Corpus, FileCache, rel
+from findings import finding, report
+
+# Bump when extract_links() changes so cached entries are discarded
+EXTRACTOR_VERSION = 1
+
+INLINE_LINK = re.compile(
+    r'(?<!!)\[[^\]]*\]\(\s*(?:<([^>\n]+)>|((?:[^()\s<>]|\([^()\s]*\))+))(?:\s+"[^"]*")?\s*\)')
+REFERENCE_DEFINITION = re.compile(r'^\s{0,3}\[[^\]^][^\]]*\]:\s*<?([^\s>]+)>?(?:\s+"[^"]*")?\s*$')
+HTML_HREF = re.compile(r'<a\b[^>]*?\bhref\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+HTML_ANCHOR = re.compile(r'<a\b[^>]*?\b(?:id|name)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+ATX_HEADING = re.compile(r'^\s{0,3}#{1,6}\s+(.*?)(?:\s+#+)?\s*$')
+SETEXT_UNDERLINE = re.compile(r'^\s{0,3}(=+|-+)\s*$')
+CODE_SPAN = re.compile(r'`+[^`]*`+')
+SCHEME = re.compile(r'^[a-z][a-z0-9+.-]*:', re.IGNORECASE)
+
+# Markup dropped from heading text before slugging (GitHub slugs the rendered text)
+HEADING_MARKUP = [
+    (re.compile(r'!?\[([^\]]*)\]\([^)]*\)'), r'\1'),
+    (re.compile(r'<[^>]+>'), ''),
+    (re.compile(r'`'), ''),
+]
+
+
+def github_slug(text):
+    """GitHub heading anchor: lowercase, punctuation dropped, each space -> '-'"""
+    for pattern, replacement in HEADING_MARKUP:
+        text = pattern.sub(replacement, text)
+    return re.sub(r'[^\w\- ]', '', text.strip().lower()).replace(' ', '-')
+
+
+def unique_slugs(headings):
+    """Slugs in document order with GitHub's -1, -2 suffixes for repeated headings"""
+    seen = defaultdict(int)
+    slugs = []
+    for heading in headings:
+        slug = github_slug(heading)
+        count = seen[slug]
+        seen[slug] += 1
+        slugs.append(f"{slug}-{count}" if count else slug)
+    return slugs
+
+
+def mask_code_spans(line):
+    """Line with `code` spans blanked out, same length so match offsets stay valid"""
+    if '`' not in line:
+        return line
+    return CODE_SPAN.sub(lambda m: ' ' * len(m.group(0)), line)
+
+
+def iter_lines(content):
+    """(line_no, line, masked) for lines outside fenced code blocks"""
+    in_fence = False
+    for line_no, line in enumerate(content.split('\n'), 1):
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            yield line_no, line, mask_code_spans(line)
+
+
+def line_links(masked):
+    """match spans (start, end) of link targets in a masked line"""
+    spans = []
+    if '](' in masked:
+        spans += [m.span(m.lastindex) for m in INLINE_LINK.finditer(masked)]
+    if masked.lstrip().startswith('['):
+        match = REFERENCE_DEFINITION.match(masked)
+        if match and not IMAGE_SUFFIX.search(match.group(1).split('?')[0]):
+            spans.append(match.span(1))
+    if '<a' in masked or '<A' in masked:
+        spans += [m.span(1) for m in HTML_HREF.finditer(masked)]
+    return spans
+
+
+def is_local(target):
+    return not (SCHEME.match(target) or target.startswith('//') or PLACEHOLDER.search(target))
+
+
+def extract_links(path):
+    """Process-pool worker: (path, {'slugs': [...], 'links': [[line, target]]})"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    headings, anchors, links = [], [], []
+    previous = ''
+    for line_no, line, masked in iter_lines(content):
+        heading = ATX_HEADING.match(line)
+        if heading and line.lstrip().startswith('#'):
+            headings.append(heading.group(1))
+        elif SETEXT_UNDERLINE.match(line) and previous.strip() and \
+                not previous.lstrip().startswith(('#', '|', '-', '*', '>', '<')):
+            headings.append(previous)
+        if '<a' in masked or '<A' in masked:
+            anchors += HTML_ANCHOR.findall(masked)
+        for start, end in line_links(masked):
+            target = line[start:end]
+            if is_local(target):
+                links.append([line_no, target])
+        previous = line
+    return path, {'slugs': unique_slugs(headings) + anchors, 'links': links}
+
+
+def split_target(target):
+    """('path', '#fragment') with any ?query kept on the path"""
+    path, hash_, fragment = target.partition('#')
+    return path, hash_ + fragment
+
+
+def target_path(path_part, source):
+    """Normalized absolute path a link's path part points at (no filesystem access)"""
+    path_part = unquote(path_part.split('?')[0])
+    if path_part.startswith('/'):
+        return os.path.normpath(os.path.join(str(REPO_ROOT), path_part.lstrip('/')))
+    return os.path.normpath(os.path.join(os.path.dirname(str(source)), path_part))
+
+
+class LinkIndex:
+    """Every corpus path and the anchor slugs of every document, for O(1) resolution"""
+
+    def __init__(self, extracted):
+        self.paths = {str(p) for p in extracted}
+        self.slugs = {str(p): {s.lower() for s in data['slugs']} for p, data in extracted.items()}
+        self._exists = {}
+
+    def exists(self, path):
+        if path in self.paths:
+            return True
+        if path not in self._exists:
+            self._exists[path] = os.path.exists(path)
+        return self._exists[path]
+
+    def check(self, target, source):
+        """None if the link resolves, else 'file' or 'anchor'"""
+        path_part, fragment = split_target(target)
+        path = target_path(path_part, source) if path_part else str(source)
+        if not self.exists(path):
+            return 'file'
+        anchor = unquote(fragment[1:]).lower()
+        if anchor and path in self.slugs and anchor not in self.slugs[path]:
+            return 'anchor'
+        return None
+
+
+def collect(files, cache, corpus):
+    """{path: extraction}; only files whose mtime/size changed are re-extracted"""
+    results = {}
+    missing = []
+    for path in files:
+        found, data = cache.lookup(path)
+        if found:
+            results[path] = data
+        else:
+            missing.append(path)
+    for path, data in corpus.map(extract_links, missing):
+        results[path] = data
+        cache.store(path, data)
+    return results
+
+
+def find_broken(extracted, index):
+    """Yield a finding for every unresolved link, file by file"""
+    for path in sorted(extracted):
+        for line_no, target in extracted[path]['links']:
+            kind = index.check(target, path)
+            if kind == 'file':
+                yield finding(rel(path), 'broken-link', 'error', f"broken link {target}", line_no)
+            elif kind == 'anchor':
+                yield finding(rel(path), 'missing-anchor', 'error', f"missing anchor {target}", line_no)
+
+
+def relink(target, source, new_source, moves, index):
+    """Rewritten link target after moves, or None when it doesn't change"""
+    path_part, fragment = split_target(target)
+    if not path_part:
+        return None
+    path_part, question, query = path_part.partition('?')
+    old_path = target_path(path_part, source)
+    new_path = moves.get(old_path, old_path)
+    if (old_path == new_path and source == new_source) or not index.exists(old_path):
+        return None
+    if path_part.startswith('/'):
+        if old_path == new_path:
+            return None
+        new_part = '/' + os.path.relpath(new_path, str(REPO_ROOT))
+    else:
+        new_part = os.path.relpath(new_path, os.path.dirname(new_source))
+        if path_part.startswith('./') and not new_part.startswith('../'):
+            new_part = './' + new_part
+    new_part = new_part.replace(os.sep, '/')
+    if path_part.endswith('/') and not new_part.endswith('/'):
+        new_part += '/'
+    if '%' in path_part:
+        new_part = quote(new_part)
+    new_target = new_part + question + query + fragment
+    return new_target if new_target != target else None
+
+
+def rewrite_links(content, source, new_source, moves, index):
+    """(content, number of links rewritten) with links re-pointed for moved files"""
+    lines = content.split('\n')
+    changed = 0
+    for line_no, line, masked in iter_lines(content):
+        edits = []
+        for start, end in line_links(masked):
+            target = line[start:end]
+            if is_local(target):
+                new_target = relink(target, source, new_source, moves, index)
+                if new_target:
+                    edits.append((start, end, new_target))
+        for start, end, new_target in sorted(edits, reverse=True):
+            line = line[:start] + new_target + line[end:]
+        if edits:
+            lines[line_no - 1] = line
+            changed += len(edits)
+    return '\n'.join(lines), changed
+
+
+def move_files(moves, corpus, dry_run=False):
+    """Rename files and rewrite links to and from them across the corpus.
+
+    moves maps old -> new paths; returns {document: links rewritten}.
+    """
+    moves = {os.path.normpath(os.path.abspath(old)): os.path.normpath(os.path.abspath(new))
+             for old, new in moves.items()}
+    for old, new in moves.items():
+        if not os.path.isfile(old):
+            raise FileNotFoundError(f"Not a file: {old}")
+        if os.path.exists(new):
+            raise FileExistsError(f"Target exists: {new}")
+
+    docs = [f for f in corpus.files() if f.suffix == '.md']
+    index = LinkIndex({d: {'slugs': ()} for d in docs})
+    updated = {}
+    for doc in docs:
+        source = str(doc)
+        content = corpus.read(doc)
+        if '](' not in content and ']:' not in content and 'href' not in content:
+            continue
+        new_content, changed = rewrite_links(content, source, moves.get(source, source), moves, index)
+        if changed:
+            updated[doc] = changed
+            if not dry_run:
+                corpus.write(doc, new_content)
+
+    if not dry_run:
+        for old, new in moves.items():
+            os.makedirs(os.path.dirname(new), exist_ok=True)
+            corpus.move(old, new)
+    return updated
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--move', nargs=2, action='append', metavar=('OLD', 'NEW'),
+                        help="Rename a file and rewrite links to it (repeatable)")
+    parser.add_argument('--dry-run', action='store_true', help="With --move, only report rewrites")
+    parser.add_argument('--ndjson', action='store_true', help="Stream broken links as NDJSON")
+    parser.add_argument('--quiet', action='store_true', help="Only print the summary")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    if args.move:
+        updated = move_files(dict(args.move), corpus, dry_run=args.dry_run)
+        verb = "Would rewrite" if args.dry_run else "Rewrote"
+        for doc, count in sorted(updated.items()):
+            print(f"✏️  {verb} {count} link(s) in {rel(doc)}")
+        for old, new in args.move:
+            print(f"{'🔍' if args.dry_run else '✅'} {old} → {new}")
+        print(f"\n{verb} {sum(updated.values())} link(s) in {len(updated)} file(s)")
+        return 0
+
+    started = time.perf_counter()
+    files = [f for f in corpus.files() if f.suffix == '.md']
+    cache = FileCache('links', salt=str(EXTRACTOR_VERSION))
+    extracted = collect(files, cache, corpus)
+    cache.prune(files)
+    cache.save()
+
+    index = LinkIndex(extracted)
+    summary = report(find_broken(extracted, index), ndjson=args.ndjson,
+                     show=lambda f: not args.quiet)
+    elapsed = time.perf_counter() - started
+    if args.ndjson:
+        return 1 if summary.total else 0
+
+    total = sum(len(d['links']) for d in extracted.values())
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Documents indexed: {len(files)} ({cache.misses} extracted, {cache.hits} cached)")
+    print(f"Anchors indexed: {sum(len(s) for s in index.slugs.values())}")
+    print(f"Local links checked: {total}")
+    print(f"❌ Broken file links: {summary.by_rule['broken-link']}")
+    print(f"❌ Missing anchors: {summary.by_rule['missing-anchor']}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*70}")
+    return 1 if summary.total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
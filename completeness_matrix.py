@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Build the module documentation completeness matrix from the docs tree
+- One walk of docs/app (the corpus os.scandir walk) groups BR/DD/FD/TS/UC/VAL/PC docs by submodule
+- Per-document health flags: Document History present and at the top, TS sitemap complete,
+  DD tb_* table and field references present in schema.prisma
+- Render the submodule x doc-type matrix as Markdown, JSON or CSV
+- Per-file flags are cached by mtime/size so a refresh only re-reads edited docs
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+
+from check_doc_history_position import history_position
+from check_ts_sitemaps import sitemap_status
+from docs_corpus import DOCS_APP_DIR, SCHEMA_PATH, Corpus, FileCache, rel
+from verify_dd_against_schema import find_table_references, parse_prisma_schema
+
+CORE_TYPES = ('BR', 'DD', 'FD', 'TS', 'UC', 'VAL')
+DOC_TYPES = CORE_TYPES + ('PC',)
+
+# Folders that hold documents of their parent submodule
+NESTED_DIRS = ('pages',)
+
+# Bump when document_health() changes so cached entries are discarded
+EXTRACTOR_VERSION = 1
+
+
+def doc_type(path):
+    """BR/DD/... for e.g. DD-credit-note.md; None for other files and reports like DD-CREATION-STATUS.md"""
+    prefix, _, rest = Path(path).name.partition('-')
+    return prefix if prefix in DOC_TYPES and rest[:1].islower() else None
+
+
+def submodule_of(path):
+    """docs/app-relative folder a document belongs to (pages/ folders roll up)"""
+    parts = Path(path).resolve().relative_to(DOCS_APP_DIR).parts[:-1]
+    while parts and parts[-1] in NESTED_DIRS:
+        parts = parts[:-1]
+    return '/'.join(parts)
+
+
+def document_health(path):
+    """Process-pool worker: (path, schema-independent health facts for one document)"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    kind = doc_type(path)
+    position, line, total = history_position(content)
+    facts = {'history': position, 'history_line': line, 'lines': total}
+    if kind == 'TS':
+        status = sitemap_status(content)
+        facts['sitemap'] = ('complete' if status['sitemap_complete']
+                            else 'incomplete' if status['has_sitemap'] else 'missing')
+    if kind == 'DD':
+        tables, fields = find_table_references(content)
+        facts['tables'] = {t: sorted(fields.get(t, ())) for t in sorted(tables)}
+    return path, facts
+
+
+def issues_for(facts, schema_models):
+    """Human-readable problems for one document"""
+    issues = []
+    if facts['history'] == 'missing':
+        issues.append("no Document History")
+    elif facts['history'] in ('middle', 'end'):
+        issues.append(f"Document History at line {facts['history_line']} of {facts['lines']}")
+    elif facts['history'] == 'empty':
+        issues.append("empty file")
+    if facts.get('sitemap') in ('missing', 'incomplete'):
+        issues.append(f"sitemap {facts['sitemap']}")
+    for table, fields in facts.get('tables', {}).items():
+        if table not in schema_models:
+            issues.append(f"unknown table {table}")
+        else:
+            unknown = [f for f in fields if f not in schema_models[table]]
+            if unknown:
+                issues.append(f"unknown fields {table}.{{{', '.join(unknown)}}}")
+    return issues
+
+
+def build_matrix(docs, health, schema_models):
+    """{submodule: {type: [{'file', 'issues'}]}}"""
+    matrix = defaultdict(lambda: defaultdict(list))
+    for doc in docs:
+        kind = doc_type(doc)
+        if kind is None:
+            continue
+        matrix[submodule_of(doc)][kind].append({
+            'file': rel(doc),
+            'issues': issues_for(health[doc], schema_models),
+        })
+    return {k: dict(v) for k, v in sorted(matrix.items())}
+
+
+def cell(entries):
+    if not entries:
+        return '❌'
+    return '⚠️' if any(e['issues'] for e in entries) else '✅'
+
+
+def render_markdown(matrix):
+    complete = sum(1 for types in matrix.values() if all(t in types for t in CORE_TYPES))
+    with_issues = [e for types in matrix.values() for entries in types.values()
+                   for e in entries if e['issues']]
+    out = [
+        "# Documentation Completeness Matrix",
+        "",
+        f"**Generated**: {date.today().isoformat()}",
+        f"**Source**: `{rel(DOCS_APP_DIR)}`",
+        "",
+        "> Generated by `completeness_matrix.py` - do not edit by hand.",
+        "",
+        "✅ present and healthy · ⚠️ present with issues · ❌ missing · PC shows the page count",
+        "",
+        "## Summary",
+        "",
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Submodules | {len(matrix)} |",
+        f"| Complete core sets ({'/'.join(CORE_TYPES)}) | {complete} |",
+        f"| Documents with issues | {len(with_issues)} |",
+        "",
+        "## Matrix",
+        "",
+        "| Module | Submodule | " + ' | '.join(DOC_TYPES) + " | Core |",
+        "|" + "|".join(['--------'] * (len(DOC_TYPES) + 3)) + "|",
+    ]
+    for submodule, types in matrix.items():
+        module, _, rest = submodule.partition('/')
+        cells = [cell(types.get(t)) for t in CORE_TYPES]
+        pages = types.get('PC', [])
+        cells.append(f"{len(pages)}{' ⚠️' if any(e['issues'] for e in pages) else ''}" if pages else '—')
+        present = sum(1 for t in CORE_TYPES if t in types)
+        out.append(f"| {module or '(root)'} | {rest or '—'} | " + ' | '.join(cells)
+                   + f" | {present}/{len(CORE_TYPES)} |")
+
+    out += ["", "## Issues", ""]
+    if with_issues:
+        for e in sorted(with_issues, key=lambda e: e['file']):
+            out.append(f"- `{e['file']}`: {'; '.join(e['issues'])}")
+    else:
+        out.append("No document health issues.")
+    return '\n'.join(out) + '\n'
+
+
+def render_csv(matrix):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(['module', 'submodule', *DOC_TYPES, 'core_present', 'issues'])
+    for submodule, types in matrix.items():
+        module, _, rest = submodule.partition('/')
+        row = [module, rest]
+        for t in DOC_TYPES:
+            entries = types.get(t, [])
+            if t == 'PC':
+                row.append(len(entries))
+            else:
+                row.append('missing' if not entries else
+                           'issues' if any(e['issues'] for e in entries) else 'ok')
+        row.append(sum(1 for t in CORE_TYPES if t in types))
+        row.append(sum(len(e['issues']) for entries in types.values() for e in entries))
+        writer.writerow(row)
+    return buffer.getvalue()
+
+
+def render_json(matrix):
+    return json.dumps({
+        'generated': date.today().isoformat(),
+        'doc_types': list(DOC_TYPES),
+        'submodules': matrix,
+    }, indent=2) + '\n'
+
+
+RENDERERS = {'md': render_markdown, 'json': render_json, 'csv': render_csv}
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--format', choices=sorted(RENDERERS), default='md')
+    parser.add_argument('--output', type=Path, help="Write to a file instead of stdout")
+    parser.add_argument('--schema', type=Path, default=SCHEMA_PATH)
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    docs = [f for f in corpus.files(DOCS_APP_DIR) if f.suffix == '.md']
+    cache = FileCache('completeness', salt=str(EXTRACTOR_VERSION))
+    health, missing = {}, []
+    for doc in docs:
+        found, facts = cache.lookup(doc)
+        if found:
+            health[doc] = facts
+        else:
+            missing.append(doc)
+    for doc, facts in corpus.map(document_health, missing):
+        health[doc] = facts
+        cache.store(doc, facts)
+    cache.prune(docs)
+    cache.save()
+
+    matrix = build_matrix(docs, health, parse_prisma_schema(args.schema))
+    rendered = RENDERERS[args.format](matrix)
+    elapsed = time.perf_counter() - started
+
+    if args.output is None:
+        sys.stdout.write(rendered)
+        return 0
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(rendered)
+    print(f"📊 Submodules: {len(matrix)}")
+    print(f"📄 Documents: {len(docs)} ({cache.misses} read, {cache.hits} cached)")
+    print(f"📝 Written to {rel(args.output)}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,32 +2,34 @@
 """
 Convert DS (Data Schema) files to DD (Data Definition) files
 - Rename DS-*.md files to DD-*.md
-- Update references throughout the codebase
+- Re-point relative links to the renamed files (check_links.move_files)
 - Update document type in file content
 """
 
 import os
 import re
 from pathlib import Path
-import shutil
+
+from check_links import move_files
+from docs_corpus import DOCS_DIR, Corpus, rel
 
 # DS files to convert
 ds_files = [
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/settings/DS-settings.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/permission-management/DS-permission-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/system-integrations/DS-system-integrations.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/business-rules/DS-business-rules.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/workflow/DS-workflow.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/location-management/DS-location-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/user-management/DS-user-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/monitoring/DS-monitoring.md",
+    str(DOCS_DIR / "app/system-administration/settings/DS-settings.md"),
+    str(DOCS_DIR / "app/system-administration/permission-management/DS-permission-management.md"),
+    str(DOCS_DIR / "app/system-administration/system-integrations/DS-system-integrations.md"),
+    str(DOCS_DIR / "app/system-administration/business-rules/DS-business-rules.md"),
+    str(DOCS_DIR / "app/system-administration/workflow/DS-workflow.md"),
+    str(DOCS_DIR / "app/system-administration/location-management/DS-location-management.md"),
+    str(DOCS_DIR / "app/system-administration/user-management/DS-user-management.md"),
+    str(DOCS_DIR / "app/system-administration/monitoring/DS-monitoring.md"),
 ]
 
-def update_file_content(file_path):
-    """Update DS references to DD within file content"""
+def update_file_content(file_path, corpus=None):
+    """Update the document type wording; links to the renamed files are left to move_files()"""
+    corpus = corpus or Corpus()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = corpus.read(file_path)
 
         original_content = content
 
@@ -38,12 +40,8 @@ def update_file_content(file_path):
         content = re.sub(r'\*\*Document Type\*\*:\s*Data Schema', '**Document Type**: Data Definition', content)
         content = re.sub(r'Document Type:\s*Data Schema', 'Document Type: Data Definition', content)
 
-        # Update DS- file references to DD-
-        content = re.sub(r'DS-([a-zA-Z-]+)\.md', r'DD-\1.md', content)
-
         if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            corpus.write(file_path, content)
             return True
         return False
 
@@ -51,52 +49,21 @@ def update_file_content(file_path):
         print(f"Error updating content in {file_path}: {e}")
         return False
 
-def rename_file(old_path):
-    """Rename DS file to DD"""
+def dd_path(old_path):
+    """DD-*.md path a DS-*.md file is renamed to"""
     old_path = Path(old_path)
-    new_path = old_path.parent / old_path.name.replace('DS-', 'DD-')
-
-    try:
-        if old_path.exists():
-            shutil.move(str(old_path), str(new_path))
-            return True, new_path
-        else:
-            return False, None
-    except Exception as e:
-        print(f"Error renaming {old_path}: {e}")
-        return False, None
-
-def find_and_update_references(docs_dir, old_filename, new_filename):
-    """Find and update all references to the renamed file"""
-    updated_files = []
-
-    # Search all markdown files
-    for md_file in Path(docs_dir).rglob('*.md'):
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Check if file contains reference to old filename
-            if old_filename in content:
-                new_content = content.replace(old_filename, new_filename)
-
-                with open(md_file, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-
-                updated_files.append(md_file)
-        except Exception as e:
-            continue
-
-    return updated_files
+    return old_path.parent / old_path.name.replace('DS-', 'DD-')
 
-def main():
+def main(corpus=None):
+    corpus = corpus or Corpus()
     print("Converting DS files to DD files...\n")
     print(f"{'='*70}")
 
     converted = []
     failed = []
 
-    # Step 1: Update content and rename files
+    # Step 1: Update content
+    moves = {}
     for ds_file in ds_files:
         ds_path = Path(ds_file)
         if not ds_path.exists():
@@ -105,38 +72,27 @@ def main():
             continue
 
         print(f"\nProcessing: {ds_path.name}")
+        print(f"  → Updating document type (Data Schema → Data Definition)...")
+        update_file_content(ds_file, corpus)
+        moves[ds_path] = dd_path(ds_path)
 
-        # Update content first
-        print(f"  → Updating content (DS → DD references)...")
-        update_file_content(ds_file)
-
-        # Rename file
-        print(f"  → Renaming DS-*.md to DD-*.md...")
-        success, new_path = rename_file(ds_file)
-
-        if success:
-            converted.append((ds_path.name, new_path.name))
-            print(f"  ✅ Renamed: {ds_path.name} → {new_path.name}")
-        else:
-            failed.append(ds_path.name)
-            print(f"  ❌ Failed to rename: {ds_path.name}")
-
-    # Step 2: Update all references throughout the codebase
+    # Step 2: Rename files and re-point every relative link to them
     print(f"\n{'='*70}")
-    print("\nUpdating references throughout documentation...\n")
-
-    docs_dir = "/Users/peak/Documents/GitHub/carmen/docs"
-    total_refs_updated = 0
-
-    for old_name, new_name in converted:
-        print(f"Searching for references to: {old_name}")
-        updated_files = find_and_update_references(docs_dir, old_name, new_name)
+    print("\nRenaming files and updating links throughout documentation...\n")
 
-        if updated_files:
-            print(f"  ✅ Updated {len(updated_files)} file(s)")
-            total_refs_updated += len(updated_files)
-        else:
-            print(f"  ℹ️  No references found")
+    updated = {}
+    try:
+        updated = move_files(moves, corpus)
+        converted = [(old.name, new.name) for old, new in moves.items()]
+        for old_name, new_name in converted:
+            print(f"  ✅ Renamed: {old_name} → {new_name}")
+    except OSError as e:
+        print(f"  ❌ Failed to rename: {e}")
+        failed.extend(old.name for old in moves)
+
+    for doc, count in sorted(updated.items()):
+        print(f"  ✏️  {count} link(s) in {rel(doc)}")
+    total_refs_updated = len(updated)
 
     # Summary
     print(f"\n{'='*70}")
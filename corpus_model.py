@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Compact whole-corpus document model for tools that keep every doc in memory
+- All file bytes live in one shared buffer (a pack file under .docs-cache, mmap'ed read-only);
+  a document is an offset and a size into it, and its text is decoded only when asked for
+- Line starts are an array('I') of offsets per document instead of a list of line strings
+- Headings and **Label**: metadata lines are __slots__ nodes; heading texts, labels, values
+  and doc types are interned, so the thousands of "Overview" / "Draft" / "1.0.0" share one string
+- --synthetic N models N generated docs to check the footprint at scale (100k docs stay in
+  the low hundreds of MB); --compare also builds the naive str / line-list / dict model
+Heap figures come from tracemalloc, which makes the measured build several times slower.
+"""
+
+import argparse
+import mmap
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_right
+
+from doc_metadata import LABELS
+from docs_corpus import CACHE_DIR, Corpus, rel
+
+PACK_PATH = CACHE_DIR / 'corpus.pack'
+NEWLINE = re.compile(rb'\n')
+FENCE = re.compile(rb'^[ \t]*(?:```|~~~)', re.MULTILINE)
+HEADING = re.compile(rb'^(#{1,6})[ \t]+(.+?)[ \t#]*\r?$', re.MULTILINE)
+FIELD = re.compile(rb'^[ \t]*(?:-[ \t]+)?\*\*('
+                   + b'|'.join(re.escape(l.encode()) for l in sorted(LABELS, key=len, reverse=True))
+                   + rb')\*\*:[ \t]*(.*?)[ \t]*\r?$', re.MULTILINE)
+DOC_TYPE = re.compile(r'^([A-Z]{2,4})-')
+
+
+def intern(data):
+    return sys.intern(data.decode('utf-8', 'replace'))
+
+
+class Heading:
+    __slots__ = ('level', 'text', 'line')
+
+    def __init__(self, level, text, line):
+        self.level = level
+        self.text = text
+        self.line = line
+
+    def __repr__(self):
+        return f"Heading({self.level}, {self.text!r}, line={self.line})"
+
+
+class Field:
+    """One **Label**: value metadata line"""
+    __slots__ = ('label', 'value', 'line')
+
+    def __init__(self, label, value, line):
+        self.label = label
+        self.value = value
+        self.line = line
+
+    def __repr__(self):
+        return f"Field({self.label!r}, {self.value!r}, line={self.line})"
+
+
+class Document:
+    """A document's place in the shared buffer plus its parsed structure"""
+    __slots__ = ('path', 'doc_type', 'start', 'size', 'line_starts', 'headings', 'fields')
+
+    def __init__(self, path, doc_type, start, size, line_starts, headings, fields):
+        self.path = path
+        self.doc_type = doc_type
+        self.start = start
+        self.size = size
+        self.line_starts = line_starts    # array('I') of offsets relative to start
+        self.headings = headings          # tuple of Heading
+        self.fields = fields              # tuple of Field
+
+    @property
+    def line_count(self):
+        return len(self.line_starts)
+
+    def field(self, label):
+        return next((f.value for f in self.fields if f.label == label), None)
+
+
+def parse_document(path, data, start):
+    """Document for one file's bytes, located at `start` in the shared buffer"""
+    line_starts = array('I', [0] if data else [])
+    line_starts.extend(m.end() for m in NEWLINE.finditer(data))
+    if len(data) and line_starts[-1] == len(data):
+        line_starts.pop()       # trailing newline does not start another line
+
+    fences = [m.start() for m in FENCE.finditer(data)] if b'```' in data or b'~~~' in data else []
+    headings = []
+    if b'#' in data:
+        for m in HEADING.finditer(data):
+            if bisect_right(fences, m.start()) % 2:
+                continue        # inside a code block
+            headings.append(Heading(len(m.group(1)), intern(m.group(2)),
+                                    bisect_right(line_starts, m.start())))
+    fields = []
+    if b'**' in data:
+        fields = [Field(intern(m.group(1)), intern(m.group(2)), bisect_right(line_starts, m.start()))
+                  for m in FIELD.finditer(data)]
+    name = os.path.basename(path)
+    doc_type = DOC_TYPE.match(name)
+    return Document(path, sys.intern(doc_type.group(1)) if doc_type else None, start, len(data),
+                    line_starts, tuple(headings), tuple(fields))
+
+
+class CorpusModel:
+    """
+    Every document of a corpus over one read-only buffer.
+
+    build() streams (path, bytes) pairs into a pack file and parses each as it is written;
+    the pack is then mapped once, so bodies cost page cache rather than Python heap.
+    """
+
+    def __init__(self, documents, buffer, handle=None):
+        self.documents = documents
+        self.by_path = {d.path: d for d in documents}
+        self.buffer = buffer
+        self._handle = handle
+
+    @classmethod
+    def build(cls, sources, pack_path=PACK_PATH):
+        """sources: iterable of (path, bytes); pack_path None keeps the pack in a temp file"""
+        if pack_path is None:
+            handle = tempfile.TemporaryFile()
+        else:
+            CACHE_DIR.mkdir(exist_ok=True)
+            handle = open(pack_path, 'w+b')
+        documents, offset = [], 0
+        for path, data in sources:
+            handle.write(data)
+            documents.append(parse_document(path, data, offset))
+            offset += len(data)
+        handle.flush()
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if offset else b''
+        return cls(documents, buffer, handle)
+
+    @classmethod
+    def from_corpus(cls, corpus, paths=None):
+        def sources():
+            for path in (paths if paths is not None else corpus.files()):
+                with open(path, 'rb') as f:
+                    yield rel(path), f.read()
+        return cls.build(sources())
+
+    def raw(self, doc):
+        return self.buffer[doc.start:doc.start + doc.size]
+
+    def text(self, doc):
+        """Decoded body; nothing is cached, so repeated calls decode again"""
+        return self.raw(doc).decode('utf-8', 'replace')
+
+    def line(self, doc, number):
+        """Line `number` (1-based) without the newline"""
+        starts = doc.line_starts
+        begin = starts[number - 1]
+        if number < len(starts):
+            end = starts[number] - 1
+        else:
+            end = doc.size
+            if end > begin and self.buffer[doc.start + end - 1] == ord('\n'):
+                end -= 1    # the file's trailing newline
+        return self.buffer[doc.start + begin:doc.start + end].decode('utf-8', 'replace').rstrip('\r')
+
+    def lines(self, doc, first=1, last=None):
+        """Lines first..last (1-based, inclusive)"""
+        last = min(last or doc.line_count, doc.line_count)
+        return [self.line(doc, n) for n in range(first, last + 1)]
+
+    def section(self, doc, heading):
+        """Text from a heading to the next heading of the same or a higher level"""
+        index = doc.headings.index(heading)
+        end = next((h.line for h in doc.headings[index + 1:] if h.level <= heading.level), None)
+        return '\n'.join(self.lines(doc, heading.line, end - 1 if end else None))
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        if self._handle:
+            self._handle.close()
+
+
+def naive_model(sources):
+    """The representation this replaces: str bodies, line lists and per-file dicts"""
+    model = {}
+    for path, data in sources:
+        content = data.decode('utf-8', 'replace')
+        lines = content.split('\n')
+        model[path] = {
+            'content': content,
+            'lines': lines,
+            'headings': [{'level': len(l) - len(l.lstrip('#')), 'text': l.lstrip('#').strip(), 'line': i}
+                         for i, l in enumerate(lines, 1) if l.startswith('#')],
+            'metadata': {m.group(1).decode(): m.group(2).decode('utf-8', 'replace')
+                         for m in FIELD.finditer(data)},
+        }
+    return model
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+
+MODULES = ('procurement', 'inventory-management', 'vendor-management', 'finance', 'store-operations',
+           'product-management', 'system-administration', 'operational-planning')
+DOC_TYPES = ('BR', 'UC', 'TS', 'DD', 'FD', 'VAL', 'PC')
+SECTIONS = ('Overview', 'Purpose', 'Scope', 'Business Rules', 'Validation Rules', 'Data Model',
+            'User Interface', 'Workflow', 'Error Handling', 'Permissions', 'Integration Points',
+            'Related Documents', 'Test Scenarios', 'Glossary')
+WORDS = ('purchase', 'request', 'approval', 'vendor', 'price', 'inventory', 'location', 'quantity',
+         'status', 'workflow', 'department', 'budget', 'currency', 'order', 'receipt', 'the', 'a',
+         'must', 'should', 'is', 'validated', 'before', 'after', 'submitted', 'user', 'system')
+STATUSES = ('Draft', 'Review', 'Approved', 'Active')
+
+
+def synthetic_doc(rng, n):
+    """(path, bytes) of one generated doc, a few KB, shaped like the real ones"""
+    module = rng.choice(MODULES)
+    doc_type = rng.choice(DOC_TYPES)
+    name = f"{doc_type}-{module}-{n:06d}.md"
+    out = [f"# {doc_type} {module.replace('-', ' ').title()} {n}", '',
+           f"**Module**: {module}", f"**Document Type**: {doc_type}",
+           f"**Version**: 1.{rng.randrange(5)}.0", f"**Status**: {rng.choice(STATUSES)}",
+           f"**Last Updated**: 2025-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}", '',
+           '## Document History', '', '| Version | Date | Author | Changes |',
+           '|---------|------|--------|---------|',
+           '| 1.0.0 | 2025-11-19 | Documentation Team | Initial version |', '', '---', '']
+    for number, title in enumerate(rng.sample(SECTIONS, rng.randrange(4, 9)), 1):
+        out += [f"## {number}. {title}", '']
+        for _ in range(rng.randrange(1, 4)):
+            out += [' '.join(rng.choices(WORDS, k=rng.randrange(20, 60))).capitalize() + '.', '']
+        if rng.random() < 0.3:
+            out += ['| Field | Type | Required |', '|-------|------|----------|']
+            out += [f"| {rng.choice(WORDS)}_{i} | string | Yes |" for i in range(rng.randrange(3, 8))]
+            out.append('')
+        if rng.random() < 0.2:
+            out += ['```typescript', f"// {title}", 'const x = 1;', '```', '']
+    return f"synthetic/{module}/{name}", '\n'.join(out).encode('utf-8')
+
+
+def synthetic_docs(count, seed=7):
+    rng = random.Random(seed)
+    for n in range(count):
+        yield synthetic_doc(rng, n)
+
+
+def measure(build):
+    """(result, Python heap bytes held by it, seconds)"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, held, elapsed
+
+
+def mb(size):
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help="Model N generated docs instead of the corpus (pack kept in a temp file)")
+    parser.add_argument('--compare', action='store_true',
+                        help="Also build the naive str/list/dict model of the same docs and compare")
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        sources = lambda: synthetic_docs(args.synthetic)
+        model, heap, elapsed = measure(lambda: CorpusModel.build(sources(), pack_path=None))
+        what = f"{args.synthetic} synthetic doc(s)"
+    else:
+        corpus = corpus or Corpus()
+        paths = corpus.files()
+        sources = lambda: ((rel(p), open(p, 'rb').read()) for p in paths)
+        model, heap, elapsed = measure(lambda: CorpusModel.from_corpus(corpus, paths))
+        what = f"{len(paths)} corpus file(s) ({rel(PACK_PATH)})"
+
+    docs = model.documents
+    lines = sum(d.line_count for d in docs)
+    headings = sum(len(d.headings) for d in docs)
+    fields = sum(len(d.fields) for d in docs)
+    texts = {id(h.text) for d in docs for h in d.headings}
+    print(f"Modelled {what} in {elapsed:.2f}s\n")
+    print(f"Buffer (mmap, outside the heap): {mb(len(model.buffer))}")
+    print(f"Heap: {mb(heap)} ({heap // max(len(docs), 1)} bytes/doc)")
+    print(f"Lines: {lines}  Headings: {headings} ({len(texts)} distinct strings)  Metadata lines: {fields}")
+
+    if docs:
+        sample = docs[len(docs) // 2]
+        first = sample.headings[0] if sample.headings else None
+        print(f"\nSample {sample.path}: {sample.line_count} line(s), status {sample.field('Status')!r}")
+        if first:
+            print(f"  line {first.line}: {model.line(sample, first.line)}")
+
+    if args.compare:
+        naive, naive_heap, naive_elapsed = measure(lambda: naive_model(sources()))
+        print(f"\nNaive model: {mb(naive_heap)} heap in {naive_elapsed:.2f}s "
+              f"({naive_heap / max(heap + len(model.buffer), 1):.1f}x the compact heap + buffer)")
+        del naive
+
+    print(f"\n{'='*60}")
+    print(f"Documents: {len(docs)}")
+    print(f"Resident estimate: {mb(heap + len(model.buffer))} (heap + buffer)")
+    print(f"{'='*60}")
+    model.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
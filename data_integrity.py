@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Check referential integrity across the mock and seed datasets
+- Loads .data/*.json, lib/mock/**/*.json (streamed record by record) and the array literals
+  exported by lib/mock/*.ts(x) (tokenized with the prisma_queries literal parser)
+- Every list of objects with an `id` is an entity dataset: mockLocations, vendors.json,
+  {"priceAssignments": [...]} ...; ids are hashed into one index per entity, while the id of an
+  embedded single object (vendor: {id: ...}) is checked as a reference
+- Foreign keys are fields named <entity>Id / <entity>_id / <entity>Ids, or a field named after
+  an entity whose value looks like an id (department: 'dept-003'); each is probed against the
+  entity's hash index
+- Reports orphaned references and duplicate ids within a dataset; every record is visited once
+  to build the indexes and collect references, and each reference is probed once
+"""
+
+import argparse
+import ast
+import json
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from docs_corpus import REPO_ROOT, Corpus, rel
+from findings import finding, report
+from prisma_queries import Expr, Parser, line_of
+
+DEFAULT_ROOTS = [REPO_ROOT / '.data', REPO_ROOT / 'lib' / 'mock']
+DATA_SUFFIXES = ('.json', '.ts', '.tsx')
+CHUNK_SIZE = 64 * 1024
+
+# Foreign-key stems that do not name their dataset directly
+ENTITY_ALIASES = {
+    'request': 'purchase_request',
+    'pr': 'purchase_request',
+    'po': 'purchase_order',
+    'grn': 'goods_receive_note',
+    'supplier': 'vendor',
+}
+FOREIGN_KEY = re.compile(r'^(\w+?)(?:Id|_id|Ids|_ids)$')
+ID_LIKE = re.compile(r'^[A-Za-z]+(?:[-_][A-Za-z0-9]+)+$')
+EXPORTED_ARRAY = re.compile(r'^export\s+const\s+(\w+)\s*(?::\s*[^=\n]+)?=\s*(?=\[)', re.MULTILINE)
+DATASET_PREFIX = re.compile(r'^(?:mock|static|sample|default)_?(?=[A-Za-z])', re.IGNORECASE)
+
+
+def snake(name):
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', name).replace('-', '_').lower()
+
+
+def singular(word):
+    if word.endswith('ies'):
+        return word[:-3] + 'y'
+    if word.endswith(('sses', 'xes')):
+        return word[:-2]
+    if word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def entity_names(name):
+    """Entity keys a dataset or FK stem registers under: full name, then its last word"""
+    words = snake(DATASET_PREFIX.sub('', name)).strip('_').split('_')
+    words[-1] = singular(words[-1])
+    full = '_'.join(w for w in words if w)
+    names = [ENTITY_ALIASES.get(full, full)]
+    if len(words) > 1 and words[-1] not in names:
+        names.append(ENTITY_ALIASES.get(words[-1], words[-1]))
+    return names
+
+
+# ---------------------------------------------------------------------------
+# Loading
+
+def iter_json_items(path):
+    """Yield (key, line, record) for each record of a JSON file, reading it in chunks.
+
+    Records are the elements of a top-level array (key None) or of the arrays under the members
+    of a top-level object (key is the member name); other members are decoded and dropped.
+    line is where each element starts. Only one element is decoded at a time, so memory follows
+    the largest record, not the file.
+    """
+    decoder = json.JSONDecoder()
+    buffer, line, eof = '', 1, False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        def more():
+            nonlocal buffer, eof
+            chunk = f.read(CHUNK_SIZE)
+            eof = not chunk
+            buffer += chunk
+
+        def skip(separators=''):
+            """Drop whitespace and separators, counting lines"""
+            nonlocal buffer, line
+            while True:
+                i = 0
+                while i < len(buffer) and (buffer[i].isspace() or buffer[i] in separators):
+                    i += 1
+                line += buffer.count('\n', 0, i)
+                buffer = buffer[i:]
+                if buffer or eof:
+                    return
+                more()
+
+        def decode():
+            """Decode the value at the start of the buffer, reading more until it is complete"""
+            nonlocal buffer, line
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer)
+                except ValueError:
+                    if eof:
+                        raise
+                    more()
+                    continue
+                if end == len(buffer) and not eof:
+                    more()      # a number at the end of the buffer may continue in the next chunk
+                    continue
+                line += buffer.count('\n', 0, end)
+                buffer = buffer[end:]
+                return value
+
+        def entries(closer):
+            """Yield (key, line) with the buffer at each value of the array or object just opened;
+            the caller consumes the value before resuming"""
+            nonlocal buffer
+            buffer = buffer[1:]
+            while True:
+                skip(',')
+                if not buffer:
+                    raise ValueError(f"unexpected end of file at line {line}")
+                if buffer[0] == closer:
+                    buffer = buffer[1:]
+                    return
+                key = None
+                if closer == '}':
+                    key = decode()
+                    skip(':')
+                yield key, line
+
+        def records(key):
+            for _, start in entries(']'):
+                yield key, start, decode()
+
+        more()
+        skip()
+        if buffer[:1] == '[':
+            yield from records(None)
+        elif buffer[:1] == '{':
+            for key, _ in entries('}'):
+                if buffer[:1] == '[':
+                    yield from records(key)
+                else:
+                    decode()
+
+
+def ts_literal(value):
+    """Python value of a parsed TS literal; expressions that need evaluating stay Expr"""
+    if isinstance(value, dict):
+        return {k: ts_literal(v) for k, v in value.items() if k != '...'}
+    if isinstance(value, list):
+        return [ts_literal(v) for v in value]
+    text = str(value).strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in '\'"':
+        try:
+            return ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            return text[1:-1]
+    if text.startswith('`') and '${' not in text:
+        return text[1:-1]
+    if re.match(r'^-?\d+(?:\.\d+)?$', text):
+        return float(text) if '.' in text else int(text)
+    return {'true': True, 'false': False, 'null': None, 'undefined': None}.get(text, value)
+
+
+def iter_ts_datasets(path):
+    """Yield (dataset name, line, record) for the array literals a TS module exports"""
+    source = Path(path).read_text(encoding='utf-8', errors='replace')
+    for match in EXPORTED_ARRAY.finditer(source):
+        parser = Parser(source, match.end())
+        parser.take()   # '['
+        while True:
+            kind, text, start = parser.peek()
+            if kind == 'eof' or text == ']':
+                break
+            if text == ',':
+                parser.take()
+                continue
+            value = parser.value()
+            yield match.group(1), line_of(source, start), ts_literal(value)
+
+
+def iter_records(path):
+    """Yield (dataset, line, record) for every top-level record of a data file"""
+    if path.suffix == '.json':
+        for key, line, record in iter_json_items(path):
+            yield key or path.stem, line, record
+    else:
+        yield from iter_ts_datasets(path)
+
+
+# ---------------------------------------------------------------------------
+# Scan (process-pool worker)
+
+def is_key_value(value):
+    return isinstance(value, (str, int)) and not isinstance(value, (bool, Expr)) and value != ''
+
+
+def walk(record, dataset, line, ids, references, lists):
+    """Collect ids and FK references from one record, recursively.
+
+    Only records define ids: the record itself and the elements of nested lists of records.
+    An embedded single object ({"vendor": {"id": "v-9", ...}}) is a copy of a record defined
+    elsewhere, so its id is a reference to check, not an entry for the index.
+    """
+    stack = [(record, dataset, True)]
+    while stack:
+        value, owner, is_record = stack.pop()
+        if isinstance(value, list):
+            records = bool(value) and all(isinstance(v, dict) and 'id' in v for v in value)
+            if records:
+                lists.append((owner, line, [v['id'] for v in value]))
+            stack.extend((v, owner, records) for v in value)
+            continue
+        if not isinstance(value, dict):
+            continue
+        for key, item in value.items():
+            if key == 'id':
+                if not is_key_value(item):
+                    continue
+                if is_record:
+                    ids.append((owner, item))
+                else:
+                    references.append((owner, item, line))
+            elif FOREIGN_KEY.match(key) and isinstance(item, list) and all(map(is_key_value, item)):
+                references.extend((key, v, line) for v in item)
+            elif isinstance(item, (dict, list)):
+                stack.append((item, key, False))
+            elif is_key_value(item) and (FOREIGN_KEY.match(key) or ID_LIKE.match(str(item))):
+                references.append((key, item, line))
+
+
+def scan_data_file(path):
+    """Worker: {'datasets': {name: [[line, id]]}, 'ids': [[entity source, id]],
+    'references': [[field, value, line]], 'lists': [[owner, line, ids]], 'error': str|None}"""
+    datasets = defaultdict(list)
+    ids, references, lists = [], [], []
+    try:
+        for dataset, line, record in iter_records(Path(path)):
+            if isinstance(record, dict) and 'id' in record:
+                datasets[dataset].append((line, record['id']))
+            walk(record, dataset, line, ids, references, lists)
+    except (ValueError, UnicodeDecodeError) as e:
+        return path, {'datasets': {}, 'ids': [], 'references': [], 'lists': [], 'error': str(e)}
+    return path, {'datasets': dict(datasets), 'ids': ids, 'references': references,
+                  'lists': lists, 'error': None}
+
+
+def data_files(roots):
+    files = []
+    for root in roots:
+        root = Path(root)
+        if root.is_file():
+            files.append(root)
+        elif root.is_dir():
+            files += [p for p in root.rglob('*') if p.suffix in DATA_SUFFIXES and p.is_file()]
+    return sorted(set(files))
+
+
+# ---------------------------------------------------------------------------
+# Hash join
+
+class EntityIndex:
+    """entity name -> set of ids, plus the id prefixes ('dept-', 'loc-') each entity uses"""
+
+    def __init__(self):
+        self.ids = defaultdict(set)
+        self.prefixes = defaultdict(set)
+
+    def add(self, owner, value):
+        for name in entity_names(owner):
+            self.ids[name].add(value)
+            self.prefixes[name].add(id_prefix(value))
+
+    def entity_for(self, field, value):
+        """Entity a reference points to, or None if no dataset defines it.
+
+        An <entity>Id field whose full name has a dataset is taken at its word. A looser match
+        (locationId via the last word of deliveryLocationId, or department: 'dept-003') must
+        also share an id prefix with the entity, so 'status: in-progress' is not a reference.
+        """
+        match = FOREIGN_KEY.match(field)
+        names = entity_names(match.group(1) if match else field)
+        if match and names[0] in self.ids:
+            return names[0]
+        prefix = id_prefix(value)
+        for name in names:
+            if name in self.ids and prefix and prefix in self.prefixes[name]:
+                return name
+        return None
+
+
+def id_prefix(value):
+    """'pr-item-' for 'pr-item-005', '' for ids without a word prefix"""
+    match = re.match(r'^((?:[A-Za-z]+[-_])+)', str(value))
+    return match.group(1).lower() if match else ''
+
+
+def iter_findings(scans, index):
+    for path, scan in scans.items():
+        file = rel(path)
+        if scan['error']:
+            yield finding(file, 'parse-error', 'error', f"Could not load: {scan['error']}")
+            continue
+        found = []
+        for dataset, records in scan['datasets'].items():
+            found += duplicate_findings(file, dataset, records)
+        for owner, line, ids in scan['lists']:
+            if owner not in scan['datasets']:
+                found += duplicate_findings(file, owner, [(line, i) for i in ids])
+        seen = set()
+        for field, value, line in scan['references']:
+            key = FOREIGN_KEY.match(field)
+            entity = index.entity_for(field, value)
+            if entity is None:
+                # Only <x>Id fields are keys for sure; other id-like values just had no entity
+                if key and field not in seen:
+                    seen.add(field)
+                    found.append(finding(file, 'unresolved-reference', 'info',
+                                         f"{field}: no dataset defines {entity_names(key.group(1))[0]} ids",
+                                         line=line))
+                continue
+            if value not in index.ids[entity] and (field, value) not in seen:
+                seen.add((field, value))
+                found.append(finding(file, 'orphan-reference', 'error',
+                                     f"{field} '{value}' has no {entity} "
+                                     f"(checked {len(index.ids[entity])} ids)", line=line))
+        yield from sorted(found, key=lambda f: f.span or (0, 0))
+
+
+def duplicate_findings(file, dataset, records):
+    counts = Counter(value for _, value in records)
+    reported = set()
+    for line, value in records:
+        if counts[value] > 1 and value not in reported:
+            reported.add(value)
+            yield finding(file, 'duplicate-id', 'error',
+                          f"{dataset}: id '{value}' appears {counts[value]} times", line=line)
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help="Data files or folders (default: .data and lib/mock)")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    files = data_files(args.paths or DEFAULT_ROOTS)
+    scans = dict(corpus.map(scan_data_file, files))
+
+    # Build side: every id of every list of objects, keyed by entity
+    index = EntityIndex()
+    for path, scan in scans.items():
+        for owner, value in scan['ids']:
+            index.add(owner, value)
+
+    findings = iter_findings(scans, index)
+    if args.ndjson:
+        report(findings, ndjson=True)
+        return 0
+
+    records = sum(len(r) for s in scans.values() for r in s['datasets'].values())
+    references = sum(len(s['references']) for s in scans.values())
+    print(f"Scanning {len(files)} data file(s): {records} record(s), {references} reference(s)...\n")
+    counts = report(findings).by_rule
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Entities indexed: {len(index.ids)} ({sum(len(v) for v in index.ids.values())} ids)")
+    print(f"❌ Orphaned references: {counts['orphan-reference']}")
+    print(f"❌ Duplicate ids: {counts['duplicate-id']}")
+    print(f"ℹ️  Key fields with no dataset to check against: {counts['unresolved-reference']}")
+    print(f"❌ Files that failed to load: {counts['parse-error']}")
+    print(f"{'='*70}")
+    return 1 if counts['orphan-reference'] or counts['duplicate-id'] or counts['parse-error'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Fill the Document History tables from git history instead of a static template row
+- One row per commit that touched the doc: version, commit date, author and subject, the
+  subject followed by the short hash ("Fix totals (3d267003)") so a rerun never adds it twice
+- Replaces {YYYY-MM-DD} / {Author} placeholders, and the "1.0.0 | 2025-11-19 | Documentation
+  Team | Initial version" row the add_document_history scripts used to insert once the row for
+  the doc's first commit is added in its place
+- Hand-written rows are kept: only commits dated after the newest hand-written row are added,
+  in the table's own order (newest or oldest first), versions continuing from the highest
+  existing one with a patch bump
+- Commits come from the git_history index (one streamed `git log`, cached by last commit);
+  the HEAD of the last sync is kept in .docs-cache/doc-history.json, so a later run only
+  revisits docs touched by newer commits (--all revisits every doc)
+- Every table is rewritten in one pass over the corpus
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from datetime import date, datetime, timezone
+
+from docs_corpus import CACHE_DIR, Corpus, rel
+from git_history import GitError, GitIndex, git, is_ancestor, iter_log
+from markdown_tables import is_delimiter_row, split_row
+
+STATE_PATH = CACHE_DIR / 'doc-history.json'
+HISTORY_HEADING = re.compile(r'^#{2,3}\s+Document History\s*$')
+HEADER = ('Version', 'Date', 'Author', 'Changes')
+# the row add_document_history*.py and fix_remaining_files.py used to insert everywhere
+TEMPLATE_ROW = ('1.0.0', '2025-11-19', 'Documentation Team', 'Initial version')
+HASH_SUFFIX = re.compile(r'\(([0-9a-f]{7,40})\)\s*$')
+VERSION = re.compile(r'^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?')
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+CHANGE_COLUMNS = ('changes', 'change', 'description', 'summary')
+
+
+def load_index():
+    """Up-to-date GitIndex, or None outside a git work tree"""
+    index = GitIndex()
+    try:
+        index.update()
+    except GitError:
+        return None
+    index.save()
+    return index
+
+
+def day(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d')
+
+
+def parse_version(text):
+    match = VERSION.match(text.strip())
+    return tuple(int(g or 0) for g in match.groups()) if match else None
+
+
+def next_version(version):
+    return (version[0], version[1], version[2] + 1) if version else (1, 0, 0)
+
+
+def commit_row(commit, version):
+    subject = commit.subject.replace('|', '\\|')
+    return {'version': '.'.join(map(str, version)), 'date': day(commit.time),
+            'author': commit.author, 'changes': f"{subject} ({commit.sha[:8]})"}
+
+
+def new_doc_row():
+    """Row for a doc git has not seen yet: today, the configured git user"""
+    return {'version': '1.0.0', 'date': date.today().isoformat(),
+            'author': git('config', 'user.name') or TEMPLATE_ROW[2], 'changes': 'Initial version'}
+
+
+def history_rows(commits):
+    """Row dicts for a doc's commits (oldest first), versions 1.0.0, 1.0.1, ..."""
+    rows, version = [], None
+    for commit in commits:
+        version = next_version(version)
+        rows.append(commit_row(commit, version))
+    return rows or [new_doc_row()]
+
+
+def history_section(commits):
+    """A complete Document History section for a doc with these commits (oldest first)"""
+    lines = ['## Document History', '', f"| {' | '.join(HEADER)} |",
+             f"|{'|'.join('-' * (len(h) + 2) for h in HEADER)}|"]
+    for row in history_rows(commits):
+        lines.append(f"| {row['version']} | {row['date']} | {row['author']} | {row['changes']} |")
+    return '\n'.join(lines) + '\n\n'
+
+
+# ---------------------------------------------------------------------------
+# Table rewrite
+
+class HistoryTable:
+    """Location and contents of a doc's Document History table"""
+
+    def __init__(self, lines):
+        self.header = None
+        fence = False
+        for i, line in enumerate(lines):
+            # example tables inside ``` / ~~~ blocks are templates, not this doc's history
+            if line.lstrip().startswith(('```', '~~~')):
+                fence = not fence
+                continue
+            if fence or not HISTORY_HEADING.match(line.strip()):
+                continue
+            start = i + 1
+            while start < len(lines) and not lines[start].strip():
+                start += 1
+            if start + 1 >= len(lines) or not lines[start].lstrip().startswith('|') \
+                    or not is_delimiter_row(split_row(lines[start + 1])):
+                continue
+            self.header = [c.lower() for c in split_row(lines[start])]
+            self.delimiter = start + 1
+            end = self.delimiter + 1
+            while end < len(lines) and lines[end].lstrip().startswith('|'):
+                end += 1
+            self.rows = list(range(self.delimiter + 1, end))
+            return
+
+    def column(self, names):
+        return next((self.header.index(n) for n in names if n in self.header), None)
+
+    def render(self, row):
+        cells = []
+        for name in self.header:
+            key = 'changes' if name in CHANGE_COLUMNS else name
+            cells.append(row.get(key, ''))
+        return f"| {' | '.join(cells)} |"
+
+
+def is_placeholder(cells):
+    return any('{' in c and '}' in c for c in cells)
+
+
+def sync_content(content, commits):
+    """(new content, rows added) for one doc; content is returned as is when nothing changes.
+
+    Raises ValueError when the doc has no Document History table this can extend.
+    """
+    lines = content.split('\n')
+    table = HistoryTable(lines)
+    if table.header is None:
+        raise ValueError('no Document History table')
+    version_at, date_at = table.column(('version',)), table.column(('date',))
+    changes_at = table.column(CHANGE_COLUMNS)
+    if version_at is None or date_at is None or changes_at is None:
+        raise ValueError(f"unsupported columns: {', '.join(table.header)}")
+
+    kept, placeholders, templates, recorded, hand_written = [], [], [], set(), []
+    for i in table.rows:
+        cells = split_row(lines[i])
+        cells += [''] * (len(table.header) - len(cells))
+        if tuple(cells[:4]) == TEMPLATE_ROW:
+            templates.append((i, cells))
+            continue
+        if is_placeholder(cells):
+            placeholders.append(i)
+            continue
+        kept.append((i, cells))
+        recorded_hash = HASH_SUFFIX.search(cells[changes_at])
+        if recorded_hash:
+            recorded.add(recorded_hash.group(1))
+        else:
+            hand_written.append(cells)
+
+    cutoff = max((m.group() for m in (ISO_DATE.search(cells[date_at]) for cells in hand_written) if m),
+                 default='')
+    new = [c for c in commits
+           if not any(c.sha.startswith(h) for h in recorded) and day(c.time) > cutoff]
+    if not new:
+        return content, 0
+    # The template row stands in for the doc's first commit: it goes only when that commit's
+    # row takes its place at the start of the history. Below hand-written rows it is the first
+    # entry of a history that predates git, and the commits only extend it.
+    if new[0] is commits[0] and not hand_written:
+        placeholders += [i for i, _ in templates]
+    else:
+        kept = sorted(kept + templates)
+
+    versions = [v for v in (parse_version(cells[version_at]) for _, cells in kept) if v]
+    version = max(versions, default=None)
+    rows = []
+    for commit in new:
+        version = next_version(version)
+        rows.append(table.render(commit_row(commit, version)))
+
+    dates = [m.group() for m in (ISO_DATE.search(cells[date_at]) for _, cells in kept) if m]
+    newest_first = len(dates) > 1 and dates[0] > dates[-1]
+    remaining = [i for i in table.rows if i not in placeholders]
+    if newest_first:
+        at, rows = table.delimiter + 1, rows[::-1]
+    else:
+        at = (remaining[-1] if remaining else table.delimiter) + 1
+    dropped = set(placeholders)
+    out = [line for i, line in enumerate(lines[:at]) if i not in dropped] + rows + \
+          [line for i, line in enumerate(lines[at:], at) if i not in dropped]
+    return '\n'.join(out), len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Sync state
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f).get('head')
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(head):
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp = STATE_PATH.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'head': head}, f)
+    os.replace(tmp, STATE_PATH)
+
+
+def touched_since(head, synced):
+    """Repo-relative paths changed by the commits in synced..head"""
+    return {path for _, paths in iter_log(f"{synced}..{head}") for path in paths}
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('files', nargs='*', help="Docs to sync (default: docs changed since the last sync)")
+    parser.add_argument('--all', action='store_true', help="Revisit every doc, not only recently committed ones")
+    parser.add_argument('--check', action='store_true',
+                        help="Report docs whose table is missing commits without writing; exit 1 if any")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    index = GitIndex()
+    try:
+        index.update()
+    except GitError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    index.save()
+
+    synced = load_state()
+    docs = [f for f in corpus.files() if f.suffix == '.md']
+    if args.files:
+        wanted = {rel(f) for f in args.files}
+        docs = [d for d in docs if rel(d) in wanted]
+        scope = 'given files'
+    elif args.all or not synced or not is_ancestor(synced, index.head):
+        scope = 'all docs'
+    else:
+        touched = touched_since(index.head, synced)
+        docs = [d for d in docs if rel(d) in touched]
+        scope = f"docs changed since {synced[:8]}"
+
+    updated, rows_added, skipped = [], 0, []
+    for doc in docs:
+        content = corpus.read(doc)
+        if 'Document History' not in content:
+            skipped.append((doc, 'no Document History section'))
+            continue
+        try:
+            new_content, added = sync_content(content, index.history_of(rel(doc)))
+        except ValueError as e:
+            skipped.append((doc, str(e)))
+            continue
+        if not added:
+            continue
+        updated.append(doc)
+        rows_added += added
+        if args.check:
+            print(f"⚠️  Missing {added} commit row(s): {rel(doc)}")
+        else:
+            corpus.write(doc, new_content)
+            print(f"✅ Added {added} row(s): {rel(doc)}")
+    if not args.check and not args.files:
+        save_state(index.head)
+
+    elapsed = time.perf_counter() - started
+    print(f"\n{'='*60}")
+    print(f"History index: {index.read} new commit(s), {len(index.history)} path(s) at {index.head[:8]}")
+    print(f"Docs checked ({scope}): {len(docs)}")
+    print(f"{'Docs missing rows' if args.check else 'Docs updated'}: {len(updated)} ({rows_added} row(s))")
+    print(f"Docs skipped: {len(skipped)}")
+    for doc, reason in skipped[:10]:
+        print(f"  - {rel(doc)}: {reason}")
+    if len(skipped) > 10:
+        print(f"  ... and {len(skipped) - 10} more")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*60}")
+    return 1 if args.check and updated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Queryable index of document metadata (Module, Version, Status, Last Updated, ...)
+- Extract every **Label**: metadata line and its line number in one pass per file
+- Store them in a local SQLite index, re-extracting only files whose mtime/size changed
+- Let fixers jump straight to insertion points instead of rescanning files
+- Answer queries like "Draft TS docs in procurement not updated for 90 days" without reading docs
+
+Examples:
+    python3 doc_metadata.py --status draft --type TS --module procurement --older-than 90
+    python3 doc_metadata.py --field "Document Type=Technical Specification" --json
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from docs_corpus import CACHE_DIR, Corpus, module_of, rel
+
+INDEX_PATH = CACHE_DIR / 'metadata.sqlite'
+
+# Bump when extract_metadata() or the tables change; the index is rebuilt
+INDEX_VERSION = 1
+
+# Label -> field name; the first occurrence of each field is copied onto the document row
+LABELS = {
+    'Status': 'status',
+    'Document Status': 'status',
+    'Module': 'module',
+    'Sub-Module': 'submodule',
+    'Submodule': 'submodule',
+    'Version': 'version',
+    'Document Version': 'version',
+    'Last Updated': 'last_updated',
+    'Document Type': 'document_type',
+}
+
+METADATA_PATTERN = re.compile(
+    r'^\s*(-\s+)?\*\*(' + '|'.join(re.escape(l) for l in sorted(LABELS, key=len, reverse=True))
+    + r')\*\*:\s*(.*?)\s*$')
+DOC_TYPE_PATTERN = re.compile(r'^([A-Z]{2,4})-')
+ISO_DATE_PATTERN = re.compile(r'\b(\d{4})-(\d{2})(?:-(\d{2}))?\b')
+DATE_FORMATS = ('%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%B %Y', '%b %Y')
+
+SCHEMA = """
+CREATE TABLE documents (
+    path TEXT PRIMARY KEY,
+    root TEXT,
+    module_dir TEXT,
+    doc_type TEXT,
+    title TEXT,
+    status TEXT,
+    module TEXT,
+    version TEXT,
+    last_updated TEXT,
+    last_updated_raw TEXT,
+    history_line INTEGER,
+    line_count INTEGER,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE TABLE fields (
+    path TEXT,
+    field TEXT,
+    label TEXT,
+    value TEXT,
+    line INTEGER,
+    bullet INTEGER
+);
+CREATE INDEX fields_by_path ON fields(path, line);
+CREATE INDEX fields_by_value ON fields(field, value);
+CREATE INDEX documents_by_type ON documents(doc_type, module_dir);
+"""
+
+
+def parse_date(value):
+    """ISO date (YYYY-MM-DD) for the common Last Updated spellings, else None"""
+    match = ISO_DATE_PATTERN.search(value)
+    if match:
+        year, month, day = match.group(1), match.group(2), match.group(3) or '01'
+        try:
+            return date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            return None
+    cleaned = re.sub(r'(\d)(st|nd|rd|th)\b', r'\1', value.strip().strip('*_ ')).rstrip('.')
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def extract_metadata(path):
+    """Process-pool worker: (path, document row values, [(field, label, value, line, bullet)])"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        lines = f.read().split('\n')
+
+    title = None
+    history_line = None
+    fields = []
+    for line_no, line in enumerate(lines, 1):
+        if '**' in line:
+            match = METADATA_PATTERN.match(line)
+            if match:
+                label = match.group(2)
+                fields.append((LABELS[label], label, match.group(3), line_no, int(bool(match.group(1)))))
+                continue
+        if title is None and line.startswith('# '):
+            title = line[2:].strip()
+        elif history_line is None and line.strip() == '## Document History':
+            history_line = line_no
+
+    first = {}
+    for field, _, value, _, _ in fields:
+        first.setdefault(field, value)
+    name = Path(path).name
+    doc_type = DOC_TYPE_PATTERN.match(name)
+    document = {
+        'doc_type': doc_type.group(1) if doc_type else None,
+        'title': title,
+        'status': first.get('status'),
+        'module': first.get('module'),
+        'version': first.get('version'),
+        'last_updated': parse_date(first['last_updated']) if 'last_updated' in first else None,
+        'last_updated_raw': first.get('last_updated'),
+        'history_line': history_line,
+        'line_count': len(lines),
+    }
+    return path, document, fields
+
+
+class MetadataIndex:
+    """SQLite-backed metadata index; refresh() keeps it in step with the corpus"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.row_factory = sqlite3.Row
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != INDEX_VERSION:
+            self._create()
+
+    def _create(self):
+        self.db.executescript("DROP TABLE IF EXISTS documents; DROP TABLE IF EXISTS fields;")
+        self.db.executescript(SCHEMA)
+        self.db.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+        self.db.commit()
+
+    def rebuild(self):
+        self._create()
+
+    def refresh(self, corpus):
+        """Re-extract changed files and drop deleted ones; returns (extracted, removed)"""
+        stamps = {}
+        for path in corpus.files():
+            st = os.stat(path)
+            stamps[rel(path)] = (path, st.st_mtime_ns, st.st_size)
+
+        known = {row['path']: (row['mtime_ns'], row['size'])
+                 for row in self.db.execute('SELECT path, mtime_ns, size FROM documents')}
+        removed = [p for p in known if p not in stamps]
+        changed = [path for key, (path, mtime, size) in stamps.items()
+                   if known.get(key) != (mtime, size)]
+
+        with self.db:
+            for key in removed:
+                self._delete(key)
+            for path, document, fields in corpus.map(extract_metadata, changed):
+                key = rel(path)
+                _, mtime, size = stamps[key]
+                self._delete(key)
+                self.db.execute(
+                    'INSERT INTO documents VALUES (:path, :root, :module_dir, :doc_type, :title, '
+                    ':status, :module, :version, :last_updated, :last_updated_raw, '
+                    ':history_line, :line_count, :mtime_ns, :size)',
+                    dict(document, path=key, root=corpus.root_of(path),
+                         module_dir=module_of(path), mtime_ns=mtime, size=size))
+                self.db.executemany('INSERT INTO fields VALUES (?, ?, ?, ?, ?, ?)',
+                                    [(key,) + f for f in fields])
+        return len(changed), len(removed)
+
+    def _delete(self, key):
+        self.db.execute('DELETE FROM documents WHERE path = ?', (key,))
+        self.db.execute('DELETE FROM fields WHERE path = ?', (key,))
+
+    def document(self, path):
+        return self.db.execute('SELECT * FROM documents WHERE path = ?', (rel(path),)).fetchone()
+
+    def first_line(self, path, labels, bullet=None):
+        """1-based line of the first metadata line with one of labels, or None.
+
+        bullet=False only matches bare '**Label**:' lines, True only '- **Label**:'.
+        """
+        sql = (f"SELECT line FROM fields WHERE path = ? "
+               f"AND label IN ({','.join('?' * len(labels))})")
+        params = [rel(path), *labels]
+        if bullet is not None:
+            sql += ' AND bullet = ?'
+            params.append(int(bullet))
+        row = self.db.execute(sql + ' ORDER BY line LIMIT 1', params).fetchone()
+        return row['line'] if row else None
+
+    def query(self, status=None, doc_type=None, module=None, older_than=None, fields=(),
+              root=None):
+        """Documents matching every given filter (status/module/field values match case-insensitively)"""
+        where, params = [], []
+        if status:
+            where.append("status LIKE ?")
+            params.append(f"%{status}%")
+        if doc_type:
+            where.append("doc_type = ?")
+            params.append(doc_type.upper())
+        if module:
+            where.append("(module_dir = ? OR module LIKE ?)")
+            params += [module, f"%{module}%"]
+        if root:
+            where.append("root = ?")
+            params.append(root)
+        if older_than is not None:
+            where.append("last_updated < ?")
+            params.append((date.today() - timedelta(days=older_than)).isoformat())
+        for label, value in fields:
+            where.append("path IN (SELECT path FROM fields WHERE label = ? AND value LIKE ?)")
+            params += [label, f"%{value}%"]
+        sql = 'SELECT * FROM documents'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        return self.db.execute(sql + ' ORDER BY path', params).fetchall()
+
+    def close(self):
+        self.db.close()
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split('\n')[0],
+        epilog=__doc__.split('Examples:')[1], formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rebuild', action='store_true', help="Discard the index and re-extract every file")
+    parser.add_argument('--status', help="Status contains (e.g. draft)")
+    parser.add_argument('--type', dest='doc_type', help="Document type prefix (BR, UC, TS, DD, FD, VAL, ...)")
+    parser.add_argument('--module', help="Module directory under docs/app, or **Module** value")
+    parser.add_argument('--root', help="Configured documentation root")
+    parser.add_argument('--older-than', type=int, metavar='DAYS',
+                        help="Last Updated more than DAYS days ago")
+    parser.add_argument('--field', action='append', default=[], metavar='LABEL=VALUE',
+                        help="Any metadata line, e.g. 'Document Type=Technical'")
+    parser.add_argument('--json', action='store_true', help="Print matches as JSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    fields = []
+    for item in args.field:
+        label, sep, value = item.partition('=')
+        if not sep:
+            parser.error(f"--field expects LABEL=VALUE, got {item!r}")
+        fields.append((label.strip(), value.strip()))
+
+    started = time.perf_counter()
+    index = MetadataIndex()
+    if args.rebuild:
+        index.rebuild()
+    extracted, removed = index.refresh(corpus)
+    rows = index.query(args.status, args.doc_type, args.module, args.older_than, fields, args.root)
+    index.close()
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps([dict(r) for r in rows], indent=2))
+        return 0
+
+    for row in rows:
+        print(f"{row['path']}")
+        print(f"   Status: {row['status'] or '-'} | Version: {row['version'] or '-'} | "
+              f"Last Updated: {row['last_updated'] or row['last_updated_raw'] or '-'}")
+
+    print(f"\n{'='*70}")
+    print(f"Matching documents: {len(rows)}")
+    print(f"Index: {rel(INDEX_PATH)} ({extracted} extracted, {removed} removed)")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*70}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
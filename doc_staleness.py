@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Flag docs whose code has changed since the doc was last updated
+- Docs under docs/app/<module>/<submodule>/ describe app/(main)/<module>/<submodule>/;
+  module-level docs describe the whole module folder
+- Submodule folders are matched by name, then singular/plural and without "-management"
+  (goods-received-notes -> goods-received-note, exchange-rate-management -> exchange-rates);
+  CODE_ALIASES covers the renamed ones
+- Commit times come from the git_history index: one streamed `git log --name-only`,
+  cached and extended from the last seen commit, never one git call per file
+- A doc is stale when a file under its code folder was committed after the doc's last commit;
+  the finding counts those files and names the newest change
+Only committed history counts; uncommitted edits are ignored.
+"""
+
+import argparse
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from data_integrity import singular
+from docs_corpus import DOCS_APP_DIR, REPO_ROOT, Corpus, rel
+from findings import finding, report
+from git_history import GitError, GitIndex
+
+CODE_DIR = REPO_ROOT / 'app' / '(main)'
+# docs/app/<module>/<submodule> -> code folders under app/(main)/<module>
+CODE_ALIASES = {
+    ('finance', 'department-management'): ('department-list',),
+    ('vendor-management', 'pricelist-templates'): ('templates',),
+    ('vendor-management', 'requests-for-pricing'): ('campaigns',),
+    ('vendor-management', 'vendor-directory'): ('vendors', 'manage-vendors'),
+}
+DAY = 24 * 3600
+
+
+def name_key(name):
+    return ''.join(singular(w) for w in name.lower().split('-') if w != 'management')
+
+
+def code_dirs_for(doc):
+    """Code folders (repo-relative) a doc under docs/app describes; [] when there are none"""
+    parts = doc.relative_to(DOCS_APP_DIR).parts
+    module = CODE_DIR / parts[0]
+    if len(parts) < 2 or not module.is_dir():
+        return []
+    if len(parts) == 2:
+        return [rel(module)]
+    submodule = parts[1]
+    if (parts[0], submodule) in CODE_ALIASES:
+        return [rel(module / d) for d in CODE_ALIASES[parts[0], submodule] if (module / d).is_dir()]
+    if (module / submodule).is_dir():
+        return [rel(module / submodule)]
+    key = name_key(submodule)
+    return [rel(d) for d in sorted(module.iterdir()) if d.is_dir() and name_key(d.name) == key]
+
+
+def folder_times(index, folders):
+    """folder -> sorted [(commit time, path)] of every indexed path under it, in one pass"""
+    wanted = set(folders)
+    times = defaultdict(list)
+    for path, sha in index.last.items():
+        parent = path.rsplit('/', 1)[0] if '/' in path else ''
+        while parent:
+            if parent in wanted:
+                times[parent].append((index.commits[sha][0], path))
+            parent = parent.rsplit('/', 1)[0] if '/' in parent else ''
+    for entries in times.values():
+        entries.sort()
+    return times
+
+
+def day(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d')
+
+
+def iter_findings(docs, mapping, index, times, stats):
+    """Findings per doc; stats['current'] counts the docs that are up to date"""
+    for doc in docs:
+        key = rel(doc)
+        folders = mapping[doc]
+        if not folders:
+            yield finding(key, 'no-code-folder', 'info',
+                          "No code folder under app/(main) matches this doc's module/submodule")
+            continue
+        doc_commit = index.last_commit(key)
+        if doc_commit is None:
+            yield finding(key, 'untracked-doc', 'info', "Doc has no committed history yet")
+            continue
+        changed = [(t, path) for folder in folders for t, path in times.get(folder, ())
+                   if t > doc_commit.time]
+        if not changed:
+            stats['current'] += 1
+            continue
+        newest_time, newest_path = max(changed)
+        newest = index.last_commit(newest_path)
+        yield finding(key, 'stale-doc', 'warning',
+                      f"{len(changed)} file(s) under {', '.join(folders)} changed after this doc "
+                      f"({day(doc_commit.time)}); newest {newest.sha[:8]} {day(newest_time)} "
+                      f"\"{newest.subject}\" ({newest_path}), "
+                      f"{(newest_time - doc_commit.time) // DAY} day(s) later")
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Discard the cached history index and read the whole log again")
+    parser.add_argument('--verbose', action='store_true',
+                        help="Also list docs with no code folder or no committed history")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    index = GitIndex(rebuild=args.rebuild)
+    try:
+        index.update()
+    except GitError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    index.save()
+    indexed = time.perf_counter() - started
+
+    docs = [f for f in corpus.files(DOCS_APP_DIR) if f.suffix == '.md']
+    mapping = {doc: code_dirs_for(doc) for doc in docs}
+    times = folder_times(index, {f for folders in mapping.values() for f in folders})
+    stats = defaultdict(int)
+    findings = iter_findings(docs, mapping, index, times, stats)
+
+    if args.ndjson:
+        report(findings, ndjson=True)
+        return 0
+
+    print(f"Checking {len(docs)} doc(s) against {len(times)} code folder(s)...\n")
+    counts = report(findings, show=lambda f: args.verbose or f.severity != 'info').by_rule
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"History index: {'incremental' if index.incremental else 'full'} update, "
+          f"{index.read} commit(s) read, {len(index.last)} path(s) at {index.head[:8]} "
+          f"({indexed * 1000:.0f} ms)")
+    print(f"✅ Up to date: {stats['current']}")
+    print(f"⚠️  Stale (code changed after the doc): {counts['stale-doc']}")
+    print(f"ℹ️  No matching code folder: {counts['no-code-folder']}")
+    print(f"ℹ️  Not committed yet: {counts['untracked-doc']}")
+    print(f"{'='*70}")
+    return 1 if counts['stale-doc'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the documentation scripts
+- Repository-relative paths (no hardcoded checkouts)
+- Configurable documentation roots with per-root include/exclude globs
+- Corpus: one parallel walk of all roots and memoized reads shared by every tool in a process
+- Per-file extraction cache keyed by mtime/size so reruns only re-read edited files
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+DOCS_DIR = REPO_ROOT / 'docs'
+DOCS_APP_DIR = DOCS_DIR / 'app'
+SCHEMA_PATH = DOCS_APP_DIR / 'data-struc' / 'schema.prisma'
+CACHE_DIR = REPO_ROOT / '.docs-cache'
+
+# Optional JSON file overriding DEFAULT_ROOTS: [{"name", "path", "include", "exclude"}, ...]
+ROOTS_CONFIG = REPO_ROOT / 'docs-roots.json'
+
+Root = namedtuple('Root', 'name path include exclude')
+
+DEFAULT_ROOTS = [
+    Root('docs', 'docs', ['**/*.md'], ['app/template-guide/**', '.agent-os/**']),
+    Root('prd', 'prd', ['**/*.md'], []),
+    Root('web-bundles', 'web-bundles', ['**/*.md', '**/*.txt'], []),
+    Root('serena', '.serena/memories', ['*.md'], []),
+    Root('summaries', '.', ['*_SUMMARY.md'], []),
+]
+
+
+def glob_to_regex(pattern):
+    """Translate a path glob ('**' spans directories, '*' does not) to a compiled regex"""
+    out = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            out += '(?:.*/)?'
+            i += 3
+        elif pattern.startswith('**', i):
+            out += '.*'
+            i += 2
+        elif pattern[i] == '*':
+            out += '[^/]*'
+            i += 1
+        elif pattern[i] == '?':
+            out += '[^/]'
+            i += 1
+        else:
+            out += re.escape(pattern[i])
+            i += 1
+    return re.compile(out + r'\Z')
+
+
+def load_roots(names=None):
+    """Configured roots (docs-roots.json if present, else DEFAULT_ROOTS), optionally filtered by name"""
+    roots = DEFAULT_ROOTS
+    if ROOTS_CONFIG.exists():
+        with open(ROOTS_CONFIG, 'r', encoding='utf-8') as f:
+            roots = [Root(r['name'], r['path'], r.get('include', ['**/*.md']), r.get('exclude', []))
+                     for r in json.load(f)]
+    if names:
+        unknown = set(names) - {r.name for r in roots}
+        if unknown:
+            raise ValueError(f"Unknown root(s): {', '.join(sorted(unknown))}")
+        roots = [r for r in roots if r.name in names]
+    return roots
+
+
+class RootMatcher:
+    """Compiled include/exclude globs for one root"""
+
+    def __init__(self, root):
+        self.root = root
+        self.path = (REPO_ROOT / root.path).resolve()
+        self.include = [glob_to_regex(p) for p in root.include]
+        self.exclude = [glob_to_regex(p) for p in root.exclude]
+        # Only descend into subdirectories if some include pattern can match below the root
+        self.recursive = any('/' in p for p in root.include)
+
+    def wants_file(self, rel_path):
+        return (any(r.match(rel_path) for r in self.include)
+                and not any(r.match(rel_path) for r in self.exclude))
+
+    def wants_dir(self, rel_path):
+        return self.recursive and not any(r.match(rel_path + '/') for r in self.exclude)
+
+    def scan_dir(self, directory):
+        """List one directory: (matching files, subdirectories to descend into)"""
+        files, subdirs = [], []
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return files, subdirs
+        for entry in entries:
+            rel_path = Path(entry.path).relative_to(self.path).as_posix()
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith('.') and entry.name != 'node_modules' \
+                        and self.wants_dir(rel_path):
+                    subdirs.append(entry.path)
+            elif self.wants_file(rel_path):
+                files.append(Path(entry.path))
+        return files, subdirs
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+class Corpus:
+    """
+    Documentation files across the configured roots, walked once and read at most once.
+
+    Tools take an optional corpus so several of them can run in one process
+    (see carmen_docs.py) over a single walk and a single read per file.
+    All roots are walked on one bounded thread pool; map() runs per-file work
+    on a process pool of the same size. Writes go through write()/move() so
+    later readers see the new content.
+    """
+
+    def __init__(self, roots=None, workers=None):
+        self.roots = [RootMatcher(r) for r in (roots if roots is not None else load_roots())]
+        self.workers = workers or default_workers()
+        self._files = None
+        self._root_of = {}
+        self._text = {}
+        self._written = set()
+
+    def _scan(self):
+        """Walk every root concurrently; each task lists one directory"""
+        found = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {
+                pool.submit(m.scan_dir, m.path): m for m in self.roots if m.path.is_dir()
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    matcher = pending.pop(future)
+                    files, subdirs = future.result()
+                    for f in files:
+                        self._root_of.setdefault(f, matcher.root.name)
+                    found.extend(files)
+                    for subdir in subdirs:
+                        pending[pool.submit(matcher.scan_dir, subdir)] = matcher
+        return sorted(set(found))
+
+    def files(self, root=None):
+        """All files under root (default: every configured root), sorted"""
+        if self._files is None:
+            self._files = self._scan()
+        if root is None:
+            return list(self._files)
+        root = Path(root).resolve()
+        return [f for f in self._files if root in f.parents]
+
+    def find(self, prefixes, root=None):
+        """
+        Files named <prefix>-<module slug> for one of prefixes (e.g. ('DD', 'TS')); the slug
+        must start lowercase so status reports like DD-CREATION-STATUS.md are not matched
+        """
+        prefixes = tuple(f"{p}-" for p in prefixes)
+        return [f for f in self.files(root)
+                if f.name.startswith(prefixes) and f.name.partition('-')[2][:1].islower()]
+
+    def root_of(self, path):
+        """Name of the configured root a file was found under"""
+        self.files()
+        return self._root_of.get(Path(path))
+
+    def read(self, path):
+        path = Path(path)
+        if path not in self._text:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._text[path] = f.read()
+        return self._text[path]
+
+    def preload(self, paths=None):
+        """Read files concurrently on the corpus pool"""
+        paths = [Path(p) for p in (self.files() if paths is None else paths)
+                 if Path(p) not in self._text]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for path, text in zip(paths, pool.map(self._read_file, paths)):
+                self._text[path] = text
+
+    @staticmethod
+    def _read_file(path):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+
+    def map(self, fn, paths=None, chunksize=8):
+        """Run fn(path) over files on a bounded process pool, yielding results in order.
+
+        fn must be a module-level function. Falls back to in-process calls
+        when the corpus is limited to a single worker.
+        """
+        paths = self.files() if paths is None else list(paths)
+        if self.workers <= 1 or len(paths) <= 1:
+            yield from map(fn, paths)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            yield from pool.map(fn, paths, chunksize=chunksize)
+
+    def map_text(self, fn, paths=None, chunksize=8):
+        """Like map(), but runs fn(path, text), yielding results in order.
+
+        Workers read each file themselves; only files changed by write() are sent
+        with their new content. Nothing is memoized, and at most two chunks per
+        worker are in flight, so memory stays flat however large the corpus is.
+        """
+        paths = self.files() if paths is None else paths
+        items = ((p, self._text[p] if p in self._written else None) for p in map(Path, paths))
+        if self.workers <= 1:
+            for path, text in items:
+                yield _apply_text(fn, path, text)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for chunk in iter(lambda: list(islice(items, chunksize)), []):
+                pending.append(pool.submit(_apply_chunk, fn, chunk))
+                if len(pending) >= 2 * self.workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def write(self, path, content):
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._text[path] = content
+        self._written.add(path)
+
+    def move(self, old_path, new_path):
+        """Rename a file on disk and in the corpus"""
+        old_path, new_path = Path(old_path), Path(new_path)
+        os.replace(old_path, new_path)
+        if old_path in self._text:
+            self._text[new_path] = self._text.pop(old_path)
+        if old_path in self._written:
+            self._written.discard(old_path)
+            self._written.add(new_path)
+        if self._files is not None:
+            self._files = sorted(new_path if f == old_path else f for f in self._files)
+            if old_path in self._root_of:
+                self._root_of[new_path] = self._root_of.pop(old_path)
+
+
+def _apply_text(fn, path, text):
+    """fn(path, text), reading the file when no text was passed"""
+    if text is None:
+        text = Corpus._read_file(path)
+    return fn(path, text)
+
+
+def _apply_chunk(fn, chunk):
+    """Process-pool worker for map_text()"""
+    return [_apply_text(fn, path, text) for path, text in chunk]
+
+
+def module_of(path):
+    """Return the module directory a document belongs to (first folder under docs/app)"""
+    path = Path(path).resolve()
+    for base in (DOCS_APP_DIR, DOCS_DIR, REPO_ROOT):
+        if base in path.parents:
+            parts = path.relative_to(base).parts
+            return parts[0] if len(parts) > 1 else '(root)'
+    return '(external)'
+
+
+def rel(path):
+    """Path relative to the repository root, as a POSIX string (absolute if outside)"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def file_digest(path):
+    """SHA-1 of a file's bytes"""
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+class FileCache:
+    """
+    JSON-backed cache of per-file extraction results.
+
+    Entries are keyed by repo-relative path and validated by (mtime_ns, size).
+    `salt` identifies everything else the extraction depends on (e.g. the schema
+    digest); a different salt discards the whole cache.
+    """
+
+    def __init__(self, name, salt=''):
+        self.path = CACHE_DIR / f"{name}.json"
+        self.salt = salt
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('salt') == salt:
+                    self.entries = data.get('entries', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    @staticmethod
+    def _stamp(path):
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+
+    def get(self, path, extract):
+        """Return cached extraction for path, calling extract(path) on a miss"""
+        found, data = self.lookup(path)
+        if found:
+            return data
+        data = extract(path)
+        self.store(path, data)
+        return data
+
+    def lookup(self, path):
+        """(True, data) if path has a fresh entry, else (False, None); for batching misses"""
+        entry = self.entries.get(rel(path))
+        if entry is not None and entry['stamp'] == self._stamp(path):
+            self.hits += 1
+            return True, entry['data']
+        self.misses += 1
+        return False, None
+
+    def store(self, path, data):
+        self.entries[rel(path)] = {'stamp': self._stamp(path), 'data': data}
+        self._dirty = True
+
+    def prune(self, keep_paths):
+        """Drop entries for files that no longer exist in the scanned set"""
+        keep = {rel(p) for p in keep_paths}
+        stale = [k for k in self.entries if k not in keep]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'salt': self.salt, 'entries': self.entries}, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
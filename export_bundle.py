@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Export docs/app as an NDJSON page bundle for the WordPress / Wiki.js importers
+- Build the page tree (sections and pages, parents before children) from the docs corpus
+- One JSON record per line: path, parent, title, description, tags, content hash and converted body
+- Delta mode: only pages whose hash changed since the last exported manifest, plus deletions
+- Apply a bundle to a local stand-in importer directory to test exports without a live site
+
+Bundle records (first line is the header):
+    {"type": "bundle", "version": 1, "mode": "full"|"delta", "format": "markdown"|"html", ...}
+    {"type": "section", "op": "upsert", "path": "procurement", "parent": null, "title": "Procurement"}
+    {"type": "page", "op": "upsert", "path": "procurement/credit-note/br-credit-note", "parent": ..., "hash": ..., "body": ...}
+    {"type": "page", "op": "delete", "path": ...}
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from docs_corpus import DOCS_APP_DIR, REPO_ROOT, Corpus, rel
+from markdown_tables import parse_tables
+
+BUNDLE_VERSION = 1
+EXPORT_DIR = REPO_ROOT / 'exports'
+DEFAULT_OUTPUT = EXPORT_DIR / 'docs-bundle.ndjson'
+DEFAULT_MANIFEST = EXPORT_DIR / 'manifest.json'
+
+# Same tag names as scripts/import-*-pages.js
+DOC_TYPE_TAGS = {
+    'BR': 'business-requirements',
+    'DD': 'data-dictionary',
+    'FD': 'flow-diagrams',
+    'TS': 'technical-specification',
+    'UC': 'use-cases',
+    'VAL': 'validation-rules',
+    'PC': 'page-component',
+}
+INDEX_NAMES = ('readme', 'index')
+HOME_PATH = 'home'
+
+LINK_PATTERN = re.compile(r'(!?)\[([^\]]*)\]\(([^)\s]+)\)')
+TITLE_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+
+def wiki_path(path):
+    """Wiki path of a doc: docs/app-relative, lowercase, no extension; README/index map to their folder"""
+    parts = Path(path).resolve().relative_to(DOCS_APP_DIR).with_suffix('').parts
+    if parts[-1].lower() in INDEX_NAMES:
+        parts = parts[:-1]
+    return '/'.join(re.sub(r'[^a-z0-9._-]+', '-', p.lower()) for p in parts) or HOME_PATH
+
+
+def parent_of(page_path):
+    return page_path.rsplit('/', 1)[0] if '/' in page_path else None
+
+
+def extract_title(content, path):
+    match = TITLE_PATTERN.search(content)
+    if match:
+        return match.group(1).strip()
+    return Path(path).stem.replace('-', ' ').title()
+
+
+def extract_description(content):
+    """First three non-heading lines after the first heading, at most 200 characters"""
+    found_heading = False
+    lines = []
+    for line in content.split('\n'):
+        if line.startswith('#'):
+            found_heading = True
+            continue
+        if found_heading and line.strip():
+            lines.append(line.strip())
+            if len(lines) >= 3:
+                break
+    return ' '.join(lines)[:200]
+
+
+def tags_for(path):
+    parts = Path(path).resolve().relative_to(DOCS_APP_DIR).parts
+    tags = list(parts[:-1][:2])
+    prefix = Path(path).name.split('-')[0]
+    if prefix in DOC_TYPE_TAGS:
+        tags.append(DOC_TYPE_TAGS[prefix])
+    return tags
+
+
+def rewrite_links(content, source):
+    """Point relative links to other docs at their wiki paths"""
+    base = Path(source).resolve().parent
+
+    def replace(match):
+        bang, text, target = match.groups()
+        if bang or re.match(r'^[a-z]+:|^#|^/', target):
+            return match.group(0)
+        file_part, _, anchor = target.partition('#')
+        if not file_part.endswith('.md'):
+            return match.group(0)
+        resolved = Path(os.path.normpath(base / file_part))
+        if DOCS_APP_DIR not in resolved.parents:
+            return match.group(0)
+        url = '/' + wiki_path(resolved) + (f"#{anchor}" if anchor else '')
+        return f"[{text}]({url})"
+
+    return LINK_PATTERN.sub(replace, content)
+
+
+# (marker that must be present, pattern, replacement), applied in order
+INLINE_RULES = [
+    ('`', re.compile(r'`([^`]+)`'), r'<code>\1</code>'),
+    ('](', re.compile(r'!\[([^\]]*)\]\(([^)\s]+)\)'), r'<img src="\2" alt="\1">'),
+    ('](', re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)'), r'<a href="\2">\1</a>'),
+    ('**', re.compile(r'\*\*(.+?)\*\*'), r'<strong>\1</strong>'),
+    ('*', re.compile(r'(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])'), r'<em>\1</em>'),
+]
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*)$')
+# indent, then a bullet or an ordered marker ("3." / "3)"), then the item text
+LIST_ITEM_PATTERN = re.compile(r'^([ \t]*)([-*+]|\d{1,9}[.)])(?:[ \t]+|$)')
+BLOCKQUOTE_PATTERN = re.compile(r'^[ \t]{0,3}>[ ]?')
+FENCE_MARKERS = ('```', '~~~')
+THEMATIC_BREAK = re.compile(r'^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+
+
+def inline_html(text):
+    text = html.escape(text, quote=False)
+    for marker, pattern, replacement in INLINE_RULES:
+        if marker in text:
+            text = pattern.sub(replacement, text)
+    return text
+
+
+def heading_id(text):
+    return re.sub(r'[^\w\- ]', '', text.lower()).strip().replace(' ', '-')
+
+
+def indent_of(line):
+    """Width of a line's leading whitespace, tabs counting as 4 columns"""
+    return len(line[:len(line) - len(line.lstrip())].expandtabs(4))
+
+
+def dedent(line, width):
+    """line without up to width columns of leading whitespace"""
+    stripped = line.lstrip()
+    return line[:len(line) - len(stripped)].expandtabs(4)[width:] + stripped
+
+
+def starts_block(line):
+    """Whether a line opens a block of its own rather than continuing a paragraph"""
+    stripped = line.strip()
+    return (not stripped or stripped.startswith(FENCE_MARKERS + ('|',))
+            or bool(THEMATIC_BREAK.match(line) or BLOCKQUOTE_PATTERN.match(line)
+                    or LIST_ITEM_PATTERN.match(line))
+            or bool(line.startswith('#') and HEADING_PATTERN.match(line)))
+
+
+def is_ordered(match):
+    return match.group(2)[0].isdigit()
+
+
+def render_list(lines, i):
+    """(HTML, index after the list) for the list whose first item is lines[i].
+
+    An item runs on over lines indented past its marker (nested lists, continuation text),
+    unindented text right after it (a lazy continuation) and blank lines followed by more
+    indented content. Items separated by blank lines make the list loose (<p> per paragraph).
+    """
+    first = LIST_ITEM_PATTERN.match(lines[i])
+    indent, ordered = indent_of(lines[i]), is_ordered(first)
+    items, loose = [], False
+    while True:
+        match = LIST_ITEM_PATTERN.match(lines[i])
+        width = len(match.group(0).expandtabs(4))
+        body = [lines[i][match.end():]]
+        i += 1
+        while i < len(lines):
+            line = lines[i]
+            if not line.strip():
+                after = i
+                while after < len(lines) and not lines[after].strip():
+                    after += 1
+                if after == len(lines) or indent_of(lines[after]) <= indent:
+                    break
+                body += [''] * (after - i)
+                i = after
+                loose = True
+            elif indent_of(line) > indent:
+                body.append(dedent(line, width))
+                i += 1
+            elif body[-1].strip() and not starts_block(line):
+                body.append(line.strip())
+                i += 1
+            else:
+                break
+        items.append(body)
+
+        after = i
+        while after < len(lines) and not lines[after].strip():
+            after += 1
+        match = LIST_ITEM_PATTERN.match(lines[after]) if after < len(lines) else None
+        if not match or indent_of(lines[after]) != indent or is_ordered(match) != ordered:
+            break
+        loose = loose or after > i
+        i = after
+
+    tag = 'ol' if ordered else 'ul'
+    start = int(first.group(2)[:-1]) if ordered else 1
+    opening = f'<{tag} start="{start}">' if start != 1 else f'<{tag}>'
+    rendered = ''.join(f"<li>{''.join(render_blocks(body, tight=not loose))}</li>" for body in items)
+    return f"{opening}{rendered}</{tag}>", i
+
+
+def render_blocks(lines, tight=False):
+    """HTML block elements for Markdown lines; tight=True leaves paragraphs unwrapped (list items)"""
+    tables = {t.start: t for t in parse_tables(lines)}
+    out, paragraph = [], []
+
+    def flush():
+        if paragraph:
+            text = inline_html(' '.join(paragraph))
+            out.append(text if tight else f"<p>{text}</p>")
+            paragraph.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if stripped.startswith(FENCE_MARKERS):
+            flush()
+            lang = stripped[3:].strip() or 'plaintext'
+            end = i + 1
+            while end < len(lines) and not lines[end].strip().startswith(stripped[:3]):
+                end += 1
+            code = html.escape('\n'.join(dedent(l, indent_of(line)) for l in lines[i + 1:end]),
+                               quote=False)
+            if lang == 'mermaid':
+                out.append(f'<pre class="mermaid">{code}</pre>')
+            else:
+                out.append(f'<pre><code class="language-{lang}">{code}</code></pre>')
+            i = end + 1
+            continue
+        if i in tables:
+            flush()
+            table = tables[i]
+            head = ''.join(f"<th>{inline_html(c)}</th>" for c in table.header)
+            body = ''.join(
+                '<tr>' + ''.join(f"<td>{inline_html(c)}</td>" for c in row) + '</tr>'
+                for row in zip(*table.columns))
+            out.append(f'<table class="wp-block-table"><thead><tr>{head}</tr></thead>'
+                       f'<tbody>{body}</tbody></table>')
+            i = table.end
+            continue
+        heading = HEADING_PATTERN.match(line) if line.startswith('#') else None
+        if heading:
+            flush()
+            level, text = len(heading.group(1)), heading.group(2).strip()
+            out.append(f'<h{level} id="{heading_id(text)}">{inline_html(text)}</h{level}>')
+        elif BLOCKQUOTE_PATTERN.match(line):
+            flush()
+            end = i
+            while end < len(lines) and BLOCKQUOTE_PATTERN.match(lines[end]):
+                end += 1
+            quoted = [BLOCKQUOTE_PATTERN.sub('', l, count=1) for l in lines[i:end]]
+            out.append('<blockquote>' + '\n'.join(render_blocks(quoted)) + '</blockquote>')
+            i = end
+            continue
+        elif THEMATIC_BREAK.match(line):
+            flush()
+            out.append('<hr>')
+        elif LIST_ITEM_PATTERN.match(line):
+            flush()
+            rendered, i = render_list(lines, i)
+            out.append(rendered)
+            continue
+        elif not stripped:
+            flush()
+        else:
+            paragraph.append(stripped)
+        i += 1
+    flush()
+    return out
+
+
+def markdown_to_html(content):
+    """Markdown -> HTML for the WordPress importer: headings, fences, tables, paragraphs,
+    blockquotes and (nested, ordered) lists"""
+    return '\n'.join(render_blocks(content.split('\n'))) + '\n'
+
+
+def build_page(path, fmt='markdown'):
+    """Process-pool worker: page record (without 'op') for one doc"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    body = rewrite_links(content, path)
+    if fmt == 'html':
+        body = markdown_to_html(body)
+    page_path = wiki_path(path)
+    record = {
+        'type': 'page',
+        'path': page_path,
+        'parent': parent_of(page_path),
+        'title': extract_title(content, path),
+        'description': extract_description(content),
+        'tags': tags_for(path),
+        'source': rel(path),
+    }
+    digest = hashlib.sha1(json.dumps(record, sort_keys=True).encode('utf-8'))
+    digest.update(body.encode('utf-8'))
+    record['hash'] = digest.hexdigest()
+    record['body'] = body
+    return record
+
+
+def build_page_html(path):
+    return build_page(path, 'html')
+
+
+def build_tree(pages):
+    """Section records for every folder on the way to a page that is not itself a page"""
+    page_paths = {p['path'] for p in pages}
+    sections = {}
+    for page in pages:
+        parent = page['parent']
+        while parent and parent not in page_paths and parent not in sections:
+            name = parent.rsplit('/', 1)[-1]
+            sections[parent] = {
+                'type': 'section',
+                'path': parent,
+                'parent': parent_of(parent),
+                'title': name.replace('-', ' ').title(),
+            }
+            parent = parent_of(parent)
+    return sections
+
+
+def depth(path):
+    return path.count('/')
+
+
+def load_manifest(path):
+    if path is None or not Path(path).exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_bundle(pages, sections, manifest, fmt):
+    """Return (header, records); records are ordered so parents come before children"""
+    base = manifest if manifest and manifest.get('format') == fmt else None
+    old_pages = base['pages'] if base else {}
+    old_sections = set(base['sections']) if base else set()
+
+    records = [dict(sections[path], op='upsert') for path in sections if path not in old_sections]
+    records += [dict(page, op='upsert') for page in pages
+                if old_pages.get(page['path']) != page['hash']]
+    records.sort(key=lambda r: (depth(r['path']), r['path']))
+
+    page_paths = {p['path'] for p in pages}
+    deleted = [p for p in old_pages if p not in page_paths and p not in sections]
+    deleted += [s for s in old_sections if s not in sections and s not in page_paths]
+    for path in sorted(deleted, key=lambda p: (-depth(p), p)):
+        kind = 'page' if path in old_pages else 'section'
+        records.append({'type': kind, 'op': 'delete', 'path': path})
+
+    header = {
+        'type': 'bundle',
+        'version': BUNDLE_VERSION,
+        'mode': 'delta' if base else 'full',
+        'format': fmt,
+        'generated': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'base': base['generated'] if base else None,
+        'pages': len(pages),
+        'upserts': sum(1 for r in records if r['op'] == 'upsert'),
+        'deletes': len(deleted),
+    }
+    return header, records
+
+
+def write_json_atomic(path, write):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def apply_bundle(bundle_path, target):
+    """Local stand-in importer: apply a bundle to a directory of pages.
+
+    target/index.json holds {path: {type, parent, title, hash}}; page bodies go to
+    target/pages/<path>.<format>. Raises ValueError on anything a real importer
+    would reject (unknown parent, hash mismatch, deleting a missing page).
+    """
+    target = Path(target)
+    index_path = target / 'index.json'
+    index = {}
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+    with open(bundle_path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('type') != 'bundle' or header.get('version') != BUNDLE_VERSION:
+            raise ValueError(f"{bundle_path}: not a version {BUNDLE_VERSION} bundle")
+        suffix = '.html' if header['format'] == 'html' else '.md'
+        for line_no, line in enumerate(f, 2):
+            record = json.loads(line)
+            path = record['path']
+            page_file = target / 'pages' / (path + suffix)
+            if record['op'] == 'delete':
+                if path not in index:
+                    raise ValueError(f"line {line_no}: delete of unknown {record['type']} {path}")
+                if any(entry['parent'] == path for entry in index.values()):
+                    raise ValueError(f"line {line_no}: {path} still has children")
+                del index[path]
+                if page_file.exists():
+                    page_file.unlink()
+                continue
+
+            if record['parent'] is not None and record['parent'] not in index:
+                raise ValueError(f"line {line_no}: parent {record['parent']} of {path} not imported")
+            entry = {'type': record['type'], 'parent': record['parent'], 'title': record['title']}
+            if record['type'] == 'section' and page_file.exists():
+                page_file.unlink()
+            if record['type'] == 'page':
+                body = record.pop('body')
+                digest = record.pop('hash')
+                check = hashlib.sha1(json.dumps(
+                    {k: v for k, v in record.items() if k != 'op'}, sort_keys=True).encode('utf-8'))
+                check.update(body.encode('utf-8'))
+                if check.hexdigest() != digest:
+                    raise ValueError(f"line {line_no}: content hash mismatch for {path}")
+                page_file.parent.mkdir(parents=True, exist_ok=True)
+                page_file.write_text(body, encoding='utf-8')
+                entry['hash'] = digest
+            index[path] = entry
+
+    write_json_atomic(index_path, lambda f: json.dump(index, f, indent=2, sort_keys=True))
+    return header, index
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split('\n')[0],
+        epilog=__doc__.split('Bundle records')[1], formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--format', choices=('markdown', 'html'), default='markdown',
+                        help="Body format: markdown for Wiki.js, html for WordPress (default: %(default)s)")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help="Bundle path")
+    parser.add_argument('--manifest', type=Path, default=DEFAULT_MANIFEST,
+                        help="Manifest of the last export; rewritten after each export")
+    parser.add_argument('--full', action='store_true', help="Ignore the manifest and export every page")
+    parser.add_argument('--apply-to', type=Path, metavar='DIR',
+                        help="Apply the new bundle to a local stand-in importer directory")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    files = [f for f in corpus.files(DOCS_APP_DIR) if f.suffix == '.md']
+    worker = build_page_html if args.format == 'html' else build_page
+    pages = list(corpus.map(worker, files))
+
+    seen = {}
+    for page in pages:
+        if page['path'] in seen:
+            print(f"⚠️  {page['source']} and {seen[page['path']]} both map to /{page['path']}; "
+                  f"keeping the first")
+        seen.setdefault(page['path'], page['source'])
+    pages = [p for p in pages if seen[p['path']] == p['source']]
+    sections = build_tree(pages)
+
+    manifest = None if args.full else load_manifest(args.manifest)
+    if manifest and manifest.get('format') != args.format:
+        print(f"⚠️  Last export was {manifest.get('format')}; exporting every page")
+    header, records = build_bundle(pages, sections, manifest, args.format)
+
+    def write_bundle(f):
+        f.write(json.dumps(header, ensure_ascii=False) + '\n')
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    write_json_atomic(args.output, write_bundle)
+    write_json_atomic(args.manifest, lambda f: json.dump({
+        'version': BUNDLE_VERSION,
+        'format': args.format,
+        'generated': header['generated'],
+        'pages': {p['path']: p['hash'] for p in sorted(pages, key=lambda p: p['path'])},
+        'sections': sorted(sections),
+    }, f, indent=2))
+    elapsed = time.perf_counter() - started
+
+    print(f"📦 Bundle: {rel(args.output)} ({header['mode']}, {header['format']})")
+    print(f"📄 Pages: {header['pages']} in {len(sections)} sections")
+    print(f"✅ Upserts: {header['upserts']}")
+    print(f"🗑️  Deletes: {header['deletes']}")
+    print(f"📝 Manifest: {rel(args.manifest)}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+
+    if args.apply_to:
+        try:
+            _, index = apply_bundle(args.output, args.apply_to)
+        except ValueError as e:
+            print(f"❌ Stand-in import failed: {e}")
+            return 1
+        print(f"✅ Applied to {rel(args.apply_to)}: {len(index)} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Streaming findings shared by the audit scripts
+- Finding: one result with a fixed schema (file, rule, severity, span, message)
+- Audits yield findings from generators; nothing is collected before printing
+- write_ndjson(): one JSON object per line, flushed as each finding arrives, so
+  downstream tools can consume results while the scan is still running
+- Summary: streaming aggregates (per rule, per severity, files affected) in constant memory
+
+NDJSON record:
+    {"file": "docs/app/...", "rule": "history-at-end", "severity": "error",
+     "span": {"start": 412, "end": 412} | null, "message": "..."}
+"""
+
+import json
+import os
+import sys
+from collections import Counter, namedtuple
+
+SEVERITIES = ('error', 'warning', 'info')
+ICONS = {'error': '❌', 'warning': '⚠️ ', 'info': 'ℹ️ '}
+
+# span is (start_line, end_line), 1-based and inclusive, or None for whole-file findings
+Finding = namedtuple('Finding', 'file rule severity span message')
+
+
+def finding(file, rule, severity, message, line=None, end_line=None):
+    """Build a Finding; line/end_line give its span"""
+    if severity not in SEVERITIES:
+        raise ValueError(f"Unknown severity: {severity}")
+    span = (line, end_line or line) if line else None
+    return Finding(file, rule, severity, span, message)
+
+
+def to_record(f):
+    return {
+        'file': f.file,
+        'rule': f.rule,
+        'severity': f.severity,
+        'span': {'start': f.span[0], 'end': f.span[1]} if f.span else None,
+        'message': f.message,
+    }
+
+
+class Summary:
+    """Counts folded in one finding at a time; memory does not grow with the number of findings"""
+
+    def __init__(self):
+        self.total = 0
+        self.by_rule = Counter()
+        self.by_severity = Counter()
+        self.files = 0
+        self._last_file = None
+
+    def add(self, f):
+        self.total += 1
+        self.by_rule[f.rule] += 1
+        self.by_severity[f.severity] += 1
+        # Audits yield a file's findings together, so a change of file is a new file
+        if f.file != self._last_file:
+            self.files += 1
+            self._last_file = f.file
+
+    def fold(self, findings):
+        """Pass findings through while counting them"""
+        for f in findings:
+            self.add(f)
+            yield f
+
+    def as_record(self):
+        return {
+            'total': self.total,
+            'files': self.files,
+            'by_severity': dict(self.by_severity),
+            'by_rule': dict(sorted(self.by_rule.items())),
+        }
+
+
+def _stop_on_closed_pipe(out):
+    """Consumer went away (e.g. `| head`): silence further writes instead of a traceback"""
+    if out is sys.stdout:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+def write_ndjson(findings, out=None):
+    """Write each finding as one JSON line as soon as it is produced; returns the Summary"""
+    out = out or sys.stdout
+    summary = Summary()
+    try:
+        for f in summary.fold(findings):
+            out.write(json.dumps(to_record(f), ensure_ascii=False) + '\n')
+            out.flush()
+    except BrokenPipeError:
+        _stop_on_closed_pipe(out)
+    return summary
+
+
+def format_finding(f):
+    where = f"{f.file}:{f.span[0]}" if f.span else f.file
+    return f"{ICONS[f.severity]} {where}: {f.message}"
+
+
+def print_findings(findings, out=None, show=None):
+    """Print findings as they arrive (show(f) -> False hides one); returns the Summary"""
+    out = out or sys.stdout
+    summary = Summary()
+    try:
+        for f in summary.fold(findings):
+            if show is None or show(f):
+                print(format_finding(f), file=out)
+    except BrokenPipeError:
+        _stop_on_closed_pipe(out)
+    return summary
+
+
+def report(findings, ndjson=False, show=None):
+    """NDJSON on stdout (summary on stderr) or human-readable lines; returns the Summary"""
+    if ndjson:
+        summary = write_ndjson(findings)
+        print(json.dumps({'summary': summary.as_record()}), file=sys.stderr)
+        return summary
+    return print_findings(findings, show=show)
@@ -7,53 +7,55 @@ Remove '---' separator after Document History tables
 import re
 from pathlib import Path
 
+from docs_corpus import DOCS_DIR
+
 # Files that need fixing (from check script)
 files_to_fix = [
-    "/Users/peak/Documents/GitHub/carmen/docs/app/finance/account-code-mapping/BR-account-code-mapping.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/finance/currency-management/BR-currency-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/finance/department-management/BR-department-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/finance/exchange-rate-management/BR-exchange-rate-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/fractional-inventory/BR-fractional-inventory.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/inventory-adjustments/BR-inventory-adjustments.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/inventory-overview/BR-inventory-overview.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/inventory-transactions/BR-inventory-transactions.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/lot-based-costing/BR-lot-based-costing.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/period-end/BR-period-end.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/physical-count-management/BR-physical-count-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/spot-check/BR-spot-check.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/stock-in/BR-stock-in.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/stock-overview/BR-stock-overview.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/menu-engineering/BR-menu-engineering.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/recipe-management/categories/BR-categories.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/recipe-management/cuisine-types/BR-cuisine-types.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/operational-planning/recipe-management/recipes/BR-recipes.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/credit-note/BR-credit-note.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/goods-received-notes/BR-goods-received-note.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/my-approvals/BR-my-approvals.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/purchase-orders/BR-purchase-orders.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/purchase-request-templates/BR-purchase-request-templates.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/purchase-requests/BR-purchase-requests.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/categories/BR-categories.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/products/BR-products.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/units/BR-units.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/shared-methods/inventory-valuation/BR-inventory-valuation.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/store-operations/stock-replenishment/BR-stock-replenishment.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/store-operations/store-requisitions/BR-store-requisitions.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/store-operations/wastage-reporting/BR-wastage-reporting.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/BR-system-administration.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/business-rules/BR-business-rules.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/monitoring/BR-monitoring.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/permission-management/BR-permission-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/settings/BR-settings.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/system-integrations/BR-system-integrations.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/user-management/BR-user-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/workflow/BR-workflow.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/template-guide/BR-template.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/price-lists/BR-price-lists.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/pricelist-templates/BR-pricelist-templates.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/requests-for-pricing/BR-requests-for-pricing.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-directory/BR-vendor-directory.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-portal/BR-vendor-portal.md",
+    str(DOCS_DIR / "app/finance/account-code-mapping/BR-account-code-mapping.md"),
+    str(DOCS_DIR / "app/finance/currency-management/BR-currency-management.md"),
+    str(DOCS_DIR / "app/finance/department-management/BR-department-management.md"),
+    str(DOCS_DIR / "app/finance/exchange-rate-management/BR-exchange-rate-management.md"),
+    str(DOCS_DIR / "app/inventory-management/fractional-inventory/BR-fractional-inventory.md"),
+    str(DOCS_DIR / "app/inventory-management/inventory-adjustments/BR-inventory-adjustments.md"),
+    str(DOCS_DIR / "app/inventory-management/inventory-overview/BR-inventory-overview.md"),
+    str(DOCS_DIR / "app/inventory-management/inventory-transactions/BR-inventory-transactions.md"),
+    str(DOCS_DIR / "app/inventory-management/lot-based-costing/BR-lot-based-costing.md"),
+    str(DOCS_DIR / "app/inventory-management/period-end/BR-period-end.md"),
+    str(DOCS_DIR / "app/inventory-management/physical-count-management/BR-physical-count-management.md"),
+    str(DOCS_DIR / "app/inventory-management/spot-check/BR-spot-check.md"),
+    str(DOCS_DIR / "app/inventory-management/stock-in/BR-stock-in.md"),
+    str(DOCS_DIR / "app/inventory-management/stock-overview/BR-stock-overview.md"),
+    str(DOCS_DIR / "app/operational-planning/menu-engineering/BR-menu-engineering.md"),
+    str(DOCS_DIR / "app/operational-planning/recipe-management/categories/BR-categories.md"),
+    str(DOCS_DIR / "app/operational-planning/recipe-management/cuisine-types/BR-cuisine-types.md"),
+    str(DOCS_DIR / "app/operational-planning/recipe-management/recipes/BR-recipes.md"),
+    str(DOCS_DIR / "app/procurement/credit-note/BR-credit-note.md"),
+    str(DOCS_DIR / "app/procurement/goods-received-notes/BR-goods-received-note.md"),
+    str(DOCS_DIR / "app/procurement/my-approvals/BR-my-approvals.md"),
+    str(DOCS_DIR / "app/procurement/purchase-orders/BR-purchase-orders.md"),
+    str(DOCS_DIR / "app/procurement/purchase-request-templates/BR-purchase-request-templates.md"),
+    str(DOCS_DIR / "app/procurement/purchase-requests/BR-purchase-requests.md"),
+    str(DOCS_DIR / "app/product-management/categories/BR-categories.md"),
+    str(DOCS_DIR / "app/product-management/products/BR-products.md"),
+    str(DOCS_DIR / "app/product-management/units/BR-units.md"),
+    str(DOCS_DIR / "app/shared-methods/inventory-valuation/BR-inventory-valuation.md"),
+    str(DOCS_DIR / "app/store-operations/stock-replenishment/BR-stock-replenishment.md"),
+    str(DOCS_DIR / "app/store-operations/store-requisitions/BR-store-requisitions.md"),
+    str(DOCS_DIR / "app/store-operations/wastage-reporting/BR-wastage-reporting.md"),
+    str(DOCS_DIR / "app/system-administration/BR-system-administration.md"),
+    str(DOCS_DIR / "app/system-administration/business-rules/BR-business-rules.md"),
+    str(DOCS_DIR / "app/system-administration/monitoring/BR-monitoring.md"),
+    str(DOCS_DIR / "app/system-administration/permission-management/BR-permission-management.md"),
+    str(DOCS_DIR / "app/system-administration/settings/BR-settings.md"),
+    str(DOCS_DIR / "app/system-administration/system-integrations/BR-system-integrations.md"),
+    str(DOCS_DIR / "app/system-administration/user-management/BR-user-management.md"),
+    str(DOCS_DIR / "app/system-administration/workflow/BR-workflow.md"),
+    str(DOCS_DIR / "app/template-guide/BR-template.md"),
+    str(DOCS_DIR / "app/vendor-management/price-lists/BR-price-lists.md"),
+    str(DOCS_DIR / "app/vendor-management/pricelist-templates/BR-pricelist-templates.md"),
+    str(DOCS_DIR / "app/vendor-management/requests-for-pricing/BR-requests-for-pricing.md"),
+    str(DOCS_DIR / "app/vendor-management/vendor-directory/BR-vendor-directory.md"),
+    str(DOCS_DIR / "app/vendor-management/vendor-portal/BR-vendor-portal.md"),
 ]
 
 def fix_markdown_format(file_path):
@@ -99,7 +101,7 @@ def main():
 
     for file_path in files_to_fix:
         path_obj = Path(file_path)
-        rel_path = path_obj.relative_to(Path('/Users/peak/Documents/GitHub/carmen/docs'))
+        rel_path = path_obj.relative_to(DOCS_DIR)
 
         success, message = fix_markdown_format(file_path)
 
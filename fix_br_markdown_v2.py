@@ -5,10 +5,11 @@ Specifically target '---' after Document History table
 """
 
 import re
-from pathlib import Path
+
+from docs_corpus import DOCS_DIR
 
 # Find all BR files with errors
-br_files = list(Path('/Users/peak/Documents/GitHub/carmen/docs').rglob('BR-*.md'))
+br_files = list(DOCS_DIR.rglob('BR-*.md'))
 
 def fix_document_history_separator(file_path):
     """Remove '---' separator that appears after Document History table"""
@@ -45,7 +46,7 @@ def main():
     skipped_count = 0
 
     for file_path in sorted(br_files):
-        rel_path = file_path.relative_to(Path('/Users/peak/Documents/GitHub/carmen/docs'))
+        rel_path = file_path.relative_to(DOCS_DIR)
 
         success, message = fix_document_history_separator(file_path)
 
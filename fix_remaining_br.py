@@ -7,27 +7,29 @@ Target: Remove '---' that appears after Document History table ending with "Init
 from pathlib import Path
 import re
 
+from docs_corpus import DOCS_DIR
+
 # Remaining files with errors (from check output)
 remaining_files = [
-    "/Users/peak/Documents/GitHub/carmen/docs/app/finance/currency-management/BR-currency-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/finance/department-management/BR-department-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/finance/exchange-rate-management/BR-exchange-rate-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/inventory-transactions/BR-inventory-transactions.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/period-end/BR-period-end.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/physical-count-management/BR-physical-count-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/spot-check/BR-spot-check.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/inventory-management/stock-in/BR-stock-in.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/credit-note/BR-credit-note.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/goods-received-notes/BR-goods-received-note.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/my-approvals/BR-my-approvals.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/purchase-orders/BR-purchase-orders.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/procurement/purchase-request-templates/BR-purchase-request-templates.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/categories/BR-categories.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/products/BR-products.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/product-management/units/BR-units.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/shared-methods/inventory-valuation/BR-inventory-valuation.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/store-operations/wastage-reporting/BR-wastage-reporting.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/template-guide/BR-template.md",
+    str(DOCS_DIR / "app/finance/currency-management/BR-currency-management.md"),
+    str(DOCS_DIR / "app/finance/department-management/BR-department-management.md"),
+    str(DOCS_DIR / "app/finance/exchange-rate-management/BR-exchange-rate-management.md"),
+    str(DOCS_DIR / "app/inventory-management/inventory-transactions/BR-inventory-transactions.md"),
+    str(DOCS_DIR / "app/inventory-management/period-end/BR-period-end.md"),
+    str(DOCS_DIR / "app/inventory-management/physical-count-management/BR-physical-count-management.md"),
+    str(DOCS_DIR / "app/inventory-management/spot-check/BR-spot-check.md"),
+    str(DOCS_DIR / "app/inventory-management/stock-in/BR-stock-in.md"),
+    str(DOCS_DIR / "app/procurement/credit-note/BR-credit-note.md"),
+    str(DOCS_DIR / "app/procurement/goods-received-notes/BR-goods-received-note.md"),
+    str(DOCS_DIR / "app/procurement/my-approvals/BR-my-approvals.md"),
+    str(DOCS_DIR / "app/procurement/purchase-orders/BR-purchase-orders.md"),
+    str(DOCS_DIR / "app/procurement/purchase-request-templates/BR-purchase-request-templates.md"),
+    str(DOCS_DIR / "app/product-management/categories/BR-categories.md"),
+    str(DOCS_DIR / "app/product-management/products/BR-products.md"),
+    str(DOCS_DIR / "app/product-management/units/BR-units.md"),
+    str(DOCS_DIR / "app/shared-methods/inventory-valuation/BR-inventory-valuation.md"),
+    str(DOCS_DIR / "app/store-operations/wastage-reporting/BR-wastage-reporting.md"),
+    str(DOCS_DIR / "app/template-guide/BR-template.md"),
 ]
 
 def fix_file(file_path):
@@ -82,7 +84,7 @@ def main():
 
         if fix_file(file_path):
             fixed += 1
-            print(f"✅ {path_obj.relative_to(Path('/Users/peak/Documents/GitHub/carmen/docs'))}")
+            print(f"✅ {path_obj.relative_to(DOCS_DIR)}")
         else:
             skipped += 1
             print(f"⏭️  {path_obj.name}")
@@ -5,31 +5,25 @@ Fix the remaining files that don't have Document History
 
 from pathlib import Path
 
-# Document History template
-DOCUMENT_HISTORY = """## Document History
-
-| Version | Date | Author | Changes |
-|---------|------|--------|---------|
-| 1.0.0 | 2025-11-19 | Documentation Team | Initial version |
-
-"""
+from doc_history import history_section, load_index
+from docs_corpus import DOCS_DIR, rel
 
 # Files that need updating
 files_to_update = [
-    "/Users/peak/Documents/GitHub/carmen/docs/inventory-adjustment/INV-ADJ-Page-Flow.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/recipe/recipe_managment.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/vendor-pricelist-management/VENDOR_PORTAL_ENHANCEMENT_SUMMARY.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/business-analysis/BA Prompt.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/platform-notification-service/core-services.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/product-management/PROD-Component-Structure.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/product-management/PROD-Business-Requirements.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/product-management/PROD-Overview.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/product-management/PROD-User-Flow-Diagram.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/prd/recreate-pr-spec-prompt.md",
+    str(DOCS_DIR / "inventory-adjustment/INV-ADJ-Page-Flow.md"),
+    str(DOCS_DIR / "recipe/recipe_managment.md"),
+    str(DOCS_DIR / "vendor-pricelist-management/VENDOR_PORTAL_ENHANCEMENT_SUMMARY.md"),
+    str(DOCS_DIR / "business-analysis/BA Prompt.md"),
+    str(DOCS_DIR / "platform-notification-service/core-services.md"),
+    str(DOCS_DIR / "product-management/PROD-Component-Structure.md"),
+    str(DOCS_DIR / "product-management/PROD-Business-Requirements.md"),
+    str(DOCS_DIR / "product-management/PROD-Overview.md"),
+    str(DOCS_DIR / "product-management/PROD-User-Flow-Diagram.md"),
+    str(DOCS_DIR / "prd/recreate-pr-spec-prompt.md"),
 ]
 
-def add_document_history_to_file(file_path):
-    """Add Document History to a single file"""
+def add_document_history_to_file(file_path, history=None):
+    """Add Document History to a single file, with rows from its git history"""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -59,7 +53,8 @@ def add_document_history_to_file(file_path):
             insertion_index = 0
 
         # Insert Document History
-        lines.insert(insertion_index, DOCUMENT_HISTORY.rstrip())
+        commits = history.history_of(rel(file_path)) if history else []
+        lines.insert(insertion_index, history_section(commits).rstrip())
         new_content = '\n'.join(lines)
 
         # Write back
@@ -78,6 +73,7 @@ def main():
     already_has = 0
     empty = 0
     errors = []
+    history = load_index()
 
     for file_path in files_to_update:
         file = Path(file_path)
@@ -85,7 +81,7 @@ def main():
             errors.append((file_path, "File not found"))
             continue
 
-        result = add_document_history_to_file(file_path)
+        result = add_document_history_to_file(file_path, history)
 
         if result == "updated":
             updated += 1
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Generate Mermaid erDiagram blocks in DD files from schema.prisma relations
+- Build the model relation graph once
+- For each DD file, take the models it references plus their one-hop neighbors
+- Render the subgraph as a Mermaid erDiagram between generated-block markers
+- Skip any block whose subgraph hash is unchanged, so tree-wide runs only rewrite what moved
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from docs_corpus import SCHEMA_PATH, Corpus, rel
+from verify_dd_against_schema import field_attribute, parse_prisma_models
+
+BLOCK_PATTERN = re.compile(
+    r'<!-- erd:begin hash=(\w+) -->\n.*?<!-- erd:end -->\n?', re.DOTALL)
+WORD_PATTERN = re.compile(r'\b\w+\b')
+ERD_SECTION = "## Entity Relationship Diagram"
+GENERATED_HEADING = "### Schema Relationships (Generated)"
+
+
+def build_relation_graph(models):
+    """Return relation edges keyed by model.
+
+    Each edge is a dict {'child', 'parent', 'fields', 'optional', 'unique'}
+    where child holds the foreign key fields referencing parent.
+    """
+    edges = []
+    for model_name, model in models.items():
+        for field in model['fields'].values():
+            args = field_attribute(field, 'relation')
+            if field['type'] not in models or not args:
+                continue
+            match = re.search(r'fields:\s*\[([^\]]*)\]', args)
+            if not match:
+                continue
+            fk_fields = [f.strip() for f in match.group(1).split(',')]
+            fk_defs = [model['fields'].get(f) for f in fk_fields]
+            edges.append({
+                'child': model_name,
+                'parent': field['type'],
+                'fields': fk_fields,
+                'optional': field['optional'],
+                'unique': len(fk_defs) == 1 and fk_defs[0] is not None
+                          and field_attribute(fk_defs[0], 'unique') is not None,
+            })
+
+    graph = defaultdict(list)
+    for edge in edges:
+        graph[edge['child']].append(edge)
+        if edge['parent'] != edge['child']:
+            graph[edge['parent']].append(edge)
+    return graph
+
+
+def subgraph(core, graph):
+    """Core models, their one-hop neighbors and the edges touching the core"""
+    edges = {}
+    for model in core:
+        for edge in graph.get(model, ()):
+            key = (edge['child'], edge['parent'], tuple(edge['fields']))
+            edges[key] = edge
+    nodes = set(core)
+    for edge in edges.values():
+        nodes.add(edge['child'])
+        nodes.add(edge['parent'])
+    return sorted(nodes), [edges[k] for k in sorted(edges)]
+
+
+def render_erd(core, nodes, edges, models):
+    """Render a Mermaid erDiagram; core models list their key columns"""
+    fk_fields = defaultdict(set)
+    for edge in edges:
+        fk_fields[edge['child']].update(edge['fields'])
+
+    out = ["```mermaid", "erDiagram"]
+    for edge in edges:
+        if edge['unique']:
+            right = 'o|'
+        else:
+            right = 'o{'
+        left = '|o' if edge['optional'] else '||'
+        label = ', '.join(edge['fields'])
+        out.append(f"    {edge['parent']} {left}--{right} {edge['child']} : \"{label}\"")
+
+    for name in nodes:
+        if name not in core:
+            continue
+        columns = []
+        for field_name, field in models[name]['fields'].items():
+            if field['type'] in models:
+                continue
+            keys = []
+            if field_attribute(field, 'id') is not None:
+                keys.append('PK')
+            if field_name in fk_fields[name]:
+                keys.append('FK')
+            if field_attribute(field, 'unique') is not None:
+                keys.append('UK')
+            if keys:
+                columns.append(f"        {field['type']} {field_name} {','.join(keys)}")
+        if columns:
+            out.append(f"    {name} {{")
+            out += columns
+            out.append("    }")
+        elif not edges:
+            out.append(f"    {name}")
+    out.append("```")
+    return '\n'.join(out)
+
+
+def subgraph_hash(core, nodes, edges, models):
+    """Stable digest of everything render_erd() reads"""
+    parts = [','.join(core), ','.join(nodes)]
+    for edge in edges:
+        parts.append(f"{edge['child']}>{edge['parent']}:{','.join(edge['fields'])}"
+                     f":{edge['optional']}:{edge['unique']}")
+    for name in core:
+        for field_name, field in models[name]['fields'].items():
+            parts.append(f"{name}.{field_name}:{field['type']}:{' '.join(field['attributes'])}")
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:12]
+
+
+def render_block(rendered, digest):
+    return (f"<!-- erd:begin hash={digest} -->\n"
+            f"{GENERATED_HEADING}\n\n"
+            "> Generated by `generate_dd_erd.py` from schema.prisma - do not edit by hand.\n\n"
+            f"{rendered}\n"
+            "<!-- erd:end -->\n")
+
+
+def insert_block(content, block):
+    """Place a new block at the end of the ERD section, or at the end of the file"""
+    start = content.find(f"\n{ERD_SECTION}\n")
+    if start != -1:
+        next_section = re.search(r'\n(## |---\n)', content[start + len(ERD_SECTION) + 2:])
+        if next_section:
+            at = start + len(ERD_SECTION) + 2 + next_section.start() + 1
+            return content[:at] + block + '\n' + content[at:]
+    return content.rstrip('\n') + '\n\n' + block
+
+
+def process_file(path, models, graph, corpus, write=True):
+    """Return 'unchanged', 'updated', 'created' or 'no_models'"""
+    content = corpus.read(path)
+
+    existing = BLOCK_PATTERN.search(content)
+    prose = BLOCK_PATTERN.sub('', content) if existing else content
+    core = sorted(set(WORD_PATTERN.findall(prose)) & models.keys())
+    if not core:
+        return 'no_models'
+
+    nodes, edges = subgraph(core, graph)
+    digest = subgraph_hash(core, nodes, edges, models)
+    if existing and existing.group(1) == digest:
+        return 'unchanged'
+
+    block = render_block(render_erd(core, nodes, edges, models), digest)
+    if existing:
+        new_content = content[:existing.start()] + block + content[existing.end():]
+        status = 'updated'
+    else:
+        new_content = insert_block(content, block)
+        status = 'created'
+
+    if write:
+        corpus.write(path, new_content)
+    return status
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--schema', type=Path, default=SCHEMA_PATH)
+    parser.add_argument('--check', action='store_true',
+                        help="Report stale blocks without writing; exit 1 if any")
+    parser.add_argument('files', nargs='*', type=Path, help="DD files (default: all)")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    models = parse_prisma_models(args.schema)
+    graph = build_relation_graph(models)
+    docs = args.files or corpus.find(('DD',))
+
+    results = defaultdict(list)
+    for doc in docs:
+        status = process_file(doc, models, graph, corpus, write=not args.check)
+        results[status].append(doc)
+        if status in ('updated', 'created'):
+            verb = 'Stale' if args.check else status.capitalize()
+            print(f"{'⚠️ ' if args.check else '✅'} {verb}: {rel(doc)}")
+
+    elapsed = time.perf_counter() - started
+    print(f"\n{'='*60}")
+    print(f"DD files scanned: {len(docs)}")
+    print(f"Blocks created: {len(results['created'])}")
+    print(f"Blocks updated: {len(results['updated'])}")
+    print(f"Blocks unchanged: {len(results['unchanged'])}")
+    print(f"Files without schema models: {len(results['no_models'])}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*60}")
+
+    if args.check and (results['created'] or results['updated']):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
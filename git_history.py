@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Streamed git history index shared by the docs tools
+- One `git log --name-only` traversal, parsed line by line as git writes it (no per-file git calls)
+- Index: path -> newest commit that touched it and path -> every commit that touched it (oldest
+  first), plus each commit's time, author and subject
+- Cached in .docs-cache/git-history.json together with the HEAD it was built at; later runs
+  read only the commits since then (cached_head..HEAD) and fold them in. If the cached head is
+  no longer an ancestor of HEAD (rebase, reset), the index is rebuilt from scratch
+"""
+
+import json
+import os
+import subprocess
+from collections import defaultdict, namedtuple
+
+from docs_corpus import CACHE_DIR, REPO_ROOT
+
+# Bump when the index layout changes so cached indexes are rebuilt
+INDEX_VERSION = 2
+INDEX_PATH = CACHE_DIR / 'git-history.json'
+RECORD, UNIT = '\x1e', '\x1f'
+LOG_FORMAT = f"{RECORD}%H{UNIT}%ct{UNIT}%an{UNIT}%s"
+
+Commit = namedtuple('Commit', 'sha time author subject')
+
+
+class GitError(RuntimeError):
+    pass
+
+
+def git(*args):
+    """stdout of a git command run at the repository root, or None if it fails"""
+    result = subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def head_commit():
+    return git('rev-parse', 'HEAD')
+
+
+def is_ancestor(old, new):
+    return subprocess.run(['git', 'merge-base', '--is-ancestor', old, new], cwd=REPO_ROOT,
+                          capture_output=True).returncode == 0
+
+
+def iter_log(revisions='HEAD'):
+    """Yield (Commit, [paths]) newest first from one streamed `git log --name-only`.
+
+    Paths are relative to the repository root (--relative), renames count as a delete plus an
+    add (--no-renames), and merge commits list no files.
+    """
+    command = ['git', '-c', 'core.quotePath=false', 'log', '--relative', '--no-renames',
+               '--name-only', f'--format={LOG_FORMAT}', revisions, '--']
+    with subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          text=True, encoding='utf-8', errors='replace') as proc:
+        commit, paths = None, []
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            if line.startswith(RECORD):
+                if commit:
+                    yield commit, paths
+                sha, time, author, subject = line[1:].split(UNIT, 3)
+                commit, paths = Commit(sha, int(time), author, subject), []
+            elif line and commit:
+                paths.append(line)
+        if commit:
+            yield commit, paths
+        error = proc.stderr.read()
+    if proc.returncode:
+        raise GitError(error.strip() or f"git log exited with {proc.returncode}")
+
+
+class GitIndex:
+    """
+    path -> newest commit touching it and path -> its commits, kept up to date incrementally.
+
+    update() reads only the commits HEAD gained since the last save; paths they touch are
+    newer than anything already indexed, so they replace their `last` entry and are appended
+    to their `history`.
+    """
+
+    def __init__(self, path=INDEX_PATH, rebuild=False):
+        self.path = path
+        self.head = None
+        self.commits = {}   # sha -> [time, author, subject]
+        self.last = {}      # path -> sha
+        self.history = {}   # path -> [sha], oldest first
+        self.read = 0       # commits read by the last update()
+        self.incremental = False
+        self._dirty = False
+        if path.exists() and not rebuild:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    self.head, self.commits = data['head'], data['commits']
+                    self.last, self.history = data['last'], data['history']
+            except (OSError, ValueError, KeyError):
+                self.head, self.commits, self.last, self.history = None, {}, {}, {}
+
+    def update(self):
+        """Fold in the commits since the cached head; returns the number of commits read"""
+        head = head_commit()
+        if head is None:
+            raise GitError(f"{REPO_ROOT} is not a git work tree")
+        self.read = 0
+        if head == self.head:
+            self.incremental = True
+            return 0
+        self.incremental = bool(self.head) and is_ancestor(self.head, head)
+        if not self.incremental:
+            self.commits, self.last, self.history = {}, {}, {}
+        revisions = f"{self.head}..{head}" if self.incremental else head
+
+        added = defaultdict(list)   # path -> new shas, newest first
+        for commit, paths in iter_log(revisions):
+            self.read += 1
+            if paths:
+                self.commits[commit.sha] = [commit.time, commit.author, commit.subject]
+            for path in paths:
+                added[path].append(commit.sha)
+        for path, shas in added.items():
+            self.last[path] = shas[0]
+            self.history.setdefault(path, []).extend(reversed(shas))
+        self.head = head
+        self._dirty = True
+        return self.read
+
+    def commit(self, sha):
+        return Commit(sha, *self.commits[sha]) if sha in self.commits else None
+
+    def last_commit(self, path):
+        """Newest Commit touching a repo-relative path, or None if git never saw it"""
+        sha = self.last.get(path)
+        return self.commit(sha) if sha else None
+
+    def history_of(self, path):
+        """Every Commit touching a repo-relative path, oldest first"""
+        return [self.commit(sha) for sha in self.history.get(path, ())]
+
+    def save(self):
+        if not self._dirty:
+            return
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'head': self.head,
+                       'commits': self.commits, 'last': self.last, 'history': self.history}, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
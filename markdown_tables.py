@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Parse, validate and reformat Markdown pipe tables across the docs
+- Parse every table (Document History, field tables, rule matrices) into column arrays
+- Validate each row's column count against the header
+- Compute column widths column-wise and realign (or compact) all tables in one pass
+- Output is stable: an already-formatted table renders byte-identically and the file is not rewritten
+"""
+
+import argparse
+import sys
+import time
+import unicodedata
+from collections import Counter
+
+from docs_corpus import Corpus, rel
+
+FENCE_MARKERS = ('```', '~~~')
+
+
+def split_row(line):
+    """Split a Markdown table row into stripped cells (escaped pipes stay in the cell)"""
+    text = line.strip()
+    if text.startswith('|'):
+        text = text[1:]
+    if text.endswith('|') and not text.endswith('\\|'):
+        text = text[:-1]
+    if '\\' not in text:
+        return [c.strip() for c in text.split('|')]
+    cells = []
+    current = ''
+    i = 0
+    while i < len(text):
+        if text[i] == '\\' and i + 1 < len(text):
+            current += text[i:i + 2]
+            i += 2
+            continue
+        if text[i] == '|':
+            cells.append(current.strip())
+            current = ''
+        else:
+            current += text[i]
+        i += 1
+    cells.append(current.strip())
+    return cells
+
+
+def is_delimiter_row(cells):
+    return bool(cells) and all(
+        c and set(c) <= set('-: ') and '-' in c for c in cells
+    )
+
+
+def display_width(text):
+    """Columns a string occupies in a monospace editor (wide chars count 2, combining marks 0)"""
+    if text.isascii():
+        return len(text)
+    width = 0
+    for ch in text:
+        if unicodedata.combining(ch) or unicodedata.category(ch) in ('Mn', 'Me', 'Cf') \
+                or 0xFE00 <= ord(ch) <= 0xFE0F:
+            continue
+        width += 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+    return width
+
+
+class Table:
+    """A pipe table stored column-wise"""
+
+    __slots__ = ('start', 'end', 'indent', 'header', 'alignments', 'columns', 'row_lengths')
+
+    def __init__(self, start, end, indent, header, alignments, rows):
+        self.start = start          # index of the header line
+        self.end = end              # index one past the last row
+        self.indent = indent
+        self.header = header
+        self.alignments = alignments
+        self.row_lengths = [len(r) for r in rows]
+        width = len(header)
+        padded = [r + [''] * (width - len(r)) for r in rows]
+        self.columns = [list(col) for col in zip(*padded)] if padded else [[] for _ in header]
+
+    @property
+    def width(self):
+        return len(self.header)
+
+    def errors(self):
+        """(row_number, cell_count) for rows whose column count differs from the header"""
+        return [
+            (i + 1, n) for i, n in enumerate(self.row_lengths) if n != self.width
+        ]
+
+    def render(self, compact=False):
+        """Render the table; rows with too many cells make the table unrenderable (None)"""
+        if any(n > self.width for n in self.row_lengths):
+            return None
+
+        if compact:
+            widths = [0] * self.width
+        else:
+            widths = [
+                max([display_width(self.header[i]), 3] + [display_width(c) for c in col])
+                for i, col in enumerate(self.columns)
+            ]
+
+        def line(cells):
+            padded = [c + ' ' * (w - display_width(c)) for c, w in zip(cells, widths)]
+            return f"{self.indent}| " + ' | '.join(padded) + ' |'
+
+        def delimiter(align, w):
+            left = ':' if align in ('left', 'center') else '-'
+            right = ':' if align in ('right', 'center') else '-'
+            return left + '-' * (w - 2) + right
+
+        out = [line(self.header)]
+        out.append(f"{self.indent}|" + '|'.join(
+            delimiter(a, 3 if compact else w + 2)
+            for a, w in zip(self.alignments, widths)) + '|')
+        for row in zip(*self.columns):
+            out.append(line(list(row)))
+        return out
+
+
+def alignment_of(cell):
+    cell = cell.strip()
+    if cell.startswith(':') and cell.endswith(':'):
+        return 'center'
+    if cell.endswith(':'):
+        return 'right'
+    if cell.startswith(':'):
+        return 'left'
+    return None
+
+
+def parse_tables(lines):
+    """Find all pipe tables outside fenced code blocks"""
+    tables = []
+    in_fence = False
+    i = 0
+    while i < len(lines):
+        stripped = lines[i].lstrip()
+        if stripped.startswith(FENCE_MARKERS):
+            in_fence = not in_fence
+            i += 1
+            continue
+        if in_fence or not stripped.startswith('|') or i + 1 >= len(lines):
+            i += 1
+            continue
+
+        delimiter = split_row(lines[i + 1])
+        if not lines[i + 1].lstrip().startswith('|') or not is_delimiter_row(delimiter):
+            i += 1
+            continue
+
+        indent = lines[i][:len(lines[i]) - len(stripped)]
+        header = split_row(lines[i])
+        alignments = [alignment_of(c) for c in delimiter]
+        alignments += [None] * (len(header) - len(alignments))
+        alignments = alignments[:len(header)]
+
+        end = i + 2
+        rows = []
+        while end < len(lines) and lines[end].lstrip().startswith('|'):
+            rows.append(split_row(lines[end]))
+            end += 1
+        tables.append(Table(i, end, indent, header, alignments, rows))
+        i = end
+    return tables
+
+
+def format_content(content, compact=False):
+    """Return (new_content, tables, issues); new_content is content itself when nothing changes"""
+    lines = content.split('\n')
+    tables = parse_tables(lines)
+    issues = []
+    replacements = []
+    for table in tables:
+        for row, count in table.errors():
+            issues.append((table.start + 2 + row, f"row has {count} cells, header has {table.width}"))
+        rendered = table.render(compact)
+        if rendered is None:
+            continue
+        if rendered != lines[table.start:table.end]:
+            replacements.append((table, rendered))
+
+    if not replacements:
+        return content, tables, issues
+    for table, rendered in reversed(replacements):
+        lines[table.start:table.end] = rendered
+    return '\n'.join(lines), tables, issues
+
+
+def format_file(path, compact=False):
+    """Process-pool worker: (path, new_content or None, table_count, issues)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    new_content, tables, issues = format_content(content, compact)
+    return path, (new_content if new_content != content else None), len(tables), issues
+
+
+def format_file_compact(path):
+    return format_file(path, compact=True)
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--check', action='store_true',
+                        help="Report tables that would change and column-count errors; exit 1 if any")
+    parser.add_argument('--compact', action='store_true',
+                        help="Minimal padding instead of aligned columns")
+    parser.add_argument('files', nargs='*', help="Markdown files (default: whole corpus)")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    files = args.files or [f for f in corpus.files() if f.suffix == '.md']
+    worker = format_file_compact if args.compact else format_file
+
+    stats = Counter()
+    for path, new_content, table_count, issues in corpus.map(worker, files):
+        stats['files'] += 1
+        stats['tables'] += table_count
+        for line_no, message in issues:
+            stats['issues'] += 1
+            print(f"❌ {rel(path)}:{line_no}: {message}")
+        if new_content is None:
+            continue
+        stats['changed'] += 1
+        if args.check:
+            print(f"⚠️  Would reformat: {rel(path)}")
+        else:
+            corpus.write(path, new_content)
+            print(f"✅ Reformatted: {rel(path)}")
+
+    elapsed = time.perf_counter() - started
+    print(f"\n{'='*70}")
+    print(f"Files scanned: {stats['files']}")
+    print(f"Tables parsed: {stats['tables']}")
+    print(f"Column-count errors: {stats['issues']}")
+    print(f"Files {'needing reformat' if args.check else 'reformatted'}: {stats['changed']}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*70}")
+
+    if args.check and (stats['changed'] or stats['issues']):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
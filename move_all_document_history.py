@@ -4,10 +4,16 @@ Move all Document History sections from end/middle to beginning
 """
 
 import re
-from pathlib import Path
 
-def move_document_history(file_path):
-    """Move Document History section from anywhere to beginning"""
+from doc_metadata import MetadataIndex
+from docs_corpus import DOCS_APP_DIR, Corpus
+
+def move_document_history(file_path, status_line=None):
+    """Move Document History section from anywhere to beginning
+
+    status_line is the 1-based line of the first Status / Document Status
+    metadata line from the metadata index, if known.
+    """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -76,15 +82,23 @@ def move_document_history(file_path):
         # Find insertion point (after Document Information/Module Information section)
         insertion_index = None
 
-        # Strategy 1: Look for Status line
-        for i, line in enumerate(new_lines):
-            if ('**Status**:' in line or '**Document Status**:' in line or
-                '- **Status**:' in line or '- **Document Status**:' in line):
-                insertion_index = i + 1
-                # Skip blank lines
-                while insertion_index < len(new_lines) and new_lines[insertion_index].strip() == '':
-                    insertion_index += 1
-                break
+        # Strategy 1: Look for Status line (indexed offsets shift up past the removed section)
+        if status_line is not None:
+            status_index = status_line - 1
+            if doc_history_start <= status_index < doc_history_end:
+                status_index = None
+            elif status_index >= doc_history_end:
+                status_index -= doc_history_end - doc_history_start
+            candidates = [status_index] if status_index is not None else []
+        else:
+            candidates = (i for i, line in enumerate(new_lines)
+                          if '**Status**:' in line or '**Document Status**:' in line)
+        for i in candidates:
+            insertion_index = i + 1
+            # Skip blank lines
+            while insertion_index < len(new_lines) and new_lines[insertion_index].strip() == '':
+                insertion_index += 1
+            break
 
         # Strategy 2: Look for --- after document metadata
         if insertion_index is None:
@@ -158,11 +172,13 @@ def move_document_history(file_path):
         return f"error: {str(e)}", None
 
 def main():
-    docs_app_dir = Path('/Users/peak/Documents/GitHub/carmen/docs/app')
+    docs_app_dir = DOCS_APP_DIR
 
-    # Get all markdown files, exclude template-guide
-    md_files = [f for f in docs_app_dir.rglob('*.md')
-                if 'template-guide' not in str(f)]
+    # Get all markdown files (template-guide is excluded by the docs root config)
+    corpus = Corpus()
+    md_files = corpus.files(docs_app_dir)
+    index = MetadataIndex()
+    index.refresh(corpus)
 
     print(f"Scanning {len(md_files)} files in docs/app...")
     print(f"Moving Document History sections to beginning...\n")
@@ -173,26 +189,17 @@ def main():
     errors = []
 
     for md_file in sorted(md_files):
-        # Check position first
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                lines = f.read().split('\n')
-
-            doc_history_line = None
-            for i, line in enumerate(lines, 1):
-                if line.strip() == "## Document History":
-                    doc_history_line = i
-                    break
-
-            # Skip if already at beginning (first 30 lines) or no history
-            if doc_history_line is None or doc_history_line <= 30:
-                continue
+        # Check position first, from the index
+        document = index.document(md_file)
+        doc_history_line = document['history_line'] if document else None
 
-        except:
+        # Skip if already at beginning (first 30 lines) or no history
+        if doc_history_line is None or doc_history_line <= 30:
             continue
 
         relative_path = md_file.relative_to(docs_app_dir)
-        result, old_line = move_document_history(md_file)
+        status_line = index.first_line(md_file, ['Status', 'Document Status'])
+        result, old_line = move_document_history(md_file, status_line)
 
         if result == "success":
             success_count += 1
@@ -209,6 +216,8 @@ def main():
             errors.append((relative_path, "Could not find insertion point"))
             print(f"⚠️  {relative_path}: Could not find insertion point")
 
+    index.close()
+
     print(f"\n{'='*70}")
     print(f"SUMMARY")
     print(f"{'='*70}")
@@ -6,12 +6,14 @@ Move Document History sections from end to beginning of files
 import re
 from pathlib import Path
 
+from docs_corpus import DOCS_DIR
+
 files_to_process = [
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-portal/BR-vendor-portal.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-portal/DD-vendor-portal.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-portal/FD-vendor-portal.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-portal/TS-vendor-portal.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/vendor-management/vendor-portal/UC-vendor-portal.md",
+    str(DOCS_DIR / "app/vendor-management/vendor-portal/BR-vendor-portal.md"),
+    str(DOCS_DIR / "app/vendor-management/vendor-portal/DD-vendor-portal.md"),
+    str(DOCS_DIR / "app/vendor-management/vendor-portal/FD-vendor-portal.md"),
+    str(DOCS_DIR / "app/vendor-management/vendor-portal/TS-vendor-portal.md"),
+    str(DOCS_DIR / "app/vendor-management/vendor-portal/UC-vendor-portal.md"),
 ]
 
 def move_document_history(file_path):
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Find copy-pasted and drifting sections across the documentation corpus
+- Split every document into sections at ## / ### headings
+- Shingle each section into word 5-grams and sketch it with MinHash
+- Index sketches with LSH banding so only likely matches are compared (roughly linear, no pairwise diff)
+- Report clusters of near-duplicate sections with similarity scores
+
+MinHash uses one-permutation hashing with rotation densification: each shingle
+is hashed once and routed to one of NUM_HASHES bins, instead of being hashed
+NUM_HASHES times.
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import zlib
+from collections import defaultdict
+from itertools import combinations
+
+from docs_corpus import Corpus, rel
+
+SHINGLE_SIZE = 5
+NUM_HASHES = 128
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+BIN_BITS = NUM_HASHES.bit_length() - 1
+MAX_VALUE = (1 << (64 - BIN_BITS)) - 1
+DEFAULT_THRESHOLD = 0.8
+HASH_SEED = 0x9E3779B9
+
+# Sections that are meant to repeat in every document
+IGNORED_HEADINGS = {'document history', 'related documents', 'table of contents'}
+
+HEADING_PATTERN = re.compile(r'^(#{2,3})\s+(.*)$')
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def split_sections(content):
+    """Yield (line_no, heading, body) for each ##/### section outside code fences"""
+    heading, start, body = None, 0, []
+    in_fence = False
+    for line_no, line in enumerate(content.split('\n'), 1):
+        if line.lstrip().startswith('```'):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_PATTERN.match(line)
+        if match:
+            if heading is not None:
+                yield start, heading, '\n'.join(body)
+            heading, start, body = match.group(2).strip(), line_no, []
+        elif heading is not None:
+            body.append(line)
+    if heading is not None:
+        yield start, heading, '\n'.join(body)
+
+
+def shingle_hashes(words):
+    """64-bit hashes of the word k-grams (two seeded CRC32s; stable across processes, unlike hash())"""
+    hashes = set()
+    for i in range(len(words) - SHINGLE_SIZE + 1):
+        shingle = ' '.join(words[i:i + SHINGLE_SIZE]).encode('utf-8')
+        hashes.add(zlib.crc32(shingle, HASH_SEED) << 32 | zlib.crc32(shingle))
+    return hashes
+
+
+def minhash(hashes):
+    """One-permutation MinHash signature (tuple of NUM_HASHES ints)"""
+    empty = MAX_VALUE + 1
+    bins = [empty] * NUM_HASHES
+    mask = NUM_HASHES - 1
+    for h in hashes:
+        b = h & mask
+        v = h >> BIN_BITS
+        if v < bins[b]:
+            bins[b] = v
+    # Densify: an empty bin borrows the next filled bin's value, offset by distance
+    filled = {i for i, v in enumerate(bins) if v != empty}
+    if len(filled) < NUM_HASHES:
+        for i in range(NUM_HASHES):
+            if bins[i] != empty:
+                continue
+            for step in range(1, NUM_HASHES):
+                j = (i + step) % NUM_HASHES
+                if j in filled:
+                    bins[i] = bins[j] + step * (MAX_VALUE + 1)
+                    break
+    return tuple(bins)
+
+
+def section_signatures(path, min_words=40, include_all=False):
+    """Process-pool worker: (path, [(line, heading, words, signature), ...])"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    results = []
+    for line_no, heading, body in split_sections(content):
+        if not include_all and heading.lower().strip('# ') in IGNORED_HEADINGS:
+            continue
+        words = WORD_PATTERN.findall(body.lower())
+        if len(words) < min_words:
+            continue
+        results.append((line_no, heading, len(words), minhash(shingle_hashes(words))))
+    return path, results
+
+
+def section_signatures_all(path):
+    return section_signatures(path, include_all=True)
+
+
+def similarity(a, b):
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_HASHES
+
+
+def lsh_candidates(signatures, max_bucket=500):
+    """Candidate pairs sharing at least one LSH band"""
+    buckets = defaultdict(list)
+    for sid, sig in enumerate(signatures):
+        for band in range(BANDS):
+            key = (band, sig[band * ROWS:(band + 1) * ROWS])
+            buckets[key].append(sid)
+
+    pairs = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        # Very large buckets are boilerplate; compare each member with the first few only
+        if len(members) > max_bucket:
+            anchors = members[:8]
+            pairs.update((min(a, m), max(a, m)) for a in anchors for m in members if a != m)
+        else:
+            pairs.update(combinations(members, 2))
+    return pairs
+
+
+def cluster(edges):
+    """Union-find over similar pairs; returns [(section ids, pair scores)]"""
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in edges:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+
+    members = defaultdict(set)
+    scores = defaultdict(list)
+    for (a, b), score in edges.items():
+        root = find(a)
+        members[root].update((a, b))
+        scores[root].append(score)
+    return [(sorted(members[root]), scores[root]) for root in members]
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Minimum estimated Jaccard similarity (default: %(default)s)")
+    parser.add_argument('--include-all', action='store_true',
+                        help="Also compare sections that repeat by design (Document History, ...)")
+    parser.add_argument('--cross-file', action='store_true',
+                        help="Only report clusters spanning more than one file")
+    parser.add_argument('--json', action='store_true', help="Print clusters as JSON")
+    parser.add_argument('--limit', type=int, default=50, help="Clusters to print (default: %(default)s)")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    files = [f for f in corpus.files() if f.suffix == '.md']
+    worker = section_signatures_all if args.include_all else section_signatures
+
+    sections = []
+    signatures = []
+    for path, results in corpus.map(worker, files):
+        for line_no, heading, words, sig in results:
+            sections.append((rel(path), line_no, heading, words))
+            signatures.append(sig)
+
+    candidates = lsh_candidates(signatures)
+    edges = {}
+    for a, b in candidates:
+        score = similarity(signatures[a], signatures[b])
+        if score >= args.threshold:
+            edges[(a, b)] = score
+
+    clusters = []
+    for members, pair_scores in cluster(edges):
+        files_in_cluster = {sections[m][0] for m in members}
+        if args.cross_file and len(files_in_cluster) < 2:
+            continue
+        clusters.append({
+            'size': len(members),
+            'files': len(files_in_cluster),
+            'min_similarity': round(min(pair_scores), 3),
+            'max_similarity': round(max(pair_scores), 3),
+            'sections': [
+                {'file': sections[m][0], 'line': sections[m][1],
+                 'heading': sections[m][2], 'words': sections[m][3]}
+                for m in members
+            ],
+        })
+    clusters.sort(key=lambda c: (-c['size'], -c['max_similarity'], c['sections'][0]['file']))
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps(clusters, indent=2))
+        return 0
+
+    print("NEAR-DUPLICATE SECTIONS")
+    print(f"{'='*80}")
+    for i, c in enumerate(clusters[:args.limit], 1):
+        print(f"\n#{i} {c['size']} sections in {c['files']} file(s), "
+              f"similarity {c['min_similarity']:.2f}-{c['max_similarity']:.2f}")
+        for s in c['sections']:
+            print(f"   • {s['file']}:{s['line']}  {s['heading']}")
+    if len(clusters) > args.limit:
+        print(f"\n... and {len(clusters) - args.limit} more clusters (use --json for all)")
+
+    print(f"\n{'='*80}")
+    print("SUMMARY")
+    print(f"{'='*80}")
+    print(f"Files scanned: {len(files)}")
+    print(f"Sections sketched: {len(sections)}")
+    print(f"LSH candidate pairs: {len(candidates)}")
+    print(f"Similar pairs (>= {args.threshold}): {len(edges)}")
+    print(f"Clusters: {len(clusters)}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Rank the DB service queries by how much they fetch and find per-element queries in loops
+- Walks each call's include/select tree over the parsed Prisma relation graph and estimates
+  its join fan-out (rows per call) and width (columns per row)
+- Flags includes that pull every column of a relation where the code reads only a few (a
+  `select` would do), and nested to-many includes whose row counts multiply
+- Flags N+1 patterns: a query inside a for/while loop or .map()/.forEach() callback, directly
+  or through a service method that runs one
+- Ends with the heaviest include trees ranked by estimated cells (rows x columns)
+
+Estimates, not measurements: a to-many relation is assumed to return --fanout rows unless its
+`take` says otherwise, and relations of unknown models are assumed --columns wide.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from docs_corpus import Corpus, rel
+from findings import finding, report
+from prisma_queries import (READ_OPERATIONS, SERVICES_DIR, enclosing_function,
+                            extract_queries, line_of, load_schema, matching_close, relation_args,
+                            service_files)
+
+DEFAULT_FANOUT = 10
+DEFAULT_PAGE = 50
+DEFAULT_COLUMNS = 12
+OVER_FETCH_FIELDS = 3
+SINGLE_ROW = ('findUnique', 'findUniqueOrThrow', 'findFirst', 'findFirstOrThrow',
+              'create', 'update', 'upsert', 'delete')
+
+LOOP_START = re.compile(
+    r'\b(?P<kw>for|while)\s*\('
+    r'|\.(?P<method>map|forEach|flatMap|filter|reduce|some|every|find)\s*\(\s*(?=(?:async\s*)?(?:\(|\w+\s*=>))')
+SERVICE_CALL = re.compile(r'\b(?:this|[a-z]\w*Service)\s*\.\s*(\w+)\s*\(')
+
+
+# ---------------------------------------------------------------------------
+# Per-file scan (process-pool worker)
+
+def loop_spans(source):
+    """[(start, end, kind)] offsets of loop bodies: for/while blocks and iterator callbacks"""
+    spans = []
+    for match in LOOP_START.finditer(source):
+        open_paren = match.end() - 1 if match.group('kw') else source.index('(', match.start())
+        close = matching_close(source, open_paren)
+        if match.group('kw'):
+            body = re.match(r'\s*\{', source[close:])
+            end = matching_close(source, close + body.end() - 1) if body else source.find('\n', close)
+            spans.append((match.start(), end, match.group('kw')))
+        else:
+            spans.append((match.start(), close, f".{match.group('method')}()"))
+    return spans
+
+
+def relation_usage(source, key):
+    """(fields read from relation `key`, iterated) from x.key.map(r => r.f), for (r of x.key), x.key.f
+
+    iterated says the code loops over the relation, i.e. it is to-many.
+    """
+    used = set()
+    iterated = False
+    escaped = re.escape(key)
+    callback = re.compile(r'\.' + escaped + r'\b\s*(?:\|\|\s*\[\]\s*\)\s*)?\??\.\s*'
+                          r'(?:map|forEach|filter|reduce|some|find)\s*(?P<open>\()\s*(?:async\s*)?\(?\s*(?P<var>\w+)')
+    for_of = re.compile(r'\bfor\s*(?P<open>\()\s*(?:const|let)\s+(?P<var>\w+)\s+of\s+[\w.?]*\.' + escaped + r'\b')
+    for pattern in (callback, for_of):
+        for match in pattern.finditer(source):
+            end = matching_close(source, match.start('open'))
+            if pattern is for_of:
+                body = re.match(r'\s*\{', source[end:])
+                end = matching_close(source, end + body.end() - 1) if body else source.find('\n', end)
+            iterated = True
+            body = source[match.end():end]
+            used.update(re.findall(r'\b' + re.escape(match.group('var')) + r'\??\.(\w+)', body))
+    # to-one relations read directly: x.key.field
+    used.update(re.findall(r'\.' + escaped + r'\??\.(\w+)\b(?!\s*\()', source))
+    return sorted(used), iterated
+
+
+def include_keys(args, depth=0):
+    keys = set()
+    for clause in ('include', 'select'):
+        entries = args.get(clause)
+        if isinstance(entries, dict) and depth < 5:
+            for key, value in entries.items():
+                if isinstance(key, str) and key not in ('...', '_count'):
+                    keys.add(key)
+                    keys |= include_keys(relation_args(value), depth + 1)
+    return keys
+
+
+def scan_file(path):
+    """Worker: queries, loop spans (as lines, with the service methods they call) and the call graph"""
+    source = Path(path).read_text(encoding='utf-8', errors='replace')
+    queries = extract_queries(path)
+
+    loops = []
+    for start, end, kind in loop_spans(source):
+        calls = set(SERVICE_CALL.findall(source, start, end))
+        loops.append((line_of(source, start), line_of(source, end), kind, calls))
+
+    calls = {}
+    for match in SERVICE_CALL.finditer(source):
+        _, function = enclosing_function(source, match.start())
+        if function:
+            calls.setdefault(function, set()).add(match.group(1))
+
+    keys = set().union(*(include_keys(q.args) for q in queries)) if queries else set()
+    usage = {key: relation_usage(source, key) for key in sorted(keys)}
+    return path, {'queries': queries, 'loops': loops, 'calls': calls, 'usage': usage}
+
+
+# ---------------------------------------------------------------------------
+# Include trees
+
+class Node:
+    """One relation in an include tree with its estimated rows per call and columns per row"""
+
+    def __init__(self, key, model, rows, columns, to_many, selected, depth, under_many=False):
+        self.key = key
+        self.model = model
+        self.rows = rows
+        self.columns = columns
+        self.to_many = to_many
+        self.selected = selected
+        self.depth = depth
+        self.under_many = under_many    # below another to-many relation: row counts multiply
+        self.children = []
+
+    @property
+    def cells(self):
+        return self.rows * self.columns + sum(c.cells for c in self.children)
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def describe(self, indent=''):
+        many = '[]' if self.to_many else ''
+        model = self.model or '?'
+        lines = [f"{indent}{self.key}{many} → {model}: ~{self.rows:g} row(s) x {self.columns} col(s)"
+                 + ('' if self.selected else ' (all columns)')]
+        for child in self.children:
+            lines += child.describe(indent + '    ')
+        return lines
+
+
+def take_of(args):
+    take = args.get('take')
+    return int(take) if isinstance(take, str) and take.strip().isdigit() else None
+
+
+def width(schema, model, args, default_columns):
+    """(columns, selected) for rows of model fetched with args"""
+    select = args.get('select')
+    if isinstance(select, dict):
+        scalars = [k for k in select if isinstance(k, str) and k not in ('...', '_count')
+                   and not (model and schema.relation(model, k))]
+        return max(len(scalars), 1), True
+    return (len(schema.scalar_fields(model)) if model else default_columns), False
+
+
+def build_tree(schema, query, usage, fanout, default_columns):
+    """Node tree for one call; usage is {relation key: (fields read, iterated)} from its file"""
+    model = schema.model_for(query.accessor)
+    rows = 1 if query.operation in SINGLE_ROW else (take_of(query.args) or DEFAULT_PAGE)
+    columns, selected = width(schema, model, query.args, default_columns)
+    root = Node(query.accessor, model, rows, columns, query.operation not in SINGLE_ROW, selected, 0)
+    add_children(schema, root, query.args, usage, fanout, default_columns)
+    return root
+
+
+def add_children(schema, node, args, usage, fanout, default_columns):
+    if node.depth > 4:
+        return
+    for clause in ('include', 'select'):
+        entries = args.get(clause)
+        if not isinstance(entries, dict):
+            continue
+        for key, value in entries.items():
+            if not isinstance(key, str) or key in ('...', '_count'):
+                continue
+            relation = schema.relation(node.model, key) if node.model else None
+            if relation:
+                field, target = relation
+                to_many = schema.field(node.model, field)['list']
+            elif clause == 'select' and value == 'true':
+                continue    # a selected scalar column
+            else:
+                # Model not in the schema: the relation is to-many if the code loops over it
+                target = schema.model_for(key)
+                to_many = usage.get(key, ((), False))[1]
+            nested = relation_args(value)
+            per_parent = (take_of(nested) or fanout) if to_many else 1
+            columns, selected = width(schema, target, nested, default_columns)
+            child = Node(key, target, node.rows * per_parent, columns, to_many, selected, node.depth + 1,
+                         under_many=node.depth > 0 and (node.to_many or node.under_many))
+            node.children.append(child)
+            add_children(schema, child, nested, usage, fanout, default_columns)
+
+
+# ---------------------------------------------------------------------------
+# Findings
+
+def reads_closure(scans):
+    """{function name: 'accessor.operation'} for functions that run a read, directly or via calls"""
+    reads = {}
+    calls = {}
+    for scan in scans.values():
+        for query in scan['queries']:
+            if query.function and query.operation in READ_OPERATIONS:
+                reads.setdefault(query.function, f"{query.accessor}.{query.operation}")
+        for function, called in scan['calls'].items():
+            calls.setdefault(function, set()).update(called)
+    changed = True
+    while changed:
+        changed = False
+        for function, called in calls.items():
+            if function in reads:
+                continue
+            via = next((c for c in sorted(called) if c in reads and c != function), None)
+            if via:
+                reads[function] = f"{via}() → {reads[via]}"
+                changed = True
+    return reads
+
+
+def innermost_loop(loops, line):
+    inside = [loop for loop in loops if loop[0] <= line <= loop[1]]
+    return min(inside, key=lambda loop: loop[1] - loop[0]) if inside else None
+
+
+def loop_findings(path, scan, reads):
+    file = rel(path)
+    for query in scan['queries']:
+        loop = innermost_loop(scan['loops'], query.line)
+        if not loop:
+            continue
+        call = f"{query.accessor}.{query.operation}"
+        if query.operation in READ_OPERATIONS:
+            yield finding(file, 'n-plus-one', 'warning',
+                          f"{call} runs once per element of the {loop[2]} loop at line {loop[0]}; "
+                          f"fetch the batch with one findMany (where: {{ id: {{ in: ... }} }})",
+                          line=query.line)
+        else:
+            yield finding(file, 'write-in-loop', 'info',
+                          f"{call} runs once per element of the {loop[2]} loop at line {loop[0]}; "
+                          f"consider createMany/updateMany or one $transaction", line=query.line)
+    for start, end, kind, called in scan['loops']:
+        for name in sorted(called):
+            if name in reads:
+                yield finding(file, 'n-plus-one', 'warning',
+                              f"{kind} loop calls {name}() per element, which runs {reads[name]}",
+                              line=start, end_line=end)
+
+
+def fetch_findings(path, scan, schema, fanout, default_columns, trees):
+    file = rel(path)
+    for query in scan['queries']:
+        if not query.args.get('include') and not isinstance(query.args.get('select'), dict):
+            continue
+        root = build_tree(schema, query, scan['usage'], fanout, default_columns)
+        if not root.children:
+            continue
+        trees.append((root.cells, file, query, root))
+        for node in root.walk():
+            if node is root:
+                continue
+            used = set(scan['usage'].get(node.key, ((), False))[0])
+            if node.model:
+                used &= set(schema.scalar_fields(node.model))
+            # Known width: flag reading at most half the columns; unknown: only a handful read
+            narrow = 2 * len(used) <= node.columns if node.model else len(used) <= OVER_FETCH_FIELDS
+            if not node.selected and used and narrow:
+                columns = f"all {node.columns} columns of {node.model}" if node.model else "every column"
+                yield finding(file, 'over-fetch', 'warning' if node.to_many else 'info',
+                              f"include {node.key} pulls {columns} but the code reads {len(used)} "
+                              f"({', '.join(sorted(used))}); select them", line=query.line)
+            if node.to_many and node.under_many:
+                yield finding(file, 'nested-fan-out', 'warning',
+                              f"{query.accessor}.{query.operation}: to-many {node.key} under a to-many "
+                              f"relation multiplies to ~{node.rows:g} rows per call", line=query.line)
+
+
+def iter_findings(scans, schema, fanout, default_columns, trees):
+    reads = reads_closure(scans)
+    for path, scan in scans.items():
+        found = list(loop_findings(path, scan, reads))
+        found += fetch_findings(path, scan, schema, fanout, default_columns, trees)
+        yield from sorted(found, key=lambda f: f.span)
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--schema', action='append',
+                        help="schema.prisma with the relation graph (repeatable; default: "
+                             "docs/app/data-struc/schema.prisma and prisma/schema.prisma)")
+    parser.add_argument('--services', default=str(SERVICES_DIR), help="Folder of TS services to scan")
+    parser.add_argument('--fanout', type=int, default=DEFAULT_FANOUT,
+                        help=f"Rows assumed per to-many relation (default: {DEFAULT_FANOUT})")
+    parser.add_argument('--columns', type=int, default=DEFAULT_COLUMNS,
+                        help=f"Columns assumed for models missing from the schema (default: {DEFAULT_COLUMNS})")
+    parser.add_argument('--top', type=int, default=10, help="Include trees to show in the ranking")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    schema = load_schema(args.schema)
+    scans = dict(corpus.map(scan_file, service_files(args.services)))
+    trees = []
+    findings = iter_findings(scans, schema, args.fanout, args.columns, trees)
+
+    if args.ndjson:
+        report(findings, ndjson=True)
+        return 0
+
+    print(f"Scanning {sum(len(s['queries']) for s in scans.values())} Prisma call(s) "
+          f"in {len(scans)} service file(s)...\n")
+    counts = report(findings).by_rule
+
+    if trees:
+        trees.sort(key=lambda t: (-t[0], t[1], t[2].line))
+        print(f"\n{'='*70}")
+        print(f"HEAVIEST INCLUDE TREES (estimated cells per call, fan-out {args.fanout})")
+        print(f"{'='*70}")
+        for cells, file, query, root in trees[:args.top]:
+            print(f"\n~{cells:,.0f} cells  {file}:{query.line} {query.function or ''}()")
+            for line in root.describe('    '):
+                print(line)
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Include trees: {len(trees)}")
+    print(f"⚠️  N+1 queries in loops: {counts['n-plus-one']}")
+    print(f"ℹ️  Writes in loops: {counts['write-in-loop']}")
+    print(f"⚠️  Whole-relation includes where a select would do: {counts['over-fetch']}")
+    print(f"⚠️  Nested to-many fan-out: {counts['nested-fan-out']}")
+    print(f"{'='*70}")
+    return 1 if counts['n-plus-one'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Check that the columns the DB services filter, sort and join on are indexed
+- Extracts each Prisma call's where/orderBy/include shape from lib/services/db (prisma_queries)
+- Joins it against the @id/@unique/@@index entries of the parsed schema models
+- Reports unindexed filter and sort columns and unindexed relation foreign keys
+- Ends with a suggested @@index list per model, ranked by the number of call sites
+
+Equality filters count as an index prefix: where {status, department_id} orderBy request_date
+is served by @@index([status, request_date]). Unique lookups (findUnique, where {id}) are skipped.
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+
+from docs_corpus import Corpus, rel
+from findings import finding, report
+from prisma_queries import (READ_OPERATIONS, SERVICES_DIR, extract_queries, filter_columns,
+                            load_schema, relation_args, service_files, sort_orders)
+
+FILTERED_OPERATIONS = READ_OPERATIONS + ('updateMany', 'deleteMany')
+EQUALITY = ('eq', 'in')
+
+
+class Advisor:
+    """Turns queries into findings and collects the indexes that would fix them"""
+
+    def __init__(self, schema):
+        self.schema = schema
+        # model -> columns tuple -> {(file, line, function)}
+        self.suggestions = defaultdict(lambda: defaultdict(set))
+
+    def suggest(self, model, columns, query):
+        self.suggestions[model][tuple(columns)].add((rel(query.file), query.line, query.function))
+
+    def check(self, query):
+        """Yield findings for one query"""
+        here = dict(line=query.line)
+        where = f"{query.accessor}.{query.operation}" + (f" in {query.function}()" if query.function else "")
+        model = self.schema.model_for(query.accessor)
+        if model is None:
+            if query.operation in FILTERED_OPERATIONS:
+                yield finding(rel(query.file), 'unknown-model', 'info',
+                              f"{where}: no schema model for '{query.accessor}'", **here)
+            return
+        if query.operation in FILTERED_OPERATIONS:
+            yield from self.check_filter(model, query.args, query, where)
+        yield from self.check_relations(model, query.args, query, where)
+
+    def check_filter(self, model, args, query, where, eq_prefix=(), label=None):
+        """Filter and sort columns of one (possibly nested) where/orderBy pair"""
+        file, here = rel(query.file), dict(line=query.line)
+        label = label or model
+        columns, unknown = [], []
+        for column, kind in filter_columns(args.get('where')):
+            field = self.schema.field(model, column)
+            if field is None:
+                unknown.append(column)
+            elif field['type'] not in self.schema.models:
+                columns.append((column, kind))    # relation filters join on the relation's key
+        for sequence in sort_orders(args.get('orderBy')):
+            unknown += [c for c in sequence if self.schema.field(model, c) is None]
+        if unknown:
+            yield finding(file, 'unknown-field', 'info',
+                          f"{where}: not fields of {label}: {', '.join(dict.fromkeys(unknown))}", **here)
+
+        equal = list(eq_prefix) + [c for c, kind in columns if kind in EQUALITY]
+        if self.schema.unique_lookup(model, equal):
+            return
+
+        served_filter = False
+        for column, kind in columns:
+            if kind == 'text':
+                yield finding(file, 'text-search', 'info',
+                              f"{where}: '{column}' substring match on {label} cannot use a B-tree index",
+                              **here)
+            elif self.schema.served(model, column, equal):
+                served_filter = True
+        names = [c for c, kind in columns if kind != 'text']
+        if names and not served_filter:
+            yield finding(file, 'unindexed-filter', 'warning',
+                          f"{where}: no index on {label} serves a filter on {', '.join(names)}", **here)
+            self.suggest(model, list(eq_prefix) + [names[0]], query)
+
+        for sequence in sort_orders(args.get('orderBy')):
+            prefix = list(equal)
+            for column in sequence:
+                if self.schema.field(model, column) is None:
+                    break
+                if not self.schema.served(model, column, prefix):
+                    yield finding(file, 'unindexed-sort', 'warning',
+                                  f"{where}: no index on {label} serves orderBy {column}", **here)
+                    self.suggest(model, prefix + [column], query)
+                    break
+                prefix.append(column)
+
+    def check_relations(self, model, args, query, where, depth=0):
+        """Foreign keys joined by include/select, and their nested where/orderBy"""
+        file, here = rel(query.file), dict(line=query.line)
+        unknown = []
+        for clause in ('include', 'select'):
+            entries = args.get(clause)
+            if not isinstance(entries, dict) or depth > 4:
+                continue
+            for key, value in entries.items():
+                if key == '_count' or not isinstance(key, str) or key == '...':
+                    continue
+                relation = self.schema.relation(model, key)
+                if relation is None:
+                    if clause == 'include':
+                        unknown.append(key)
+                    continue
+                field, target = relation
+                table, columns = self.schema.foreign_key(model, field)
+                nested = relation_args(value)
+                label = f"{model}.{field}"
+                if table == model or not columns:
+                    # belongs-to: the join looks up the target's primary key
+                    yield from self.check_relations(target, nested, query, f"{where} → {field}", depth + 1)
+                    continue
+                if not self.schema.served(table, columns[0]):
+                    yield finding(file, 'unindexed-fk', 'warning',
+                                  f"{where}: include {field} joins {table}.{', '.join(columns)} "
+                                  f"without an index", **here)
+                    self.suggest(table, columns, query)
+                yield from self.check_filter(table, nested, query, f"{where} → {field}",
+                                             eq_prefix=columns, label=label)
+                yield from self.check_relations(target, nested, query, f"{where} → {field}", depth + 1)
+        if unknown:
+            yield finding(file, 'unknown-field', 'info',
+                          f"{where}: not relations of {model}: {', '.join(unknown)}", **here)
+
+    def ranked_suggestions(self):
+        """[(model, columns, call sites)], most call sites first; prefixes fold into longer indexes"""
+        ranked = []
+        for model, by_columns in self.suggestions.items():
+            existing = [cols for cols, _ in self.schema.indexes[model]]
+            for columns, sites in by_columns.items():
+                longer = [c for c in list(by_columns) + existing
+                          if c != columns and c[:len(columns)] == columns]
+                if longer:
+                    if longer[0] in by_columns:
+                        by_columns[longer[0]] |= sites
+                    continue
+                ranked.append((model, columns, sites))
+        return sorted(ranked, key=lambda r: (-len(r[2]), r[0], r[1]))
+
+
+def iter_findings(advisor, queries):
+    for query in queries:
+        yield from advisor.check(query)
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--schema', action='append',
+                        help="schema.prisma to index against (repeatable; default: "
+                             "docs/app/data-struc/schema.prisma and prisma/schema.prisma)")
+    parser.add_argument('--services', default=str(SERVICES_DIR), help="Folder of TS services to scan")
+    parser.add_argument('--alias', action='append', default=[], metavar='ACCESSOR=MODEL',
+                        help="Map a client accessor to a schema model")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    advisor = Advisor(load_schema(args.schema, dict(a.split('=', 1) for a in args.alias)))
+    files = service_files(args.services)
+    queries = [q for batch in corpus.map(extract_queries, files) for q in batch]
+
+    if args.ndjson:
+        report(iter_findings(advisor, queries), ndjson=True)
+        return 0
+
+    print(f"Scanning {len(queries)} Prisma call(s) in {len(files)} service file(s)...\n")
+    summary = report(iter_findings(advisor, queries))
+    counts = summary.by_rule
+    suggestions = advisor.ranked_suggestions()
+
+    if suggestions:
+        print(f"\n{'='*70}")
+        print("SUGGESTED INDEXES")
+        print(f"{'='*70}")
+        for model, columns, sites in suggestions:
+            print(f"\n{model}: @@index([{', '.join(columns)}])  — {len(sites)} call site(s)")
+            for file, line, function in sorted(sites):
+                print(f"    {file}:{line}" + (f" {function}()" if function else ""))
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Prisma calls: {len(queries)}")
+    print(f"⚠️  Unindexed filters: {counts['unindexed-filter']}")
+    print(f"⚠️  Unindexed sorts: {counts['unindexed-sort']}")
+    print(f"⚠️  Unindexed relation keys: {counts['unindexed-fk']}")
+    print(f"ℹ️  Calls using fields the schema lacks: {counts['unknown-field']}")
+    print(f"ℹ️  Substring searches: {counts['text-search']}")
+    print(f"ℹ️  Accessors with no schema model: {counts['unknown-model']}")
+    print(f"📝 Suggested indexes: {len(suggestions)}")
+    print(f"{'='*70}")
+    return 1 if counts['unindexed-filter'] + counts['unindexed-sort'] + counts['unindexed-fk'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Prisma query shapes extracted from the TypeScript services
+- Find every <client>.<model>.<operation>({...}) call, e.g. (this.db as any).purchase_requests.findMany(
+- Parse the argument object literal into plain dicts/lists; other values are kept as source text
+- Resolve `where: whereClause` to the declared object plus the `whereClause.x = ...` assignments
+  made before the call, and `[this.mapSortField(...)]` sort keys to the field names that helper returns
+- Map client accessors (purchase_requests) to schema models (tb_purchase_request), relation fields
+  and the indexes (@id/@unique/@@id/@@unique/@@index) each model has
+"""
+
+import re
+from collections import namedtuple
+from pathlib import Path
+
+from docs_corpus import REPO_ROOT, SCHEMA_PATH
+from verify_dd_against_schema import parse_prisma_models
+
+SERVICES_DIR = REPO_ROOT / 'lib' / 'services' / 'db'
+DEFAULT_SCHEMAS = [SCHEMA_PATH, REPO_ROOT / 'prisma' / 'schema.prisma']
+
+# Service accessors whose table name does not follow the tb_<singular> convention
+MODEL_ALIASES = {
+    'categories': 'tb_product_category',
+    'physical_counts': 'tb_count_stock',
+    'physical_count_items': 'tb_count_stock_detail',
+}
+
+READ_OPERATIONS = ('findMany', 'findFirst', 'findFirstOrThrow', 'findUnique', 'findUniqueOrThrow',
+                   'count', 'aggregate', 'groupBy')
+WRITE_OPERATIONS = ('create', 'createMany', 'update', 'updateMany', 'upsert', 'delete', 'deleteMany')
+UNIQUE_OPERATIONS = ('findUnique', 'findUniqueOrThrow', 'update', 'upsert', 'delete')
+
+CALL_PATTERN = re.compile(
+    r'\.\s*([A-Za-z_]\w*)\s*\.\s*(' + '|'.join(READ_OPERATIONS + WRITE_OPERATIONS) + r')\s*\(')
+DECLARATION = r'\b(?:const|let|var)\s+{name}\b[^=;\n]*=\s*'
+ASSIGNMENT = r'\b{name}((?:\.\w+|\[\s*[\'"]\w+[\'"]\s*\])+)\s*=(?![=>])\s*'
+FUNCTION_START = re.compile(
+    r'^\s*(?:(?:private|public|protected|static|async)\s+)*'
+    r'(?!(?:if|for|while|switch|catch|return|function)\b)\w+\s*\([^)]*\)\s*(?::[^{]*)?\{\s*$',
+    re.MULTILINE)
+HELPER_RESULT = re.compile(r'(?::|\breturn|\|\||\?\?)\s*[\'"](\w+)[\'"]')
+
+FILTER_OPERATORS = {
+    'equals': 'eq', 'not': 'eq',
+    'in': 'in', 'notIn': 'in',
+    'gt': 'range', 'gte': 'range', 'lt': 'range', 'lte': 'range',
+    'startsWith': 'prefix',
+    'contains': 'text', 'endsWith': 'text', 'search': 'text', 'mode': None,
+    'some': 'relation', 'every': 'relation', 'none': 'relation', 'is': 'relation', 'isNot': 'relation',
+}
+LOGICAL_KEYS = ('AND', 'OR', 'NOT')
+
+Query = namedtuple('Query', 'file line accessor operation args function')
+
+
+class Expr(str):
+    """A value kept as its source text (a call, literal, template string, ...)"""
+
+
+class Ref(Expr):
+    """A value that is a plain identifier (whereClause, id, this.x)"""
+
+
+# ---------------------------------------------------------------------------
+# Object literal parsing
+
+TOKEN = re.compile(r"""
+    (?P<ws>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")
+  | (?P<template>`)
+  | (?P<spread>\.\.\.)
+  | (?P<punct>[{}\[\](),:?])
+  | (?P<word>[\w$.]+)
+  | (?P<other>=>|[^\s\w$])
+""", re.VERBOSE | re.DOTALL)
+
+CLOSERS = {'{': '}', '[': ']', '(': ')'}
+
+
+def skip_template(source, pos):
+    """Index just past a template literal that starts at source[pos] == '`'"""
+    i = pos + 1
+    while i < len(source):
+        ch = source[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == '`':
+            return i + 1
+        if source.startswith('${', i):
+            depth = 1
+            i += 2
+            while i < len(source) and depth:
+                if source[i] == '`':
+                    i = skip_template(source, i)
+                    continue
+                depth += {'{': 1, '}': -1}.get(source[i], 0)
+                i += 1
+            continue
+        i += 1
+    return i
+
+
+def tokenize(source, pos=0):
+    """Yield (kind, text, start) tokens, skipping whitespace and comments"""
+    while pos < len(source):
+        match = TOKEN.match(source, pos)
+        if not match:
+            yield 'other', source[pos], pos
+            pos += 1
+            continue
+        kind = match.lastgroup
+        if kind == 'template':
+            end = skip_template(source, pos)
+            yield 'string', source[pos:end], pos
+            pos = end
+            continue
+        if kind != 'ws':
+            yield kind, match.group(), pos
+        pos = match.end()
+
+
+class Parser:
+    def __init__(self, source, pos):
+        self.source = source
+        self.tokens = tokenize(source, pos)
+        self.peeked = None
+
+    def peek(self):
+        if self.peeked is None:
+            self.peeked = next(self.tokens, ('eof', '', len(self.source)))
+        return self.peeked
+
+    def take(self):
+        token = self.peek()
+        self.peeked = None
+        return token
+
+    def value(self):
+        kind, text, start = self.peek()
+        if text == '{':
+            return self.obj()
+        if text == '[':
+            return self.array()
+        return self.expression()
+
+    def obj(self):
+        self.take()
+        out = {}
+        while True:
+            kind, text, start = self.peek()
+            if text == '}' or kind == 'eof':
+                self.take()
+                return out
+            if text == ',':
+                self.take()
+                continue
+            if kind == 'spread':
+                self.take()
+                out.setdefault('...', []).append(self.value())
+                continue
+            if text == '[':
+                self.take()
+                key = Expr('[' + self.expression(stop=(']',)) + ']')
+                self.take()
+            else:
+                self.take()
+                key = text[1:-1] if kind == 'string' else text
+            kind, text, _ = self.peek()
+            if text == ':':
+                self.take()
+                out[key] = self.value()
+            elif text == '(':
+                self.expression()    # method shorthand: skip it
+            else:
+                out[key] = Ref(key)  # shorthand { id }
+
+    def array(self):
+        self.take()
+        out = []
+        while True:
+            kind, text, _ = self.peek()
+            if text == ']' or kind == 'eof':
+                self.take()
+                return out
+            if text == ',':
+                self.take()
+                continue
+            out.append(self.value())
+
+    def expression(self, stop=(',', '}', ']', ')'), statement=False):
+        """Source text up to the next top-level stop token; a lone identifier becomes a Ref.
+
+        statement=True also stops at a top-level line break (TS without semicolons).
+        """
+        depth = []
+        start = end = None
+        tokens = []
+        while True:
+            kind, text, pos = self.peek()
+            if kind == 'eof' or (not depth and text in stop):
+                break
+            if statement and not depth and start is not None and \
+                    (text == ';' or '\n' in self.source[end:pos]):
+                break
+            self.take()
+            if text in CLOSERS:
+                depth.append(CLOSERS[text])
+            elif depth and text == depth[-1]:
+                depth.pop()
+            if start is None:
+                start = pos
+            end = pos + len(text)
+            tokens.append(kind)
+        text = self.source[start:end] if start is not None else ''
+        return Ref(text) if tokens == ['word'] else Expr(text)
+
+
+def matching_close(source, pos):
+    """Index just past the bracket that closes the one at source[pos] (strings/comments skipped)"""
+    depth = []
+    for kind, text, start in tokenize(source, pos):
+        if text in CLOSERS:
+            depth.append(CLOSERS[text])
+        elif depth and text == depth[-1]:
+            depth.pop()
+            if not depth:
+                return start + 1
+    return len(source)
+
+
+def parse_value(source, pos, statement=False):
+    """Parse the literal starting at source[pos] (after any whitespace)"""
+    parser = Parser(source, pos)
+    if statement and parser.peek()[1] not in ('{', '['):
+        return parser.expression(statement=True)
+    return parser.value()
+
+
+# ---------------------------------------------------------------------------
+# Call extraction
+
+def line_of(source, pos):
+    return source.count('\n', 0, pos) + 1
+
+
+def enclosing_function(source, pos):
+    """(start offset, name) of the method/function declaration containing pos"""
+    start, name = 0, None
+    for match in FUNCTION_START.finditer(source, 0, pos):
+        start = match.start()
+        name = re.match(r'\s*(?:(?:private|public|protected|static|async)\s+)*(\w+)', match.group()).group(1)
+    return start, name
+
+
+def set_path(target, keys, value):
+    for key in keys[:-1]:
+        if not isinstance(target.get(key), dict):
+            target[key] = {}
+        target = target[key]
+    target[keys[-1]] = value
+
+
+def resolve_ref(source, name, scope_start, call_pos):
+    """Object a variable holds at call_pos: its declaration plus later property assignments"""
+    if not re.match(r'^[A-Za-z_$][\w$]*$', name):
+        return None
+    declarations = list(re.finditer(DECLARATION.format(name=re.escape(name)), source[scope_start:call_pos]))
+    if not declarations:
+        return None
+    decl = declarations[-1]
+    value = parse_value(source, scope_start + decl.end(), statement=True)
+    if not isinstance(value, (dict, list)):
+        return None
+    if isinstance(value, list):
+        return value
+    value = dict(value)
+    assign = re.compile(ASSIGNMENT.format(name=re.escape(name)))
+    for match in assign.finditer(source, scope_start + decl.end(), call_pos):
+        keys = re.findall(r'\.(\w+)|\[\s*[\'"](\w+)[\'"]\s*\]', match.group(1))
+        keys = [a or b for a, b in keys]
+        set_path(value, keys, parse_value(source, match.end(), statement=True))
+    return value
+
+
+def helper_strings(source, helper):
+    """String literals returned by a helper such as this.mapSortField(...)"""
+    match = re.search(r'\b' + re.escape(helper) + r'\s*\([^)]*\)\s*(?::[^{]*)?\{', source)
+    if not match:
+        return []
+    depth, i = 1, match.end()
+    while i < len(source) and depth:
+        depth += {'{': 1, '}': -1}.get(source[i], 0)
+        i += 1
+    return HELPER_RESULT.findall(source[match.end():i])
+
+
+def resolve_refs(value, source, scope_start, call_pos, depth=0):
+    """Replace Ref values under where/orderBy/include/select/data with what they hold"""
+    if depth > 4:
+        return value
+    if isinstance(value, Ref):
+        resolved = resolve_ref(source, value, scope_start, call_pos)
+        return resolve_refs(resolved, source, scope_start, call_pos, depth + 1) if resolved is not None else value
+    if isinstance(value, dict):
+        out = {}
+        for key, item in value.items():
+            if isinstance(key, Expr) and key.startswith('['):
+                helper = re.search(r'(\w+)\s*\(', key)
+                names = helper_strings(source, helper.group(1)) if helper else []
+                for name in names or [key]:
+                    out[name] = resolve_refs(item, source, scope_start, call_pos, depth + 1)
+                continue
+            out[key] = resolve_refs(item, source, scope_start, call_pos, depth + 1)
+        return out
+    if isinstance(value, list):
+        return [resolve_refs(v, source, scope_start, call_pos, depth + 1) for v in value]
+    return value
+
+
+def extract_queries(path):
+    """[Query] for every Prisma model call in one TypeScript file"""
+    source = Path(path).read_text(encoding='utf-8', errors='replace')
+    queries = []
+    for match in CALL_PATTERN.finditer(source):
+        accessor, operation = match.groups()
+        if accessor.startswith('$'):
+            continue
+        scope_start, function = enclosing_function(source, match.start())
+        args = parse_value(source, match.end())
+        if isinstance(args, Ref):
+            args = resolve_ref(source, args, scope_start, match.start()) or {}
+        if not isinstance(args, dict):
+            args = {}
+        args = resolve_refs(args, source, scope_start, match.start())
+        queries.append(Query(path, line_of(source, match.start()), accessor, operation, args, function))
+    return queries
+
+
+def service_files(directory=SERVICES_DIR):
+    return sorted(p for p in Path(directory).rglob('*.ts') if not p.name.endswith('.d.ts'))
+
+
+# ---------------------------------------------------------------------------
+# Query shape helpers
+
+def filter_columns(where):
+    """Yield (column, kind) for a where clause; kind is eq/in/range/prefix/text/relation"""
+    if not isinstance(where, dict):
+        return
+    for key, value in where.items():
+        if key in LOGICAL_KEYS:
+            for part in value if isinstance(value, list) else [value]:
+                yield from filter_columns(part)
+            continue
+        if key == '...' or isinstance(key, Expr):
+            continue
+        if isinstance(value, dict) and value:
+            kinds = [FILTER_OPERATORS.get(k, 'relation') for k in value]
+            kinds = [k for k in kinds if k]
+            order = ('relation', 'text', 'prefix', 'range', 'in', 'eq')
+            yield key, min(kinds, key=order.index) if kinds else 'eq'
+        else:
+            yield key, 'eq'
+
+
+def sort_orders(order_by):
+    """Column sequences an orderBy can sort on.
+
+    An array is one multi-column sort; the keys of a single object are alternatives
+    (Prisma takes one key per object, so several keys come from an expanded [sortField]).
+    """
+    def columns(part):
+        return [k for k in part if not isinstance(k, Expr) and k != '...'] if isinstance(part, dict) else []
+
+    if isinstance(order_by, list):
+        sequence = [c for part in order_by for c in columns(part)]
+        return [sequence] if sequence else []
+    return [[c] for c in columns(order_by)]
+
+
+def relation_args(value):
+    """Nested args for one include/select entry ({} for `true`; the object branch of a ternary)"""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, Expr) and '{' in value:
+        parsed = parse_value(value, value.index('{'))
+        if isinstance(parsed, dict):
+            return parsed
+    return {}
+
+
+# ---------------------------------------------------------------------------
+# Schema side
+
+def index_columns(spec):
+    """['a', 'b'] from '[a, b(sort: Desc)]' or 'fields: [a, b]'"""
+    match = re.search(r'\[([^\]]*)\]', spec)
+    if not match:
+        return []
+    return [c.strip().split('(')[0].strip() for c in match.group(1).split(',') if c.strip()]
+
+
+class Schema:
+    """Models, relations and indexes of one or more parsed schema.prisma files"""
+
+    def __init__(self, models, aliases=None):
+        self.models = models
+        self.aliases = {**MODEL_ALIASES, **(aliases or {})}
+        self._by_lower = {name.lower(): name for name in models}
+        self.indexes = {name: self._indexes(model) for name, model in models.items()}
+
+    @staticmethod
+    def _indexes(model):
+        """[(columns tuple, kind)] with kind id/unique/index"""
+        out = []
+        for name, field in model['fields'].items():
+            for attr in field['attributes']:
+                if attr == '@id' or attr.startswith('@id('):
+                    out.append(((name,), 'id'))
+                elif attr == '@unique' or attr.startswith('@unique('):
+                    out.append(((name,), 'unique'))
+        for attr in model['block_attributes']:
+            kind = re.match(r'@@(\w+)', attr).group(1)
+            if kind in ('id', 'unique', 'index'):
+                columns = tuple(index_columns(attr))
+                if columns:
+                    out.append((columns, kind))
+        return out
+
+    def model_for(self, accessor):
+        """Schema model a client accessor refers to, trying tb_/singular/_detail spellings"""
+        if self.aliases.get(accessor) in self.models:
+            return self.aliases[accessor]
+        stems = [accessor]
+        if accessor.endswith('ies'):
+            stems.append(accessor[:-3] + 'y')
+        elif accessor.endswith('s'):
+            stems.append(accessor[:-1])
+        for stem in list(stems):
+            if stem.endswith('_item'):
+                stems.append(stem[:-5] + '_detail')
+        for stem in stems:
+            for candidate in (stem, f"tb_{stem}"):
+                if candidate.lower() in self._by_lower:
+                    return self._by_lower[candidate.lower()]
+        return None
+
+    def scalar_fields(self, model):
+        """Column names of a model (relation fields excluded)"""
+        return [name for name, field in self.models[model]['fields'].items()
+                if field['type'] not in self.models]
+
+    def field(self, model, name):
+        return self.models[model]['fields'].get(name)
+
+    def relation(self, model, key):
+        """(field name, target model) for an include/select key, or None"""
+        fields = self.models[model]['fields']
+        field = fields.get(key)
+        if field and field['type'] in self.models:
+            return key, field['type']
+        target = self.model_for(key)
+        if target:
+            for name, field in fields.items():
+                if field['type'] == target:
+                    return name, target
+        return None
+
+    def foreign_key(self, model, relation_field):
+        """(table, columns) holding the join columns of a relation field"""
+        field = self.models[model]['fields'][relation_field]
+        relation = next((a for a in field['attributes'] if a.startswith('@relation')), '')
+        if 'fields:' in relation:
+            return model, index_columns(relation.split('fields:', 1)[1])
+        target = field['type']
+        name = re.match(r'@relation\(\s*"([^"]+)"', relation)
+        for other_name, other in self.models[target]['fields'].items():
+            if other['type'] != model:
+                continue
+            other_relation = next((a for a in other['attributes'] if a.startswith('@relation')), '')
+            if 'fields:' not in other_relation:
+                continue
+            if name and f'"{name.group(1)}"' not in other_relation:
+                continue
+            return target, index_columns(other_relation.split('fields:', 1)[1])
+        return target, []
+
+    def served(self, model, column, eq_prefix=()):
+        """True if an index has column first, or right after columns all in eq_prefix"""
+        for columns, _ in self.indexes[model]:
+            if column not in columns:
+                continue
+            position = columns.index(column)
+            if all(c in eq_prefix for c in columns[:position]):
+                return True
+        return False
+
+    def unique_lookup(self, model, columns):
+        """True if columns contain every column of some @id/@unique"""
+        columns = set(columns)
+        return any(kind in ('id', 'unique') and set(cols) <= columns
+                   for cols, kind in self.indexes[model])
+
+
+def load_schema(paths=None, aliases=None):
+    """Schema over the models of several schema.prisma files (first definition of a model wins)"""
+    models = {}
+    for path in paths or DEFAULT_SCHEMAS:
+        for name, model in parse_prisma_models(path).items():
+            models.setdefault(name, model)
+    return Schema(models, aliases)
@@ -3,7 +3,7 @@
 Remove duplicate Document History sections (keep only the first one)
 """
 
-from pathlib import Path
+from docs_corpus import DOCS_APP_DIR, Corpus
 
 def remove_duplicate_document_history(file_path):
     """Remove duplicate Document History sections, keep only first one"""
@@ -61,10 +61,9 @@ def remove_duplicate_document_history(file_path):
         return f"error: {str(e)}", 0
 
 def main():
-    docs_app_dir = Path('/Users/peak/Documents/GitHub/carmen/docs/app')
+    docs_app_dir = DOCS_APP_DIR
 
-    md_files = [f for f in docs_app_dir.rglob('*.md')
-                if 'template-guide' not in str(f)]
+    md_files = Corpus().files(docs_app_dir)
 
     print(f"Checking {len(md_files)} files for duplicate Document History sections...\n")
 
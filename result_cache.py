@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Content-addressed result cache that can be shared between clones, developers and CI runners
+- A result is keyed by sha256(tool, tool version, rule-set digest, profile, file content sha1):
+  nothing machine-specific (paths, mtimes), so a blob written on one machine is valid on any other
+- Stored as one small immutable JSON blob per key, fanned out as <dir>/ab/<key>.json; the directory
+  can sit on a shared volume or be saved and restored as a CI cache artifact
+- Concurrent writers are safe: a blob is written to a unique temp file and hard-linked into place,
+  so readers never see a partial blob and the first writer of a key wins (all writers of one key
+  write the same result anyway)
+- Size-bounded LRU: a hit refreshes the blob's mtime (at most hourly), evict() deletes the least
+  recently used blobs until the directory fits its budget; a blob deleted under a reader is a miss
+Default location .docs-cache/results; `carmen-docs result-cache [--evict | --clear]` manages it.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from docs_corpus import CACHE_DIR, file_digest, rel
+
+RESULT_DIR = CACHE_DIR / 'results'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# A hit only rewrites the blob's mtime when it is older than this, to spare shared volumes
+TOUCH_INTERVAL = 3600
+
+
+def ruleset_digest(*modules):
+    """SHA-1 over the source of the modules that implement a tool's rules"""
+    digest = hashlib.sha1()
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Per-file results addressed by what produced them and by the file's content.
+
+    `profile` covers whatever else about the file the result depends on (e.g. which
+    checks its name or folder selects); results must not embed the file's path.
+    """
+
+    def __init__(self, tool, version, ruleset, directory=RESULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.prefix = f"{tool}\0{version}\0{ruleset}\0"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    def key(self, path, profile=''):
+        return hashlib.sha256(f"{self.prefix}{profile}\0{file_digest(path)}".encode('utf-8')).hexdigest()
+
+    def blob_path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def lookup(self, path, profile=''):
+        """(True, data, key) on a hit, else (False, None, key); pass key to store()"""
+        key = self.key(path, profile)
+        blob = self.blob_path(key)
+        try:
+            with open(blob, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return False, None, key
+        try:
+            if time.time() - os.stat(blob).st_mtime > TOUCH_INTERVAL:
+                os.utime(blob)
+        except OSError:
+            pass            # evicted meanwhile, or a read-only cache
+        self.hits += 1
+        return True, data, key
+
+    def store(self, key, data):
+        """Publish a blob unless another writer already has"""
+        blob = self.blob_path(key)
+        if blob.exists():
+            return
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.parent / f".{key}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            try:
+                os.link(tmp, blob)
+            except FileExistsError:
+                return
+            except OSError:
+                os.replace(tmp, blob)   # filesystems without hard links; same bytes either way
+            self.stored += 1
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def evict(self):
+        return evict(self.directory, self.max_bytes)
+
+
+def blobs(directory):
+    """(mtime, size, path) of every blob under directory"""
+    found = []
+    for entry in Path(directory).glob('??/*.json'):
+        try:
+            st = entry.stat()
+        except FileNotFoundError:
+            continue
+        found.append((st.st_mtime, st.st_size, entry))
+    return found
+
+
+def evict(directory, max_bytes):
+    """Delete least recently used blobs until the total size is within max_bytes; (count, bytes)"""
+    found = blobs(directory)
+    total = sum(size for _, size, _ in found)
+    removed = freed = 0
+    for _, size, path in sorted(found, key=lambda b: b[0]):
+        if total - freed <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass            # another process evicted it first
+        removed += 1
+        freed += size
+    return removed, freed
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--dir', type=Path, default=RESULT_DIR,
+                        help=f"Cache directory (default: {rel(RESULT_DIR)})")
+    parser.add_argument('--evict', action='store_true', help="Trim the cache to --max-mb")
+    parser.add_argument('--max-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help="Size budget for --evict (default: %(default).0f)")
+    parser.add_argument('--clear', action='store_true', help="Delete every blob")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        shutil.rmtree(args.dir, ignore_errors=True)
+        print(f"✅ Cleared {rel(args.dir)}")
+        return 0
+    if args.evict:
+        removed, freed = evict(args.dir, int(args.max_mb * 1024 * 1024))
+        print(f"✅ Evicted {removed} blob(s), {freed / 1024:.0f} KB")
+
+    found = blobs(args.dir)
+    total = sum(size for _, size, _ in found)
+    print(f"\n{'='*60}")
+    print(f"Result cache: {rel(args.dir)}")
+    print(f"Blobs: {len(found)} ({total / 1024:.0f} KB)")
+    if found:
+        oldest, newest = min(found, key=lambda b: b[0])[0], max(found, key=lambda b: b[0])[0]
+        print(f"Last used: {time.strftime('%Y-%m-%d %H:%M', time.localtime(oldest))} .. "
+              f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(newest))}")
+    print(f"{'='*60}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
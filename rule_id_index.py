@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Cross-document index of business-rule, requirement, use-case and validation IDs
+- Extract IDs defined in BR (BR/FR/NFR), UC (UC) and VAL (VAL) docs and every reference elsewhere
+- Expand ranges ("BR-BE-001 to BR-BE-014") so every rule in the range counts as referenced
+- Flag dangling references, rules nobody else references and duplicate definitions
+- A reference only dangles if its prefix (BR-CN-) is used by some definition; other schemes are counted apart
+- Resolve IDs per submodule first (every module has its own BR-BE-001), then corpus-wide
+- Cache per-file extraction by mtime/size so an edit only re-extracts that file
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+
+from docs_corpus import Corpus, FileCache, rel
+
+# Document prefix -> ID kinds that document type defines
+DEFINING_DOCS = {
+    'BR': ('BR', 'FR', 'NFR'),
+    'UC': ('UC',),
+    'VAL': ('VAL',),
+}
+ID_KINDS = ('BR', 'FR', 'NFR', 'UC', 'VAL')
+
+# Bump when extract_ids() changes so cached entries are discarded
+EXTRACTOR_VERSION = 1
+
+ID = r'(?:' + '|'.join(ID_KINDS) + r')-(?:[A-Z][A-Z0-9]*-)*\d{2,4}'
+ID_PATTERN = re.compile(r'(?<![\w-])(' + ID + r')(?![\w-])')
+RANGE_PATTERN = re.compile(
+    r'(?<![\w-])(' + ID + r')\s*(?:to|through|thru|–|—|-)\s*(' + ID + r'|\d{2,4})(?![\w-])')
+DEFINITION_PATTERNS = [
+    re.compile(r'^#{1,6}\s+(?:[\d.]+\s+)?\**(' + ID + r')\b'),           # ### BR-CN-001: ...
+    re.compile(r'^\s*(?:[-*]\s+)?\*\*(' + ID + r')\b'),                   # - **BR-CN-001**: ... / **BR-CN-001: Title**
+    re.compile(r'^\s*[-*]\s+(' + ID + r')\s*:'),                         # - BR-CN-001: ...
+    re.compile(r'^\|\s*\**(' + ID + r')\**\s*\|'),                       # | UC-CN-001 | ... |
+]
+PLACEHOLDER_PATTERN = re.compile(r'-X{2,}-|-YYY-|-MOD-')
+
+
+def split_id(rule_id):
+    """('BR-CN-', 1, 3) for BR-CN-001"""
+    match = re.match(r'^(.*-)(\d+)$', rule_id)
+    return match.group(1), int(match.group(2)), len(match.group(2))
+
+
+def expand_range(start, end):
+    """IDs from start to end inclusive, or [] when they don't form a sane range"""
+    prefix, first, width = split_id(start)
+    if end.isdigit():
+        last = int(end)
+    else:
+        end_prefix, last, _ = split_id(end)
+        if end_prefix != prefix:
+            return []
+    if not 0 < last - first <= 200:
+        return []
+    return [f"{prefix}{n:0{width}d}" for n in range(first, last + 1)]
+
+
+def doc_kind(path):
+    prefix = path.name.split('-')[0]
+    return prefix if prefix in DEFINING_DOCS else None
+
+
+def extract_ids(path):
+    """Process-pool worker: (path, {'defs', 'refs', 'range_refs'}), each a list of [id, line]"""
+    kinds = DEFINING_DOCS.get(doc_kind(path), ())
+    defs, refs, range_refs = [], [], []
+    defined_here = set()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line_no, line in enumerate(f, 1):
+            if '-' not in line:
+                continue
+            ids = ID_PATTERN.findall(line)
+            if not ids:
+                continue
+            defined = None
+            if kinds:
+                for pattern in DEFINITION_PATTERNS:
+                    match = pattern.match(line)
+                    if match:
+                        defined = match.group(1)
+                        break
+            if defined and defined.split('-')[0] in kinds and defined not in defined_here:
+                defined_here.add(defined)
+                defs.append([defined, line_no])
+            else:
+                defined = None
+
+            for rule_id in dict.fromkeys(ids):
+                if rule_id != defined and not PLACEHOLDER_PATTERN.search(rule_id):
+                    refs.append([rule_id, line_no])
+            # IDs inside a range only count where they exist (ranges often reserve blocks)
+            for start, end in RANGE_PATTERN.findall(line):
+                for rule_id in expand_range(start, end):
+                    if rule_id not in ids:
+                        range_refs.append([rule_id, line_no])
+    return path, {'defs': defs, 'refs': refs, 'range_refs': range_refs}
+
+
+def collect(files, cache, corpus):
+    """{path: extraction}; only files whose mtime/size changed are re-extracted"""
+    results = {}
+    missing = []
+    for path in files:
+        found, data = cache.lookup(path)
+        if found:
+            results[path] = data
+        else:
+            missing.append(path)
+    for path, data in corpus.map(extract_ids, missing):
+        results[path] = data
+        cache.store(path, data)
+    return results
+
+
+def build_index(results):
+    """definitions {id: {dir: [(file, line)]}}; references and range references {id: [(file, line)]}"""
+    definitions = defaultdict(lambda: defaultdict(list))
+    references = defaultdict(list)
+    range_references = defaultdict(list)
+    for path, data in results.items():
+        for rule_id, line in data['defs']:
+            definitions[rule_id][path.parent].append((path, line))
+        for rule_id, line in data['refs']:
+            references[rule_id].append((path, line))
+        for rule_id, line in data['range_refs']:
+            range_references[rule_id].append((path, line))
+    return definitions, references, range_references
+
+
+def resolve(rule_id, source, definitions):
+    """Directory whose definition a reference from source points at; None if dangling, 'ambiguous'"""
+    scopes = definitions.get(rule_id)
+    if not scopes:
+        return None
+    if source.parent in scopes:
+        return source.parent
+    if len(scopes) == 1:
+        return next(iter(scopes))
+    return 'ambiguous'
+
+
+def analyze(definitions, references, range_references):
+    duplicates = []
+    for rule_id, scopes in sorted(definitions.items()):
+        for directory, places in scopes.items():
+            files = sorted({p for p, _ in places})
+            if len(files) > 1:
+                duplicates.append({
+                    'id': rule_id,
+                    'definitions': [{'file': rel(p), 'line': l} for p, l in sorted(places)],
+                })
+
+    # Prefixes like FR-DATA- that no BR/UC/VAL document defines belong to other schemes (PRDs)
+    namespaces = {split_id(rule_id)[0] for rule_id in definitions}
+    dangling = defaultdict(list)
+    ambiguous = defaultdict(list)
+    foreign = set()
+    used = set()
+    for rule_id, places in range_references.items():
+        for path, _ in places:
+            scope = resolve(rule_id, path, definitions)
+            if scope not in (None, 'ambiguous') and \
+                    all(p != path for p, _ in definitions[rule_id][scope]):
+                used.add((rule_id, scope))
+
+    for rule_id, places in references.items():
+        for path, line in places:
+            scope = resolve(rule_id, path, definitions)
+            if scope is None and split_id(rule_id)[0] not in namespaces:
+                foreign.add(rule_id)
+            elif scope is None:
+                dangling[rule_id].append({'file': rel(path), 'line': line})
+            elif scope == 'ambiguous':
+                ambiguous[rule_id].append({'file': rel(path), 'line': line})
+            elif all(p != path for p, _ in definitions[rule_id][scope]):
+                used.add((rule_id, scope))
+
+    unreferenced = defaultdict(list)
+    for rule_id, scopes in definitions.items():
+        for directory, places in scopes.items():
+            if (rule_id, directory) not in used:
+                path, line = min(places)
+                unreferenced[rel(path)].append({'id': rule_id, 'line': line})
+    for items in unreferenced.values():
+        items.sort(key=lambda i: i['line'])
+
+    return {
+        'duplicates': duplicates,
+        'dangling': dict(sorted(dangling.items())),
+        'ambiguous': dict(sorted(ambiguous.items())),
+        'foreign': sorted(foreign),
+        'unreferenced': dict(sorted(unreferenced.items())),
+    }
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--id', dest='rule_id', help="Show where one ID is defined and referenced")
+    parser.add_argument('--json', action='store_true', help="Print findings as JSON")
+    parser.add_argument('--show-unreferenced', action='store_true',
+                        help="List every unreferenced rule (default: per-file counts)")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    files = [f for f in corpus.files() if f.suffix == '.md']
+    cache = FileCache('rule-ids', salt=str(EXTRACTOR_VERSION))
+    results = collect(files, cache, corpus)
+    cache.prune(files)
+    cache.save()
+    definitions, references, range_references = build_index(results)
+
+    if args.rule_id:
+        rule_id = args.rule_id.upper()
+        print(f"{rule_id}")
+        for directory, places in definitions.get(rule_id, {}).items():
+            for path, line in places:
+                print(f"   📌 defined    {rel(path)}:{line}")
+        for path, line in references.get(rule_id, []):
+            print(f"   ↪  referenced {rel(path)}:{line}")
+        return 0 if rule_id in definitions else 1
+
+    findings = analyze(definitions, references, range_references)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps(findings, indent=2))
+        return 1 if findings['dangling'] or findings['duplicates'] else 0
+
+    for dup in findings['duplicates']:
+        where = ', '.join(f"{d['file']}:{d['line']}" for d in dup['definitions'])
+        print(f"❌ Duplicate definition {dup['id']}: {where}")
+    for rule_id, places in findings['dangling'].items():
+        first = places[0]
+        more = f" (+{len(places) - 1} more)" if len(places) > 1 else ''
+        print(f"❌ Dangling {rule_id}: {first['file']}:{first['line']}{more}")
+    for path, items in findings['unreferenced'].items():
+        if args.show_unreferenced:
+            for item in items:
+                print(f"⚠️  Unreferenced {item['id']}: {path}:{item['line']}")
+        else:
+            print(f"⚠️  {path}: {len(items)} unreferenced")
+
+    defining = [f for f in files if doc_kind(f)]
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Documents indexed: {len(files)} ({cache.misses} extracted, {cache.hits} cached)")
+    print(f"Defining documents (BR/UC/VAL): {len(defining)}")
+    print(f"IDs defined: {len(definitions)}")
+    print(f"References: {sum(len(r) for r in references.values())}")
+    print(f"❌ Duplicate definitions: {len(findings['duplicates'])}")
+    print(f"❌ Dangling IDs: {len(findings['dangling'])}")
+    print(f"⚠️  Ambiguous IDs (defined in several modules): {len(findings['ambiguous'])}")
+    print(f"IDs from undefined namespaces (e.g. PRD-local FR-*): {len(findings['foreign'])}")
+    print(f"⚠️  Unreferenced rules: {sum(len(i) for i in findings['unreferenced'].values())}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    print(f"{'='*70}")
+    return 1 if findings['dangling'] or findings['duplicates'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Generate the schema coverage report from the documentation itself
+- Build model -> documents and field -> documents inverted indexes in one pass over DD/TS/FD docs
+- Compute per-module coverage percentages
+- List undocumented models and fields
+- Cache per-file extraction so regenerating after a single edit only re-reads that file
+"""
+
+import argparse
+import json
+import re
+import time
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+
+from docs_corpus import (DOCS_APP_DIR, SCHEMA_PATH, Corpus, FileCache, file_digest,
+                         module_of, rel)
+from verify_dd_against_schema import parse_prisma_models, parse_prisma_schema
+
+DOC_TYPES = ('DD', 'TS', 'FD')
+DEFAULT_OUTPUT = DOCS_APP_DIR / 'SCHEMA-COVERAGE-REPORT.md'
+
+# Bump when extract_references() changes so cached entries are discarded
+EXTRACTOR_VERSION = 1
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+BACKTICK_PATTERN = re.compile(r'`(\w+)`')
+QUALIFIED_PATTERN = re.compile(r'\b(\w+)\.(\w+)\b')
+
+
+def extract_references(content, schema_models):
+    """Return {model: [documented fields]} for every schema model mentioned in content"""
+    words = set(WORD_PATTERN.findall(content))
+    mentioned = words & schema_models.keys()
+    if not mentioned:
+        return {}
+
+    # Identifiers that count as documenting a field: `code` spans,
+    # first cells of table rows and qualified model.field references
+    identifiers = set(BACKTICK_PATTERN.findall(content))
+    for line in content.split('\n'):
+        if line.startswith('|'):
+            first_cell = line.split('|')[1].strip().strip('`*')
+            identifiers.add(first_cell)
+    qualified = defaultdict(set)
+    for model, field in QUALIFIED_PATTERN.findall(content):
+        if model in mentioned:
+            qualified[model].add(field)
+
+    refs = {}
+    for model in sorted(mentioned):
+        fields = schema_models[model]
+        refs[model] = sorted(f for f in fields if f in identifiers or f in qualified[model])
+    return refs
+
+
+def build_index(docs, schema_models, cache, corpus):
+    """Build model -> docs and model.field -> docs inverted indexes"""
+    model_index = defaultdict(set)
+    field_index = defaultdict(set)
+
+    def extract(path):
+        return extract_references(corpus.read(path), schema_models)
+
+    for doc in docs:
+        refs = cache.get(doc, extract)
+        doc_key = rel(doc)
+        for model, fields in refs.items():
+            model_index[model].add(doc_key)
+            for field in fields:
+                field_index[f"{model}.{field}"].add(doc_key)
+
+    return model_index, field_index
+
+
+def documented_fields(prisma_models):
+    """Columns that should be documented: relation fields (typed as a model or @relation) are skipped"""
+    return {
+        model: [name for name, field in info['fields'].items()
+                if field['type'] not in prisma_models
+                and not any(a.startswith('@relation') for a in field['attributes'])]
+        for model, info in prisma_models.items()
+    }
+
+
+def compute_coverage(docs, schema_models, model_index, field_index, expected):
+    """Per-module and overall coverage numbers; expected is documented_fields()"""
+    docs_by_module = defaultdict(set)
+    for doc in docs:
+        docs_by_module[module_of(doc)].add(rel(doc))
+
+    modules = {}
+    for module, module_docs in sorted(docs_by_module.items()):
+        models = sorted(m for m, d in model_index.items() if d & module_docs)
+        total = sum(len(expected[m]) for m in models)
+        covered = sum(
+            1 for m in models for f in expected[m]
+            if field_index.get(f"{m}.{f}", set()) & module_docs
+        )
+        modules[module] = {
+            'documents': len(module_docs),
+            'models': models,
+            'fields_total': total,
+            'fields_documented': covered,
+        }
+
+    undocumented_models = sorted(m for m in schema_models if m not in model_index)
+    undocumented_fields = {}
+    for model in sorted(model_index):
+        missing = [f for f in expected[model] if f"{model}.{f}" not in field_index]
+        if missing:
+            undocumented_fields[model] = missing
+
+    fields_total = sum(len(f) for f in expected.values())
+    fields_documented = sum(
+        1 for m, fields in expected.items() for f in fields if f"{m}.{f}" in field_index
+    )
+    return {
+        'modules': modules,
+        'models_total': len(schema_models),
+        'models_documented': len(model_index),
+        'fields_total': fields_total,
+        'fields_documented': fields_documented,
+        'undocumented_models': undocumented_models,
+        'undocumented_fields': undocumented_fields,
+    }
+
+
+def pct(part, whole):
+    return f"{(part / whole * 100) if whole else 0:.1f}%"
+
+
+def render_report(coverage, schema_path, doc_count):
+    """Render coverage as Markdown"""
+    out = [
+        "# Schema Coverage Report",
+        "",
+        f"**Generated**: {date.today().isoformat()}",
+        f"**Source**: `{rel(schema_path)}`",
+        f"**Documents Scanned**: {doc_count} ({'/'.join(DOC_TYPES)})",
+        "",
+        "> Generated by `schema_coverage_report.py` - do not edit by hand.",
+        "",
+        "---",
+        "",
+        "## Summary",
+        "",
+        "| Metric | Documented | Total | Coverage |",
+        "|--------|------------|-------|----------|",
+        f"| Models | {coverage['models_documented']} | {coverage['models_total']} | "
+        f"{pct(coverage['models_documented'], coverage['models_total'])} |",
+        f"| Fields | {coverage['fields_documented']} | {coverage['fields_total']} | "
+        f"{pct(coverage['fields_documented'], coverage['fields_total'])} |",
+        "",
+        "## Coverage by Module",
+        "",
+        "| Module | Documents | Models Referenced | Fields Documented | Field Coverage |",
+        "|--------|-----------|-------------------|-------------------|----------------|",
+    ]
+    for module, stats in coverage['modules'].items():
+        out.append(
+            f"| {module} | {stats['documents']} | {len(stats['models'])} | "
+            f"{stats['fields_documented']}/{stats['fields_total']} | "
+            f"{pct(stats['fields_documented'], stats['fields_total'])} |"
+        )
+
+    out += ["", "## Undocumented Models", ""]
+    if coverage['undocumented_models']:
+        out += [f"- ❌ `{m}`" for m in coverage['undocumented_models']]
+    else:
+        out.append("All schema models are referenced by at least one document.")
+
+    out += ["", "## Undocumented Fields", ""]
+    if coverage['undocumented_fields']:
+        for model, fields in coverage['undocumented_fields'].items():
+            out.append(f"### `{model}`")
+            out.append("")
+            out += [f"- ❌ `{f}`" for f in fields]
+            out.append("")
+    else:
+        out.append("All fields of referenced models are documented.")
+
+    return '\n'.join(out).rstrip() + '\n'
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--schema', type=Path, default=SCHEMA_PATH)
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT,
+                        help="Markdown report path ('-' for stdout)")
+    parser.add_argument('--json', type=Path, help="Also write the inverted indexes as JSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+
+    schema_models = parse_prisma_schema(args.schema)
+    salt = f"{EXTRACTOR_VERSION}:{file_digest(args.schema)}"
+    cache = FileCache('schema-coverage', salt)
+
+    docs = corpus.find(DOC_TYPES)
+    model_index, field_index = build_index(docs, schema_models, cache, corpus)
+    cache.prune(docs)
+    cache.save()
+
+    expected = documented_fields(parse_prisma_models(args.schema))
+    coverage = compute_coverage(docs, schema_models, model_index, field_index, expected)
+    report = render_report(coverage, args.schema, len(docs))
+
+    if str(args.output) == '-':
+        print(report)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'models': {m: sorted(d) for m, d in sorted(model_index.items())},
+                'fields': {k: sorted(d) for k, d in sorted(field_index.items())},
+                'coverage': coverage,
+            }, f, indent=2)
+
+    elapsed = time.perf_counter() - started
+    print(f"📖 Schema: {len(schema_models)} models")
+    print(f"📄 Documents: {len(docs)} ({cache.misses} extracted, {cache.hits} cached)")
+    print(f"✅ Models documented: {coverage['models_documented']}/{coverage['models_total']}")
+    print(f"✅ Fields documented: {coverage['fields_documented']}/{coverage['fields_total']}")
+    if str(args.output) != '-':
+        print(f"📝 Report written to {rel(args.output)}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Lint the Prisma schema copies for relation integrity and costly key columns
+- fk-unindexed: a relation's foreign-key columns do not start any @id/@unique/@@index
+- fk-no-on-delete: a relation with fields: [...] has no onDelete policy
+- json-key: a Json column is used in an index, unique constraint or relation
+- string-key: a String foreign key / id column is not @db.Uuid (text compared on every join),
+  or does not match the type of the column it references
+- natural-key-not-unique: a document number or code (pr_no, grn_no, code, ref_no, ...) has no
+  @unique/@@unique, so duplicates are possible and lookups by it scan
+Lints docs/app/data-struc, docs/prisma-schema and data/schema.prisma in one run; results are
+cached per file, so an unchanged schema costs one stat.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from docs_corpus import REPO_ROOT, SCHEMA_PATH, Corpus, FileCache, rel
+from findings import finding, report
+from prisma_queries import Schema, index_columns
+from verify_dd_against_schema import parse_prisma_models
+
+# Bump when the rules change so cached results are recomputed
+LINT_VERSION = 1
+DEFAULT_SCHEMAS = [
+    SCHEMA_PATH,
+    REPO_ROOT / 'docs' / 'prisma-schema' / 'schema.prisma',
+    REPO_ROOT / 'data' / 'schema.prisma',
+]
+
+# rule -> severity
+RULES = {
+    'fk-unindexed': 'warning',
+    'fk-no-on-delete': 'warning',
+    'json-key': 'warning',
+    'string-key': 'info',
+    'natural-key-not-unique': 'warning',
+}
+GENERIC_NATURAL_KEYS = ('code', 'ref_no', 'ref_number', 'reference_no', 'reference_number', 'refNumber')
+NUMBER_SUFFIX = re.compile(r'^(\w+?)_(?:no|number)$')
+
+
+def relation_attribute(field):
+    return next((a for a in field['attributes'] if a.startswith('@relation')), None)
+
+
+def db_type(field):
+    return next((a for a in field['attributes'] if a.startswith('@db.')), None)
+
+
+def is_natural_key(model, column):
+    """code / ref_no anywhere; <doc>_no on the model it numbers (pr_no on tb_purchase_request)"""
+    if column in GENERIC_NATURAL_KEYS:
+        return True
+    match = NUMBER_SUFFIX.match(column)
+    if not match:
+        return False
+    prefix = match.group(1)
+    stem = model[3:] if model.startswith('tb_') else model
+    initials = ''.join(word[0] for word in stem.split('_'))
+    return prefix in (stem, initials) or stem.startswith(prefix + '_')
+
+
+def lint_model(schema, name):
+    """Yield (rule, line, message) for one model"""
+    model = schema.models[name]
+    fields = model['fields']
+    indexes = schema.indexes[name]
+    key_columns = {}   # column -> what makes it a key
+
+    for columns, kind in indexes:
+        for column in columns:
+            key_columns.setdefault(column, f"@@{kind}" if len(columns) > 1 else f"@{kind}")
+
+    for field_name, field in fields.items():
+        relation = relation_attribute(field)
+        if not relation or 'fields:' not in relation:
+            continue
+        columns = index_columns(relation.split('fields:', 1)[1])
+        references = index_columns(relation.split('references:', 1)[1]) if 'references:' in relation else []
+        for column in columns:
+            key_columns.setdefault(column, f"foreign key of {field_name}")
+
+        if not any(cols[:len(columns)] == tuple(columns) for cols, _ in indexes):
+            yield ('fk-unindexed', field['line'],
+                   f"{name}.{field_name}: foreign key ({', '.join(columns)}) has no index; "
+                   f"add @@index([{', '.join(columns)}])")
+        if 'onDelete:' not in relation:
+            yield ('fk-no-on-delete', field['line'],
+                   f"{name}.{field_name}: relation to {field['type']} has no onDelete policy")
+
+        target = schema.models.get(field['type'])
+        for column, referenced in zip(columns, references):
+            local, remote = fields.get(column), target and target['fields'].get(referenced)
+            if local and remote and (local['type'], db_type(local)) != (remote['type'], db_type(remote)):
+                yield ('string-key', local['line'],
+                       f"{name}.{column} is {db_type(local) or local['type']} but references "
+                       f"{field['type']}.{referenced}, which is {db_type(remote) or remote['type']}")
+
+    for column, why in sorted(key_columns.items()):
+        field = fields.get(column)
+        if field is None:
+            continue
+        if field['type'] == 'Json':
+            yield ('json-key', field['line'], f"{name}.{column}: Json column used as {why}")
+        elif field['type'] == 'String' and db_type(field) != '@db.Uuid' and \
+                (why.startswith('foreign key') or why == '@id'):
+            yield ('string-key', field['line'],
+                   f"{name}.{column}: {db_type(field) or 'String'} {why} is not @db.Uuid")
+
+    unique = {c for cols, kind in indexes if kind in ('id', 'unique') for c in cols}
+    for column, field in fields.items():
+        if field['type'] == 'String' and not field['list'] and is_natural_key(name, column) \
+                and column not in unique:
+            yield ('natural-key-not-unique', field['line'],
+                   f"{name}.{column}: natural key without @unique/@@unique")
+
+
+def lint_schema(path):
+    """Worker: [[rule, line, message]] for one schema file, in line order"""
+    schema = Schema(parse_prisma_models(path))
+    results = []
+    for name in schema.models:
+        results += [list(r) for r in lint_model(schema, name)]
+    return path, sorted(results, key=lambda r: (r[1], r[0]))
+
+
+def iter_findings(results):
+    for path, items in results:
+        for rule, line, message in items:
+            yield finding(rel(path), rule, RULES[rule], message, line=line)
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('schemas', nargs='*', type=Path,
+                        help="schema.prisma files (default: the three documentation/data copies)")
+    parser.add_argument('--rule', action='append', choices=sorted(RULES), help="Only report these rules")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+    schemas = [p.resolve() for p in (args.schemas or DEFAULT_SCHEMAS) if p.exists()]
+
+    cache = FileCache('schema-lint', salt=str(LINT_VERSION))
+    results, missing = {}, []
+    for path in schemas:
+        found, data = cache.lookup(path)
+        if found:
+            results[path] = data
+        else:
+            missing.append(path)
+    for path, data in corpus.map(lint_schema, missing):
+        cache.store(path, data)
+        results[path] = data
+    cache.prune(schemas)
+    cache.save()
+
+    ordered = [(path, [r for r in results[path] if not args.rule or r[0] in args.rule])
+               for path in schemas]
+    if args.ndjson:
+        report(iter_findings(ordered), ndjson=True)
+        return 0
+
+    print(f"Linting {len(schemas)} schema file(s)...\n")
+    counts = report(iter_findings(ordered)).by_rule
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    for path, items in ordered:
+        print(f"{rel(path)}: {len(items)} finding(s)")
+    print(f"⚠️  Unindexed foreign keys: {counts['fk-unindexed']}")
+    print(f"⚠️  Relations without onDelete: {counts['fk-no-on-delete']}")
+    print(f"⚠️  Json key columns: {counts['json-key']}")
+    print(f"ℹ️  String key columns: {counts['string-key']}")
+    print(f"⚠️  Natural keys without a unique constraint: {counts['natural-key-not-unique']}")
+    print(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+    print(f"{'='*70}")
+    return 1 if counts['fk-unindexed'] or counts['natural-key-not-unique'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,993 @@
+#!/usr/bin/env python3
+"""
+Compile the VAL-*.md validation rules into a rule set and evaluate it over the datasets
+- Compiles the machine-readable parts of each VAL document: Zod schemas (`qty: z.number().positive()`),
+  SQL CHECK constraints (`CHECK (buy_rate <= sell_rate OR buy_rate IS NULL)`), validation
+  pseudo-code (`IF unit_cost < 0 THEN ERROR`) and the per-field rule tables under `**Field**:`
+  (Required / Length / Range / Pattern rows); prose-only rules are counted, not guessed at
+- Each rule is one check on one field: required, range, length, pattern, enum, integer, or a
+  cross-field compare; --emit writes the rule set as JSON
+- Datasets: .data, lib/mock (as loaded by data_integrity) and any JSON / NDJSON load-test files
+  given as paths; each dataset becomes a table of columns, lists of objects nested in its
+  records become child tables
+- Rules run column-wise, one pass per rule over a whole column, with NumPy when it is
+  installed (pure-Python columns otherwise); a rule only applies to datasets named like its
+  document (VAL-purchase-requests -> mockPurchaseRequests) that have the column
+
+Like SQL CHECK constraints, every check except `required` passes on a null or missing value.
+"""
+
+import argparse
+import json
+import operator
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:     # column checks fall back to list comprehensions
+    np = None
+
+from data_integrity import DEFAULT_ROOTS, data_files, iter_records, singular, snake
+from docs_corpus import Corpus, FileCache, rel
+from findings import finding, report
+
+# Bump when compile_doc() changes so cached rule sets are recompiled
+COMPILER_VERSION = 2
+LOAD_TEST_SUFFIXES = ('.ndjson', '.jsonl')
+EXAMPLES = 3
+SHARED_WORDS = 2
+
+VAL_HEADING = re.compile(r'^#{2,6}\s+(?:[\d.]+\s+)?\**(VAL-[A-Z0-9-]*\d+)\b')
+HEADING = re.compile(r'^#{1,6}\s')
+FIELD_LINE = re.compile(r'^\s*(?:[-*]\s+)?\*\*Fields?\*\*:\s*`([\w.]+)`')
+ZOD_FIELD = re.compile(r'^\s*[\'"]?(\w+)[\'"]?\??\s*:\s*z\.(.*)$')
+CHECK_START = re.compile(r'\bCHECK\b(?:\s+constraint\b)?(?:\s+ensures\b)?\s*:?\s*', re.IGNORECASE)
+IF_LINE = re.compile(r'^\s*(?:ELSE\s+)?IF\s+(.+?)\s+THEN\s*$')
+ERROR_LINE = re.compile(r'^\s*(?:ERROR|RAISE|THROW|REJECT|RETURN\s+ERROR)\b', re.IGNORECASE)
+NUMBER = re.compile(r'^-?\d+(?:\.\d+)?(?:e-?\d+)?$', re.IGNORECASE)
+ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+ZOD_PATTERNS = {
+    'email': r'^[^@\s]+@[^@\s]+\.[^@\s]+$',
+    'uuid': r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$',
+    'url': r'^[A-Za-z][\w+.-]*://',
+}
+ZOD_OPTIONAL = ('optional', 'nullable', 'nullish', 'default')
+ZOD_UNCHECKED = ('object', 'any', 'unknown', 'record', 'union', 'lazy', 'custom', 'function',
+                 'instanceof', 'discriminatedUnion', 'intersection', 'tuple', 'map', 'set')
+# words in CHECK prose that would otherwise read as column names
+NOT_COLUMNS = {'length', 'constraint', 'constraints', 'ensures', 'format', 'value', 'values',
+               'with', 'on', 'in', 'enum', 'allowed', 'list', 'regex', 'active', 'not', 'both'}
+# dataset / document name words that say nothing about which entity they hold
+GENERIC_WORDS = {'mock', 'static', 'sample', 'default', 'data', 'list', 'management', 'item',
+                 'detail', 'line', 'in', 'the', 'and', 'of', 'val', 'info', 'setting'}
+
+RULES = {
+    'val-violation': 'warning',
+    'type-mismatch': 'info',
+    'parse-error': 'error',
+}
+
+
+# ---------------------------------------------------------------------------
+# Compile (process-pool worker)
+
+class Uncompilable(ValueError):
+    """An expression outside the subset this compiler understands"""
+
+
+def make_rule(field, check, **params):
+    return dict(field=field, check=check, **params)
+
+
+def number(text):
+    text = text.replace(',', '').replace('_', '')
+    if not NUMBER.match(text):
+        raise Uncompilable(text)
+    value = float(text)
+    return int(value) if value.is_integer() and '.' not in text and 'e' not in text.lower() else value
+
+
+def js_regex(literal):
+    """Python pattern for a JS regex literal /body/flags, or None if it does not compile"""
+    match = re.match(r'^/(.*)/([a-z]*)$', literal.strip(), re.DOTALL)
+    if not match:
+        return None
+    body, flags = match.groups()
+    body = body.replace('(?<', '(?P<').replace('(?P<=', '(?<=').replace('(?P<!', '(?<!')
+    if 'i' in flags:
+        body = '(?i)' + body
+    try:
+        re.compile(body)
+    except re.error:
+        return None
+    return body
+
+
+def string_literals(text):
+    return [m.group(2) for m in re.finditer(r'([\'"`])((?:\\.|(?!\1).)*)\1', text)]
+
+
+# --- Zod -------------------------------------------------------------------
+
+def zod_calls(text):
+    """[(method, argument text)] of a Zod chain `string().min(3, 'msg').regex(/x/)`"""
+    calls, pos = [], 0
+    while True:
+        match = re.compile(r'\.?\s*(\w+)\s*\(').match(text, pos)
+        if not match:
+            return calls
+        depth, i, start = 1, match.end(), match.end()
+        quote = None
+        while i < len(text) and depth:
+            ch = text[i]
+            if quote:
+                if ch == '\\':
+                    i += 1
+                elif ch == quote:
+                    quote = None
+            elif ch in '\'"`':
+                quote = ch
+            elif ch == '/' and text[start:i].rstrip()[-1:] in ('', '(', ','):
+                end = i + 1     # regex literal: skip to the closing unescaped '/'
+                in_class = False
+                while end < len(text):
+                    if text[end] == '\\':
+                        end += 1
+                    elif text[end] == '[':
+                        in_class = True
+                    elif text[end] == ']':
+                        in_class = False
+                    elif text[end] == '/' and not in_class:
+                        break
+                    end += 1
+                i = end
+            elif ch in '([{':
+                depth += 1
+            elif ch in ')]}':
+                depth -= 1
+            i += 1
+        if depth:
+            return calls
+        calls.append((match.group(1), text[start:i - 1].strip()))
+        pos = i
+
+
+def first_argument(args):
+    """Leading argument of a call, up to the first top-level comma"""
+    depth = 0
+    for i, ch in enumerate(args):
+        if ch in '([{':
+            depth += 1
+        elif ch in ')]}':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            return args[:i].strip()
+    return args.strip()
+
+
+def compile_zod(field, chain):
+    """Rules for one `field: z....` schema entry"""
+    calls = zod_calls(chain.replace('coerce.', '', 1))
+    if not calls:
+        return []
+    base, base_args = calls[0]
+    if base in ZOD_UNCHECKED:
+        return []
+    rules = []
+    optional = any(name in ZOD_OPTIONAL for name, _ in calls)
+    if not optional:
+        rules.append(make_rule(field, 'required'))
+    values = string_literals(first_argument(base_args)) if base_args.startswith('[') else []
+    if base == 'enum' and values:
+        rules.append(make_rule(field, 'enum', values=values))
+    elif base == 'literal':
+        rules.append(make_rule(field, 'enum', values=[ast_literal(base_args)]))
+
+    sized = 'length' if base in ('string', 'array') else 'range' if base == 'number' else None
+    bounds = {}
+    for name, args in calls[1:]:
+        arg = first_argument(args)
+        try:
+            if name in ('min', 'gte', 'nonempty') and sized:
+                bounds['min'] = 1 if name == 'nonempty' else number(arg)
+            elif name in ('max', 'lte') and sized:
+                bounds['max'] = number(arg)
+            elif name == 'length' and sized:
+                bounds['min'] = bounds['max'] = number(arg)
+            elif name == 'gt' and sized == 'range':
+                bounds.update(min=number(arg), min_exclusive=True)
+            elif name == 'lt' and sized == 'range':
+                bounds.update(max=number(arg), max_exclusive=True)
+        except Uncompilable:
+            continue
+        if name == 'positive':
+            bounds.update(min=0, min_exclusive=True)
+        elif name == 'nonnegative':
+            bounds.update(min=0)
+        elif name == 'negative':
+            bounds.update(max=0, max_exclusive=True)
+        elif name == 'int':
+            rules.append(make_rule(field, 'integer'))
+        elif name == 'regex':
+            pattern = js_regex(arg)
+            if pattern:
+                rules.append(make_rule(field, 'pattern', pattern=pattern))
+        elif name in ZOD_PATTERNS and base == 'string':
+            rules.append(make_rule(field, 'pattern', pattern=ZOD_PATTERNS[name]))
+    if bounds:
+        rules.append(make_rule(field, sized, **bounds))
+    return rules
+
+
+def ast_literal(text):
+    literals = string_literals(text)
+    if literals:
+        return literals[0]
+    try:
+        return number(text)
+    except Uncompilable:
+        return {'true': True, 'false': False}.get(text, text)
+
+
+# --- SQL-ish expressions (CHECK constraints, IF ... THEN ERROR) ------------
+
+TOKEN = re.compile(r"\s*(?:(?P<num>-?\d[\d,]*(?:\.\d+)?)(?![\w-])|(?P<str>'(?:[^']|'')*')"
+                   r"|(?P<op><=|>=|<>|!=|==|=|<|>|~|\(|\)|,|\+|-)|(?P<word>[A-Za-z_][\w.]*))")
+KEYWORDS = {'AND', 'OR', 'NOT', 'IS', 'NULL', 'IN', 'BETWEEN', 'TRUE', 'FALSE', 'INTERVAL'}
+TODAY_WORDS = {'CURRENT_DATE', 'NOW', 'CURRENT_TIMESTAMP', 'TODAY'}
+FLIPPED = {'<': '>', '>': '<', '<=': '>=', '>=': '<=', '=': '=', '!=': '!='}
+NEGATED = {'<': '>=', '>=': '<', '>': '<=', '<=': '>', '=': '!=', '!=': '='}
+
+
+def sql_tokens(text):
+    tokens, pos = [], 0
+    text = text.strip()
+    while pos < len(text):
+        match = TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise Uncompilable(text[pos:])
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'word' and value.upper() in KEYWORDS | TODAY_WORDS:
+            kind, value = 'kw', value.upper()
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+class Expression:
+    """Recursive-descent parser for the comparison subset of SQL used in the VAL docs.
+
+    Nodes: ('and', [..]), ('or', [..]), ('cmp', left, op, right), ('null', field, is_null),
+    ('in', field, [values]), ('between', field, low, high), ('match', field, pattern).
+    Operands: ('field', name) or ('value', number | ISO date | 'CURRENT_DATE[+Nd]' | str | bool).
+    """
+
+    def __init__(self, text):
+        self.tokens = sql_tokens(text)
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else ('eof', '')
+
+    def take(self, value=None):
+        token = self.peek()
+        if token[0] == 'eof' or (value is not None and token[1] != value):
+            raise Uncompilable(f"expected {value}, got {token[1]}")
+        self.pos += 1
+        return token
+
+    def parse(self):
+        node = self.disjunction()
+        if self.peek()[0] != 'eof':
+            raise Uncompilable(self.peek()[1])
+        return node
+
+    def disjunction(self):
+        parts = [self.conjunction()]
+        while self.peek()[1] == 'OR':
+            self.take()
+            parts.append(self.conjunction())
+        return parts[0] if len(parts) == 1 else ('or', parts)
+
+    def conjunction(self):
+        parts = [self.atom()]
+        while self.peek()[1] == 'AND':
+            self.take()
+            parts.append(self.atom())
+        return parts[0] if len(parts) == 1 else ('and', parts)
+
+    def atom(self):
+        if self.peek()[1] == '(':
+            self.take()
+            node = self.disjunction()
+            self.take(')')
+            return node
+        left = self.operand()
+        kind, op = self.peek()
+        if op == 'IS':
+            self.take()
+            negate = self.peek()[1] == 'NOT'
+            if negate:
+                self.take()
+            self.take('NULL')
+            return ('null', self.name(left), not negate)
+        if op == 'IN':
+            self.take()
+            self.take('(')
+            values = [self.operand()]
+            while self.peek()[1] == ',':
+                self.take()
+                values.append(self.operand())
+            self.take(')')
+            return ('in', self.name(left), [self.literal(v) for v in values])
+        if op == 'BETWEEN':
+            self.take()
+            low = self.operand()
+            self.take('AND')
+            return ('between', self.name(left), self.literal(low), self.literal(self.operand()))
+        if op == '~':
+            self.take()
+            pattern = self.literal(self.operand())
+            return ('match', self.name(left), pattern)
+        if kind == 'op' and op in ('<', '>', '<=', '>=', '=', '==', '<>', '!='):
+            self.take()
+            op = {'==': '=', '<>': '!='}.get(op, op)
+            return ('cmp', left, op, self.operand())
+        raise Uncompilable(op)
+
+    def operand(self):
+        kind, value = self.take()
+        if kind == 'num':
+            return ('value', number(value))
+        if kind == 'str':
+            return ('value', value[1:-1].replace("''", "'"))
+        if kind == 'word':
+            if value.lower() in NOT_COLUMNS or '(' == self.peek()[1]:
+                raise Uncompilable(value)
+            return ('field', value)
+        if value in ('TRUE', 'FALSE'):
+            return ('value', value == 'TRUE')
+        if value in TODAY_WORDS:
+            if self.peek()[1] == '(':
+                self.take()
+                self.take(')')
+            days = 0
+            if self.peek()[1] in ('+', '-') and self.tokens[self.pos + 1:self.pos + 2] == [('kw', 'INTERVAL')]:
+                sign = 1 if self.take()[1] == '+' else -1
+                self.take('INTERVAL')
+                interval = re.match(r"^'(\d+)\s*days?'$", self.take()[1])
+                if not interval:
+                    raise Uncompilable('INTERVAL')
+                days = sign * int(interval.group(1))
+            return ('value', f"CURRENT_DATE{days:+d}d" if days else 'CURRENT_DATE')
+        raise Uncompilable(value)
+
+    @staticmethod
+    def name(operand):
+        if operand[0] != 'field':
+            raise Uncompilable(str(operand[1]))
+        return operand[1]
+
+    @staticmethod
+    def literal(operand):
+        if operand[0] != 'value':
+            raise Uncompilable(operand[1])
+        return operand[1]
+
+
+def is_bound(value):
+    """Numbers, ISO dates and CURRENT_DATE can bound a range; other literals cannot"""
+    return (isinstance(value, (int, float)) and not isinstance(value, bool)) or \
+        (isinstance(value, str) and (ISO_DATE.match(value) or value.startswith('CURRENT_DATE')))
+
+
+def comparison_rule(left, op, right):
+    """Rule for `left op right`, either side a field or a value"""
+    if left[0] == 'value' and right[0] == 'field':
+        left, op, right = right, FLIPPED[op], left
+    if left[0] != 'field':
+        raise Uncompilable(str(left[1]))
+    field = left[1]
+    if right[0] == 'field':
+        return make_rule(field, 'compare', op=op, other=right[1])
+    value = right[1]
+    if op == '=':
+        return make_rule(field, 'enum', values=[value])
+    if op == '!=' or not is_bound(value):
+        raise Uncompilable(f"{field} {op} {value}")
+    if op in ('>', '>='):
+        return make_rule(field, 'range', min=value, **({'min_exclusive': True} if op == '>' else {}))
+    return make_rule(field, 'range', max=value, **({'max_exclusive': True} if op == '<' else {}))
+
+
+def expression_rules(node):
+    """Rules that together hold exactly when a CHECK expression holds"""
+    kind = node[0]
+    if kind == 'and':
+        return [r for part in node[1] for r in expression_rules(part)]
+    if kind == 'or':
+        # `x > 0 OR x IS NULL`: every check passes on null already
+        rest = [p for p in node[1] if not (p[0] == 'null' and p[2])]
+        if len(rest) != 1:
+            raise Uncompilable('OR')
+        return expression_rules(rest[0])
+    if kind == 'cmp':
+        return [comparison_rule(node[1], node[2], node[3])]
+    if kind == 'null':
+        if node[2]:
+            raise Uncompilable('IS NULL')
+        return [make_rule(node[1], 'required')]
+    if kind == 'in':
+        return [make_rule(node[1], 'enum', values=node[2])]
+    if kind == 'between':
+        if not (is_bound(node[2]) and is_bound(node[3])):
+            raise Uncompilable('BETWEEN')
+        return [make_rule(node[1], 'range', min=node[2], max=node[3])]
+    if kind == 'match':
+        re.compile(node[2])
+        return [make_rule(node[1], 'pattern', pattern=node[2])]
+    raise Uncompilable(kind)
+
+
+def error_condition_rules(node):
+    """Rules for `IF <node> THEN ERROR`: whatever must hold for the error not to fire"""
+    if node[0] == 'and':
+        # `unit_cost IS NOT NULL AND unit_cost < 0`: the guards only skip nulls
+        rest = [p for p in node[1] if not (p[0] == 'null' and not p[2])]
+        if len(rest) != 1:
+            raise Uncompilable('AND')
+        node = rest[0]
+    if node[0] == 'null' and node[2]:
+        return [make_rule(node[1], 'required')]
+    if node[0] == 'cmp' and node[2] != '=':
+        rule = comparison_rule(node[1], NEGATED[node[2]], node[3])
+        if rule['check'] == 'enum':
+            raise Uncompilable('!=')
+        return [rule]
+    raise Uncompilable(node[0])
+
+
+def check_expressions(line):
+    """Candidate expressions after each CHECK on a line"""
+    for match in CHECK_START.finditer(line):
+        rest = line[match.end():]
+        if rest.startswith('('):
+            depth = 0
+            for i, ch in enumerate(rest):
+                depth += (ch == '(') - (ch == ')')
+                if depth == 0:
+                    yield rest[1:i]
+                    break
+        elif rest.startswith('`'):
+            yield rest[1:].split('`', 1)[0]
+        else:
+            yield re.split(r'\.(?:\s|$)|;|,\s|\s\(', rest, 1)[0].rstrip('.')
+
+
+# --- Field rule tables -----------------------------------------------------
+
+def table_rules(field, cells):
+    """Rules for one `| Rule | Validation | Error Message |` row under a **Field**: line"""
+    label = cells[0].strip('* ').lower()
+    text = ' '.join(cells[1:-1]) if len(cells) > 2 else ' '.join(cells[1:])
+    plain = text.replace(',', '')
+    if label.startswith('required') and 'at least one' not in text.lower():
+        return [make_rule(field, 'required')]
+    if 'length' in label:
+        between = re.search(r'(\d+)\s*(?:-|–|to)\s*(\d+)\s*char', plain)
+        if between:
+            return [make_rule(field, 'length', min=int(between.group(1)), max=int(between.group(2)))]
+        most = re.search(r'(?:max(?:imum)?|<=|up to|not exceed)\s*(\d+)', plain, re.IGNORECASE)
+        least = re.search(r'(?:min(?:imum)?|>=|at least)\s*(\d+)', plain, re.IGNORECASE)
+        if label.startswith('max') and most:
+            return [make_rule(field, 'length', max=int(most.group(1)))]
+        if label.startswith('min') and least:
+            return [make_rule(field, 'length', min=int(least.group(1)))]
+        bounds = {k: int(m.group(1)) for k, m in (('min', least), ('max', most)) if m}
+        return [make_rule(field, 'length', **bounds)] if bounds else []
+    if label == 'range':
+        between = re.search(r'(-?\d+(?:\.\d+)?)\s*(?:-|–|to)\s*(-?\d+(?:\.\d+)?)', plain)
+        if between:
+            return [make_rule(field, 'range', min=number(between.group(1)), max=number(between.group(2)))]
+    if label in ('pattern', 'format'):
+        pattern = re.search(r'`(\^[^`]+)`', text)
+        if pattern:
+            try:
+                re.compile(pattern.group(1))
+                return [make_rule(field, 'pattern', pattern=pattern.group(1))]
+            except re.error:
+                pass
+    return []
+
+
+def table_cells(line):
+    return [c.strip() for c in line.strip().strip('|').split('|')]
+
+
+def compile_doc(path):
+    """Worker: (path, {'rules': [rule], 'sections': n, 'compiled': n}) for one VAL document.
+
+    Each rule carries its VAL id (nearest heading), source line and source kind. A section is
+    compiled when at least one rule came out of it.
+    """
+    rules = []
+    rule_id, field, fence = None, None, False
+    sections, compiled = set(), set()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        lines = f.read().replace('\x00', '').split('\n')
+
+    def add(new, line_no, source):
+        for rule in new:
+            rule.update(id=rule_id, line=line_no, source=source)
+            rules.append(rule)
+        if new:
+            compiled.add(rule_id)
+
+    for i, line in enumerate(lines):
+        line_no = i + 1
+        if line.lstrip().startswith(('```', '~~~')):
+            fence = not fence
+            continue
+        if not fence and HEADING.match(line):
+            field = None
+            heading = VAL_HEADING.match(line)
+            if heading:
+                rule_id = heading.group(1)
+                sections.add(rule_id)
+            continue
+        if not fence:
+            match = FIELD_LINE.match(line)
+            if match:
+                field = match.group(1).split('.')[-1] if match.group(1).startswith('tb_') else match.group(1)
+                continue
+        if 'CHECK' in line.upper():
+            for text in check_expressions(line):
+                try:
+                    add(expression_rules(Expression(text).parse()), line_no, 'check')
+                except (Uncompilable, re.error, IndexError):
+                    pass
+        if fence:
+            match = ZOD_FIELD.match(line)
+            if match:
+                chain = match.group(2)
+                j = i
+                while j + 1 < len(lines) and j < i + 15 and (
+                        chain.count('(') > chain.count(')') or lines[j + 1].lstrip().startswith('.')):
+                    j += 1
+                    chain += ' ' + lines[j].strip()
+                add(compile_zod(match.group(1), chain), line_no, 'zod')
+                continue
+            match = IF_LINE.match(line)
+            if match and any(ERROR_LINE.match(l) for l in lines[i + 1:i + 3]):
+                try:
+                    add(error_condition_rules(Expression(match.group(1)).parse()), line_no, 'logic')
+                except (Uncompilable, IndexError):
+                    pass
+        elif field and line.startswith('|'):
+            cells = table_cells(line)
+            if cells and not set(cells[0]) <= set('-: ') and cells[0].lower() != 'rule':
+                try:
+                    add(table_rules(field, cells), line_no, 'table')
+                except Uncompilable:
+                    pass
+
+    return path, {'rules': dedupe(rules), 'sections': len(sections), 'compiled': len(compiled & sections)}
+
+
+def rule_key(rule):
+    return json.dumps({k: v for k, v in rule.items() if k not in ('id', 'line', 'source')}, sort_keys=True)
+
+
+def dedupe(rules):
+    """First occurrence of each distinct check (Zod and CHECK often state the same bound)"""
+    seen = {}
+    for rule in rules:
+        seen.setdefault(rule_key(rule), rule)
+    return list(seen.values())
+
+
+def val_docs(corpus):
+    return [p for p in corpus.find(('VAL',)) if p.suffix == '.md' and 'template-guide' not in p.parts]
+
+
+# ---------------------------------------------------------------------------
+# Datasets as column tables
+
+def words(name):
+    """Entity words of a file, dataset or document name: mockPurchaseRequests -> {purchase, request}"""
+    return {singular(w) for w in snake(name).split('_') if len(w) > 2} - GENERIC_WORDS
+
+
+def scope_words(docs):
+    """doc -> the words of its name that pick out its datasets; a word in more than
+    SHARED_WORDS document names (inventory, stock) is left out"""
+    named = {rel(path): words(path.stem[len('VAL-'):]) for path in docs}
+    usage = defaultdict(int)
+    for names in named.values():
+        for word in names:
+            usage[word] += 1
+    return {doc: {w for w in names if usage[w] <= SHARED_WORDS} for doc, names in named.items()}
+
+
+class Table:
+    """Rows of one dataset as aligned columns: column name -> [value or None per row]"""
+
+    def __init__(self, file, name):
+        self.file = file
+        self.name = name
+        self.rows = 0
+        self.lines = []
+        self.columns = {}
+
+    def append(self, row, line):
+        for key, value in row.items():
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = [None] * self.rows
+            column.append(value)
+        self.rows += 1
+        self.lines.append(line)
+        for column in self.columns.values():
+            if len(column) < self.rows:
+                column.append(None)
+
+    def extend(self, times):
+        """Repeat every row `times` times over (load testing)"""
+        self.rows *= times
+        self.lines *= times
+        for key in self.columns:
+            self.columns[key] *= times
+
+    def column_names(self):
+        """normalized field name -> column key; a bare name also matches one level down
+        (priceAssignment.currency), top-level keys winning"""
+        names = {}
+        for key in sorted(self.columns, key=lambda k: (k.count('.'), k)):
+            variants = (key, key.rsplit('.', 1)[-1]) if key.count('.') <= 1 else (key,)
+            for variant in variants:
+                names.setdefault(variant.replace('_', '').lower(), key)
+        return names
+
+
+def flatten(record, prefix=''):
+    """(scalar columns with dotted keys, [(list key, [objects])]) of one record"""
+    columns, children = {}, []
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            nested, nested_children = flatten(value, name + '.')
+            columns.update(nested)
+            children += nested_children
+        elif isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+            children.append((name, value))
+        elif isinstance(value, (str, int, float, bool, list)) or value is None:
+            columns[name] = value
+    return columns, children
+
+
+def load_rows(path):
+    """Yield (dataset, line, record) for a mock/seed data file or an NDJSON load-test file"""
+    if path.suffix in LOAD_TEST_SUFFIXES:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    yield path.stem, line_no, json.loads(line)
+    else:
+        yield from iter_records(path)
+
+
+def load_tables(path):
+    """Worker: (path, ({name: Table}, error)) with one table per dataset and nested object list"""
+    tables = {}
+    try:
+        for dataset, line, record in load_rows(Path(path)):
+            pending = [(dataset, record)]
+            while pending:
+                name, item = pending.pop()
+                if not isinstance(item, dict):
+                    continue
+                columns, children = flatten(item)
+                table = tables.get(name)
+                if table is None:
+                    table = tables[name] = Table(path, name)
+                table.append(columns, line)
+                for key, objects in children:
+                    pending.extend((f"{name}.{key}", o) for o in objects)
+    except (ValueError, UnicodeDecodeError) as e:
+        return path, ({}, str(e))
+    return path, (tables, None)
+
+
+def dataset_files(roots):
+    files = data_files(roots)
+    for root in map(Path, roots):
+        if root.is_dir():
+            files += [p for p in root.rglob('*') if p.suffix in LOAD_TEST_SUFFIXES and p.is_file()]
+    return sorted(set(files))
+
+
+# ---------------------------------------------------------------------------
+# Column-wise evaluation
+
+OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+             '=': operator.eq, '!=': operator.ne}
+
+
+def bound_value(value, today):
+    """Numeric form of a rule bound: dates become ordinals so they compare like numbers"""
+    if isinstance(value, str):
+        if value.startswith('CURRENT_DATE'):
+            days = int(value[len('CURRENT_DATE'):-1] or 0)
+            return (today + timedelta(days=days)).toordinal()
+        return date.fromisoformat(value[:10]).toordinal()
+    return value
+
+
+def numeric(value):
+    """Number, date ordinal, None (null) or False (not comparable) for one cell"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        if NUMBER.match(text):
+            return float(text)
+        if ISO_DATE.match(text):
+            try:
+                return date.fromisoformat(text[:10]).toordinal()
+            except ValueError:
+                return False
+    return False
+
+
+class Column:
+    """One table column converted once for numeric checks: values, null mask, not-comparable rows"""
+
+    def __init__(self, values):
+        converted = [numeric(v) for v in values]
+        self.mismatched = [i for i, v in enumerate(converted) if v is False]
+        if np is not None:
+            self.values = np.array([np.nan if v is None or v is False else v for v in converted],
+                                   dtype=float)
+        else:
+            self.values = [None if v is False else v for v in converted]
+
+    def failing(self, op, bound):
+        """Rows where `value op bound` is false; nulls pass. bound: number or another Column"""
+        test = OPERATORS[op]
+        if np is not None:
+            other = bound.values if isinstance(bound, Column) else bound
+            with np.errstate(invalid='ignore'):
+                ok = test(self.values, other) | np.isnan(self.values) | np.isnan(other)
+            return np.flatnonzero(~ok).tolist()
+        others = bound.values if isinstance(bound, Column) else [bound] * len(self.values)
+        return [i for i, (v, b) in enumerate(zip(self.values, others))
+                if v is not None and b is not None and not test(v, b)]
+
+
+def lengths(values):
+    return [len(v) if isinstance(v, (str, list)) else None for v in values]
+
+
+def object_column(values):
+    """1-D object array; np.array() would turn a column of lists into a 2-D array"""
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def is_missing(values):
+    """Rows with a null / missing / blank value"""
+    if np is not None:
+        column = object_column(values)
+        blank = np.array([isinstance(v, str) and not v.strip() for v in values], dtype=bool)
+        return np.flatnonzero(np.equal(column, None) | blank).tolist()
+    return [i for i, v in enumerate(values) if v is None or (isinstance(v, str) and not v.strip())]
+
+
+def failing_rows(rule, table, column_key, names, today, converted):
+    """(failing row indices, mismatched row indices) for one rule over one table"""
+    values = table.columns[column_key]
+    check = rule['check']
+
+    def numeric_column(key):
+        if key not in converted:
+            converted[key] = Column(table.columns[key])
+        return converted[key]
+
+    if check == 'required':
+        return is_missing(values), []
+    if check in ('range', 'length'):
+        column = numeric_column(column_key) if check == 'range' else Column(lengths(values))
+        failing = set()
+        if 'min' in rule:
+            failing.update(column.failing('>' if rule.get('min_exclusive') else '>=',
+                                          bound_value(rule['min'], today)))
+        if 'max' in rule:
+            failing.update(column.failing('<' if rule.get('max_exclusive') else '<=',
+                                          bound_value(rule['max'], today)))
+        return sorted(failing), column.mismatched if check == 'range' else []
+    if check == 'integer':
+        column = numeric_column(column_key)
+        if np is not None:
+            return np.flatnonzero(np.mod(column.values, 1) > 0).tolist(), column.mismatched
+        return [i for i, v in enumerate(column.values) if v is not None and v % 1], column.mismatched
+    if check == 'compare':
+        other = names.get(rule['other'].replace('_', '').lower())
+        if other is None:
+            return [], []
+        column = numeric_column(column_key)
+        return column.failing(rule['op'], numeric_column(other)), column.mismatched
+    if check == 'enum':
+        allowed = set(map(str, rule['values']))
+        # a list of values (statuses: ['active']) passes when each element is allowed
+        cells = ['' if v is None else str(v) if not isinstance(v, list) else
+                 next((str(e) for e in v if str(e) not in allowed), '') for v in values]
+        if np is not None:
+            column = object_column(cells)
+            ok = np.isin(column, list(allowed)) | (column == '')
+            return np.flatnonzero(~ok).tolist(), []
+        return [i for i, v in enumerate(cells) if v and v not in allowed], []
+    if check == 'pattern':
+        pattern = re.compile(rule['pattern'])
+        return [i for i, v in enumerate(values) if isinstance(v, str) and v and not pattern.search(v)], \
+            [i for i, v in enumerate(values) if v is not None and not isinstance(v, str)]
+    return [], []
+
+
+def describe(rule):
+    check, field = rule['check'], rule['field']
+    if check == 'range':
+        parts = []
+        if 'min' in rule:
+            parts.append(f"{field} {'>' if rule.get('min_exclusive') else '>='} {rule['min']}")
+        if 'max' in rule:
+            parts.append(f"{field} {'<' if rule.get('max_exclusive') else '<='} {rule['max']}")
+        return ' and '.join(parts)
+    if check == 'length':
+        return f"len({field}) in [{rule.get('min', 0)}, {rule.get('max', '∞')}]"
+    if check == 'compare':
+        return f"{field} {rule['op']} {rule['other']}"
+    if check == 'enum':
+        return f"{field} in {rule['values']}"
+    if check == 'pattern':
+        return f"{field} ~ /{rule['pattern']}/"
+    return f"{field} {check}"
+
+
+def in_scope(rule, table, doc_words, everywhere):
+    return everywhere or bool(doc_words[rule['doc']] & (words(Path(table.file).stem) | words(table.name)))
+
+
+def evaluate(rules, tables, doc_words, today, everywhere=False):
+    """Yield findings per (rule, table) with failing rows; each column is converted once per table"""
+    for table in tables:
+        names = table.column_names()
+        converted = {}
+        for rule in rules:
+            key = names.get(rule['field'].replace('_', '').lower())
+            if key is None or not in_scope(rule, table, doc_words, everywhere):
+                continue
+            failing, mismatched = failing_rows(rule, table, key, names, today, converted)
+            origin = f"{rule['id'] or 'VAL'} ({rule['doc']}:{rule['line']})"
+            file = rel(table.file)
+            if failing:
+                examples = ', '.join(f"line {table.lines[i]}: {table.columns[key][i]!r}"
+                                     for i in failing[:EXAMPLES])
+                yield finding(file, 'val-violation', 'warning',
+                              f"{table.name}.{key}: {len(failing)} of {table.rows} row(s) break "
+                              f"{describe(rule)} from {origin} — {examples}",
+                              line=table.lines[failing[0]])
+            if mismatched:
+                yield finding(file, 'type-mismatch', 'info',
+                              f"{table.name}.{key}: {len(mismatched)} value(s) cannot be checked "
+                              f"against {describe(rule)} from {origin}, e.g. "
+                              f"{table.columns[key][mismatched[0]]!r}",
+                              line=table.lines[mismatched[0]])
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help="Data files or folders, incl. .ndjson/.jsonl load-test data "
+                             "(default: .data and lib/mock)")
+    parser.add_argument('--emit', metavar='FILE',
+                        help="Write the compiled rule set as JSON ('-' for stdout) and exit")
+    parser.add_argument('--all-datasets', action='store_true',
+                        help="Apply every rule to every dataset with the column, not only "
+                             "datasets named like the rule's document")
+    parser.add_argument('--repeat', type=int, default=1, metavar='N',
+                        help="Evaluate each dataset N times over (load test)")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    docs = val_docs(corpus)
+    cache = FileCache('val-rules', salt=str(COMPILER_VERSION))
+    compiled, missing = {}, []
+    for path in docs:
+        found, data = cache.lookup(path)
+        if found:
+            compiled[path] = data
+        else:
+            missing.append(path)
+    for path, data in corpus.map(compile_doc, missing):
+        cache.store(path, data)
+        compiled[path] = data
+    cache.prune(docs)
+    cache.save()
+
+    rules = [dict(rule, doc=rel(path)) for path in docs for rule in compiled[path]['rules']]
+    if args.emit:
+        text = json.dumps({'version': COMPILER_VERSION, 'rules': rules}, indent=2, ensure_ascii=False)
+        if args.emit == '-':
+            print(text)
+        else:
+            Path(args.emit).write_text(text + '\n', encoding='utf-8')
+            print(f"📝 Wrote {len(rules)} rule(s) from {len(docs)} VAL document(s) to {args.emit}")
+        return 0
+
+    files = dataset_files(args.paths or DEFAULT_ROOTS)
+    started = time.perf_counter()
+    tables, errors = [], []
+    for path, (loaded, error) in corpus.map(load_tables, files):
+        if error:
+            errors.append(finding(rel(path), 'parse-error', 'error', f"Could not load: {error}"))
+        for table in loaded.values():
+            table.extend(max(args.repeat, 1))
+            tables.append(table)
+    loaded_at = time.perf_counter()
+
+    doc_words = scope_words(docs)
+    today = date.today()
+    findings = (f for batch in (errors, evaluate(rules, tables, doc_words, today, args.all_datasets))
+                for f in batch)
+    if args.ndjson:
+        report(findings, ndjson=True)
+        return 0
+
+    rows = sum(t.rows for t in tables)
+    print(f"Evaluating {len(rules)} rule(s) from {len(docs)} VAL document(s) over "
+          f"{rows} row(s) in {len(tables)} table(s)...\n")
+    counts = report(findings).by_rule
+    evaluated_at = time.perf_counter()
+
+    sections = sum(c['sections'] for c in compiled.values())
+    covered = sum(c['compiled'] for c in compiled.values())
+    by_check = defaultdict(int)
+    by_source = defaultdict(int)
+    for rule in rules:
+        by_check[rule['check']] += 1
+        by_source[rule['source']] += 1
+
+    print(f"\n{'='*70}")
+    print("SUMMARY")
+    print(f"{'='*70}")
+    print(f"Rules compiled: {len(rules)} "
+          f"({', '.join(f'{k} {v}' for k, v in sorted(by_check.items()))})")
+    print(f"Sources: {', '.join(f'{k} {v}' for k, v in sorted(by_source.items()))}")
+    print(f"VAL sections with machine-readable rules: {covered} of {sections} "
+          f"(the rest are prose only)")
+    print(f"Rows checked: {rows} in {len(tables)} table(s) "
+          f"[{'NumPy' if np is not None else 'pure Python'} columns; "
+          f"load {loaded_at - started:.2f}s, evaluate {evaluated_at - loaded_at:.2f}s]")
+    print(f"⚠️  Rule violations (rule x dataset): {counts['val-violation']}")
+    print(f"ℹ️  Columns with values of the wrong type: {counts['type-mismatch']}")
+    print(f"❌ Files that failed to load: {counts['parse-error']}")
+    print(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+    print(f"{'='*70}")
+    return 1 if counts['val-violation'] or counts['parse-error'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
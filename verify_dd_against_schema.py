@@ -4,65 +4,177 @@ Verify DD (Data Definition) files against Prisma schema
 - Extract models and fields from Prisma schema
 - Compare with data structures in DD files
 - Highlight differences
+- Findings stream file by file as they are found (--ndjson for one JSON object per line)
 """
 
+import argparse
 import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+from docs_corpus import DOCS_DIR, SCHEMA_PATH, Corpus, rel
+from findings import finding, report
+
 # DD files to verify
 dd_files = [
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/settings/DD-settings.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/permission-management/DD-permission-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/system-integrations/DD-system-integrations.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/business-rules/DD-business-rules.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/workflow/DD-workflow.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/location-management/DD-location-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/user-management/DD-user-management.md",
-    "/Users/peak/Documents/GitHub/carmen/docs/app/system-administration/monitoring/DD-monitoring.md",
+    str(DOCS_DIR / "app/system-administration/settings/DD-settings.md"),
+    str(DOCS_DIR / "app/system-administration/permission-management/DD-permission-management.md"),
+    str(DOCS_DIR / "app/system-administration/system-integrations/DD-system-integrations.md"),
+    str(DOCS_DIR / "app/system-administration/business-rules/DD-business-rules.md"),
+    str(DOCS_DIR / "app/system-administration/workflow/DD-workflow.md"),
+    str(DOCS_DIR / "app/system-administration/location-management/DD-location-management.md"),
+    str(DOCS_DIR / "app/system-administration/user-management/DD-user-management.md"),
+    str(DOCS_DIR / "app/system-administration/monitoring/DD-monitoring.md"),
 ]
 
-schema_path = "/Users/peak/Documents/GitHub/carmen/docs/app/data-struc/schema.prisma"
+schema_path = SCHEMA_PATH
 
-def parse_prisma_schema(schema_path):
-    """Parse Prisma schema to extract models and their fields"""
-    models = {}
+def iter_prisma_blocks(schema_path):
+    """Yield (kind, name, start_line, body_lines) for each model/enum block.
 
+    Works line by line so braces inside comments (e.g. JSON examples on
+    `Json` fields) cannot terminate a block early. body_lines holds
+    (line_no, code) pairs with `//` comments and `/* */` blocks stripped.
+    """
     with open(schema_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+        lines = f.read().split('\n')
+
+    block = None
+    in_comment = False
+    for line_no, raw in enumerate(lines, 1):
+        line = raw
+        if in_comment:
+            if '*/' not in line:
+                continue
+            line = line.split('*/', 1)[1]
+            in_comment = False
+        if '/*' in line:
+            head, tail = line.split('/*', 1)
+            if '*/' not in tail:
+                in_comment = True
+            line = head
+        code = line.split('//', 1)[0].strip()
+
+        if block is None:
+            header = re.match(r'^(model|enum|view|type)\s+(\w+)\s*\{', code)
+            if header:
+                block = (header.group(1), header.group(2), line_no, [])
+            continue
 
-    # Find all model definitions
-    model_pattern = r'model\s+(\w+)\s*\{([^\}]+)\}'
-    matches = re.finditer(model_pattern, content, re.MULTILINE | re.DOTALL)
+        if code == '}':
+            yield block
+            block = None
+        elif code:
+            block[3].append((line_no, code))
 
-    for match in matches:
-        model_name = match.group(1)
-        model_body = match.group(2)
+def parse_prisma_schema(schema_path):
+    """Parse Prisma schema to extract models and their fields"""
+    models = {}
+
+    for kind, model_name, _, body in iter_prisma_blocks(schema_path):
+        if kind != 'model':
+            continue
 
-        # Extract fields from model body
+        # Extract fields from model body (skip @@index, @@unique, ...)
         fields = []
-        field_pattern = r'^\s*(\w+)\s+(\w+)'
-        for line in model_body.split('\n'):
-            field_match = re.match(field_pattern, line.strip())
-            if field_match and not line.strip().startswith('//'):
-                field_name = field_match.group(1)
-                field_type = field_match.group(2)
-                # Skip relation fields (@@, @@index, @@unique)
-                if not field_name.startswith('@@'):
-                    fields.append(field_name)
+        field_pattern = r'^(\w+)\s+(\w+)'
+        for _, code in body:
+            field_match = re.match(field_pattern, code)
+            if field_match:
+                fields.append(field_match.group(1))
 
         models[model_name] = fields
 
     return models
 
-def extract_tables_from_dd(dd_path):
+def split_attributes(text):
+    """Split '@id @default(now()) @db.VarChar(20)' into ['@id', '@default(now())', ...]"""
+    attrs = []
+    depth = 0
+    in_string = False
+    current = ''
+    for ch in text:
+        if ch == '"':
+            in_string = not in_string
+        elif not in_string:
+            if ch == '@' and depth == 0 and current.strip() and not current.endswith('@'):
+                attrs.append(current.strip())
+                current = ''
+            if ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+        current += ch
+    if current.strip():
+        attrs.append(current.strip())
+    return attrs
+
+def parse_prisma_models(schema_path):
+    """Parse Prisma schema into models with field types and modifiers.
+
+    Returns {model: {'line': n, 'fields': {name: field}, 'block_attributes': [...]}}
+    where field is {'type', 'optional', 'list', 'attributes', 'line'}.
+    """
+    models = {}
+    field_pattern = re.compile(r'^(\w+)\s+(\w+)(\[\])?(\?)?\s*(.*)$')
+
+    for kind, name, start_line, body in iter_prisma_blocks(schema_path):
+        if kind != 'model':
+            continue
+
+        fields = {}
+        block_attributes = []
+        for line_no, code in body:
+            if code.startswith('@@'):
+                block_attributes.append(code)
+                continue
+            match = field_pattern.match(code)
+            if not match:
+                continue
+            field_name, field_type, is_list, optional, rest = match.groups()
+            fields[field_name] = {
+                'type': field_type,
+                'optional': bool(optional),
+                'list': bool(is_list),
+                'attributes': split_attributes(rest),
+                'line': line_no,
+            }
+
+        models[name] = {
+            'line': start_line,
+            'fields': fields,
+            'block_attributes': block_attributes,
+        }
+
+    return models
+
+def parse_prisma_enums(schema_path):
+    """Parse Prisma schema enums into {enum: [values]}"""
+    return {
+        name: [code.split()[0] for _, code in body]
+        for kind, name, _, body in iter_prisma_blocks(schema_path)
+        if kind == 'enum'
+    }
+
+def field_attribute(field, name):
+    """Return the argument string of attribute `name` (e.g. 'default'), '' if bare, None if absent"""
+    for attr in field['attributes']:
+        if attr == f'@{name}':
+            return ''
+        if attr.startswith(f'@{name}('):
+            return attr[len(name) + 2:-1]
+    return None
+
+def extract_tables_from_dd(dd_path, corpus=None):
     """Extract table/model references from DD file"""
+    return find_table_references((corpus or Corpus()).read(dd_path))
+
+def find_table_references(content):
+    """Return (tables mentioned, {table: fields}) for tb_* references in content"""
     tables_mentioned = set()
     fields_by_table = defaultdict(set)
 
-    with open(dd_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
     # Look for table references in various formats:
     # 1. Explicit table names: tb_*, Table:
     # 2. Field references: table.field
@@ -86,85 +198,90 @@ def extract_tables_from_dd(dd_path):
 
     return tables_mentioned, fields_by_table
 
-def verify_dd_file(dd_path, schema_models):
-    """Verify a single DD file against Prisma schema"""
-    print(f"\n{'='*80}")
-    print(f"VERIFYING: {Path(dd_path).name}")
-    print(f"{'='*80}\n")
-
-    tables_mentioned, fields_by_table = extract_tables_from_dd(dd_path)
-
+def first_lines(content):
+    """({table: first line}, {(table, field): first line}) for tb_* references in content"""
+    tables, fields = {}, {}
+    for line_no, line in enumerate(content.split('\n'), 1):
+        if 'tb_' not in line:
+            continue
+        for match in re.finditer(r'\b(tb_\w+)\b', line):
+            tables.setdefault(match.group(1), line_no)
+        for match in re.finditer(r'\b(tb_\w+)\.(\w+)\b', line):
+            fields.setdefault(match.groups(), line_no)
+    return tables, fields
+
+def dd_findings(dd_path, content, schema_models, stats):
+    """Yield findings for one DD file; stats counts the tables and fields that check out"""
+    path = rel(dd_path)
+    tables_mentioned, fields_by_table = find_table_references(content)
     if not tables_mentioned:
-        print("⚠️  No table references found in this DD file")
+        yield finding(path, 'no-table-refs', 'info', "No table references found in this DD file")
         return
 
-    # Check tables
-    missing_tables = []
-    existing_tables = []
-
+    table_lines, field_lines = first_lines(content)
     for table in sorted(tables_mentioned):
-        if table not in schema_models:
-            missing_tables.append(table)
+        if table in schema_models:
+            stats['tables_found'] += 1
         else:
-            existing_tables.append(table)
-
-    # Report tables
-    if existing_tables:
-        print("✅ TABLES FOUND IN SCHEMA:")
-        for table in existing_tables:
-            print(f"   • {table}")
-
-    if missing_tables:
-        print("\n❌ TABLES NOT FOUND IN SCHEMA:")
-        for table in missing_tables:
-            print(f"   • {table}")
-
-    # Check fields for existing tables
-    if fields_by_table:
-        print("\n📋 FIELD VERIFICATION:")
-        for table in sorted(fields_by_table.keys()):
-            if table in schema_models:
-                schema_fields = set(schema_models[table])
-                mentioned_fields = fields_by_table[table]
-
-                missing_fields = mentioned_fields - schema_fields
-                existing_fields = mentioned_fields & schema_fields
-
-                print(f"\n   Table: {table}")
-                if existing_fields:
-                    print(f"   ✅ Found fields: {', '.join(sorted(existing_fields))}")
-                if missing_fields:
-                    print(f"   ❌ Missing fields: {', '.join(sorted(missing_fields))}")
-                    print(f"   📌 Available fields in schema: {', '.join(sorted(schema_fields)[:10])}...")
-
-    print()
-
-def main():
-    print("VERIFYING DD FILES AGAINST PRISMA SCHEMA")
-    print(f"{'='*80}\n")
-
-    # Parse schema
-    print("📖 Parsing Prisma schema...")
-    schema_models = parse_prisma_schema(schema_path)
-    print(f"   Found {len(schema_models)} models in schema\n")
+            yield finding(path, 'unknown-table', 'error',
+                          f"Table {table} not found in schema", table_lines.get(table))
 
-    # Verify each DD file
-    all_issues = []
-
-    for dd_file in dd_files:
-        dd_path = Path(dd_file)
+    for table in sorted(fields_by_table):
+        if table not in schema_models:
+            continue
+        schema_fields = set(schema_models[table])
+        for field in sorted(fields_by_table[table]):
+            if field in schema_fields:
+                stats['fields_found'] += 1
+                continue
+            yield finding(path, 'unknown-field', 'error',
+                          f"{table}.{field} not found in schema (available: "
+                          f"{', '.join(sorted(schema_fields)[:10])}...)", field_lines.get((table, field)))
+
+def iter_findings(paths, schema_models, corpus, stats):
+    """Yield findings file by file as each DD file is checked"""
+    for dd_path in paths:
         if not dd_path.exists():
-            print(f"⚠️  File not found: {dd_path.name}")
+            yield finding(rel(dd_path), 'file-not-found', 'warning', "DD file not found")
             continue
+        stats['files'] += 1
+        yield from dd_findings(dd_path, corpus.read(dd_path), schema_models, stats)
 
-        verify_dd_file(dd_file, schema_models)
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('files', nargs='*', type=Path,
+                        help="DD files (default: the system-administration DD files)")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    schema_models = parse_prisma_schema(schema_path)
+    paths = [p.resolve() for p in args.files] or [Path(f) for f in dd_files]
+    stats = defaultdict(int)
+
+    if args.ndjson:
+        report(iter_findings(paths, schema_models, corpus, stats), ndjson=True)
+        return 0
+
+    print("VERIFYING DD FILES AGAINST PRISMA SCHEMA")
+    print(f"{'='*80}\n")
+    print(f"📖 Found {len(schema_models)} models in schema\n")
+    counts = report(iter_findings(paths, schema_models, corpus, stats)).by_rule
 
     # Summary
     print(f"\n{'='*80}")
     print("VERIFICATION COMPLETE")
     print(f"{'='*80}")
-    print(f"Total DD files verified: {len(dd_files)}")
+    print(f"Total DD files verified: {stats['files']}")
     print(f"Total models in schema: {len(schema_models)}")
+    print(f"✅ Tables found in schema: {stats['tables_found']}")
+    print(f"❌ Tables not found in schema: {counts['unknown-table']}")
+    print(f"✅ Fields found in schema: {stats['fields_found']}")
+    print(f"❌ Fields not found in schema: {counts['unknown-field']}")
+    if counts['no-table-refs'] or counts['file-not-found']:
+        print(f"⚠️  Files without table references: {counts['no-table-refs']}, "
+              f"missing files: {counts['file-not-found']}")
+    return 1 if counts['unknown-table'] or counts['unknown-field'] else 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Verify DD field tables against Prisma field types and modifiers
+- Parse every Markdown field table in DD documents (name, type, nullable, default, relation)
+- Resolve each table to the Prisma model it documents
+- Compare column by column with the parsed schema and report mismatches
+  (e.g. Decimal vs Float, optional vs required, missing default, missing relation)
+
+The rows of all documents are collected into column arrays in one pass, so every
+normalization and comparison runs once per column; findings then stream out
+file by file (--ndjson for one JSON object per line).
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from docs_corpus import SCHEMA_PATH, Corpus, rel
+from findings import finding, report
+from markdown_tables import split_row
+from verify_dd_against_schema import field_attribute, parse_prisma_enums, parse_prisma_models
+
+NAME_HEADERS = ('field name', 'field', 'column name', 'column')
+TYPE_HEADERS = ('data type', 'type')
+REQUIRED_HEADERS = ('required',)
+NULLABLE_HEADERS = ('nullable', 'null')
+DEFAULT_HEADERS = ('default',)
+CONSTRAINT_HEADERS = ('constraints',)
+RELATION_HEADERS = ('relation', 'references', 'foreign key')
+
+TABLE_CONTEXT_PATTERN = re.compile(r'^\*\*(?:Table|Table Name|Database Table)\*\*:?\s*`?(\w+)`?')
+IDENTIFIER_PATTERN = re.compile(r'\w+')
+
+# Documented SQL/Prisma type (upper-cased, size stripped) -> comparable category
+TYPE_CATEGORIES = {
+    'UUID': 'Uuid',
+    'VARCHAR': 'String', 'CHAR': 'String', 'CHARACTER VARYING': 'String',
+    'TEXT': 'String', 'STRING': 'String', 'CITEXT': 'String',
+    'INTEGER': 'Int', 'INT': 'Int', 'INT4': 'Int', 'SMALLINT': 'Int', 'SERIAL': 'Int',
+    'BIGINT': 'BigInt', 'INT8': 'BigInt', 'BIGSERIAL': 'BigInt',
+    'DECIMAL': 'Decimal', 'NUMERIC': 'Decimal', 'MONEY': 'Decimal',
+    'FLOAT': 'Float', 'DOUBLE': 'Float', 'DOUBLE PRECISION': 'Float', 'REAL': 'Float',
+    'BOOLEAN': 'Boolean', 'BOOL': 'Boolean',
+    'TIMESTAMP': 'DateTime', 'TIMESTAMPTZ': 'DateTime', 'DATETIME': 'DateTime',
+    'DATE': 'DateTime', 'TIME': 'DateTime',
+    'JSON': 'Json', 'JSONB': 'Json',
+    'BYTEA': 'Bytes', 'BYTES': 'Bytes',
+    'ENUM': 'Enum',
+}
+
+EMPTY_VALUES = {'', '-', '—', 'n/a', 'none', 'null'}
+
+# Defaults described in prose (derived values, not column defaults) are not compared
+PROSE_DEFAULT_PREFIXES = ('auto', 'from ', 'calculated', 'derived', 'system', 'generated', 'current user')
+
+
+def find_column(headers, names):
+    for i, header in enumerate(headers):
+        if header in names:
+            return i
+    return None
+
+
+def resolve_model(text, models):
+    """Map a heading or table label to a schema model name, or None"""
+    for word in IDENTIFIER_PATTERN.findall(text):
+        if word in models:
+            return word
+        snake = re.sub(r'(?<!^)(?=[A-Z])', '_', word).lower()
+        for candidate in (f"tb_{word}", f"tb_{snake}", f"tb_{snake.rstrip('s')}"):
+            if candidate in models:
+                return candidate
+    return None
+
+
+def collect_rows(docs, models, corpus):
+    """Parse all field tables in all docs into column arrays"""
+    columns = defaultdict(list)
+
+    for doc in docs:
+        lines = corpus.read(doc).split('\n')
+
+        context = None
+        header = None
+        for line_no, line in enumerate(lines, 1):
+            stripped = line.strip()
+
+            if stripped.startswith('#'):
+                level = len(stripped) - len(stripped.lstrip('#'))
+                resolved = resolve_model(stripped.lstrip('#'), models)
+                if resolved or level <= 3:
+                    context = resolved
+                header = None
+                continue
+
+            label = TABLE_CONTEXT_PATTERN.match(stripped)
+            if label:
+                context = resolve_model(label.group(1), models) or context
+                continue
+
+            if not stripped.startswith('|'):
+                header = None
+                continue
+
+            cells = split_row(stripped)
+            if header is None:
+                headers = [c.lower().strip('* ') for c in cells]
+                name_col = find_column(headers, NAME_HEADERS)
+                type_col = find_column(headers, TYPE_HEADERS)
+                header = {
+                    'name': name_col,
+                    'type': type_col,
+                    'required': find_column(headers, REQUIRED_HEADERS),
+                    'nullable': find_column(headers, NULLABLE_HEADERS),
+                    'default': find_column(headers, DEFAULT_HEADERS),
+                    'constraints': find_column(headers, CONSTRAINT_HEADERS),
+                    'relation': find_column(headers, RELATION_HEADERS),
+                    'field_table': name_col is not None and type_col is not None,
+                }
+                continue
+            if not header['field_table'] or set(stripped) <= set('|-: '):
+                continue
+
+            def cell(key):
+                index = header[key]
+                return cells[index] if index is not None and index < len(cells) else ''
+
+            columns['file'].append(doc)
+            columns['line'].append(line_no)
+            columns['model'].append(context)
+            columns['name'].append(cell('name'))
+            columns['type'].append(cell('type'))
+            columns['required'].append(cell('required'))
+            columns['nullable'].append(cell('nullable'))
+            columns['default'].append(cell('default'))
+            columns['constraints'].append(cell('constraints'))
+            columns['relation'].append(cell('relation'))
+
+    return columns
+
+
+def normalize_name(value):
+    match = IDENTIFIER_PATTERN.search(value.replace('`', '').replace('*', ''))
+    return match.group(0) if match else ''
+
+
+def normalize_doc_type(value, enums):
+    """Documented type -> category (None when unknown)"""
+    text = value.replace('`', '').strip()
+    if text in enums or text.startswith('enum_') or text.upper().startswith('ENUM'):
+        return 'Enum'
+    base = re.sub(r'\(.*', '', text).upper().strip()
+    base = re.sub(r'\s+WITH(OUT)? TIME ZONE$', '', base)
+    base = re.sub(r'\[\]$', '', base)
+    if base in TYPE_CATEGORIES:
+        return TYPE_CATEGORIES[base]
+    first = base.split(' ')[0] if base else ''
+    return TYPE_CATEGORIES.get(first)
+
+
+def prisma_category(field, enums):
+    if field['type'] in enums:
+        return 'Enum'
+    if field['type'] == 'String' and any(a.startswith('@db.Uuid') for a in field['attributes']):
+        return 'Uuid'
+    return field['type']
+
+
+def normalize_nullable(required, nullable, constraints):
+    """True = documented optional, False = documented required, None = unknown"""
+    req = required.lower().strip('* ')
+    if req.startswith('yes') or req == 'required':
+        return False
+    if req.startswith('no') or req == 'optional':
+        return True
+    nul = nullable.lower().strip('* ')
+    if nul in ('yes', 'null', 'nullable', 'y'):
+        return True
+    if nul in ('no', 'not null', 'n'):
+        return False
+    con = constraints.upper()
+    if 'NOT NULL' in con or 'PRIMARY KEY' in con:
+        return False
+    if 'NULLABLE' in con or re.search(r'(^|[ ,])NULL($|[ ,])', con):
+        return True
+    return None
+
+
+def normalize_default(value):
+    text = value.replace('`', '').strip()
+    if text.lower() in EMPTY_VALUES:
+        return None
+    return text
+
+
+def normalize_relation(relation, constraints):
+    text = f"{relation} {constraints}".upper()
+    if relation and relation.lower().strip() not in EMPTY_VALUES:
+        return True
+    return 'FOREIGN KEY' in text or re.search(r'\bFK\b', text) is not None or 'REFERENCES' in text
+
+
+def foreign_keys(model):
+    """Scalar fields that back an @relation in this model"""
+    keys = set()
+    for field in model['fields'].values():
+        args = field_attribute(field, 'relation')
+        if args:
+            match = re.search(r'fields:\s*\[([^\]]*)\]', args)
+            if match:
+                keys.update(k.strip() for k in match.group(1).split(','))
+    return keys
+
+
+def compare(columns, models, enums):
+    """Compare the documented columns with the schema; yield findings in row order"""
+    names = [normalize_name(v) for v in columns['name']]
+    doc_types = [normalize_doc_type(v, enums) for v in columns['type']]
+    doc_optional = [normalize_nullable(r, n, c) for r, n, c in
+                    zip(columns['required'], columns['nullable'], columns['constraints'])]
+    doc_defaults = [normalize_default(v) for v in columns['default']]
+    doc_relations = [normalize_relation(r, c) for r, c in
+                     zip(columns['relation'], columns['constraints'])]
+    fk_cache = {}
+
+    for i, model_name in enumerate(columns['model']):
+        if model_name is None or not names[i]:
+            continue
+        model = models[model_name]
+        field = model['fields'].get(names[i])
+        where = {'file': rel(columns['file'][i]), 'line': columns['line'][i],
+                 'model': model_name, 'field': names[i]}
+
+        if field is None:
+            yield {**where, 'kind': 'missing_field',
+                   'documented': columns['type'][i], 'schema': None}
+            continue
+
+        schema_type = prisma_category(field, enums)
+        if doc_types[i] is not None and doc_types[i] != schema_type:
+            yield {**where, 'kind': 'type',
+                   'documented': columns['type'][i], 'schema': field['type']}
+
+        if doc_optional[i] is not None and doc_optional[i] != field['optional']:
+            yield {**where, 'kind': 'nullability',
+                   'documented': 'optional' if doc_optional[i] else 'required',
+                   'schema': 'optional' if field['optional'] else 'required'}
+
+        schema_default = field_attribute(field, 'default')
+        prose = (doc_defaults[i] or '').lower().startswith(PROSE_DEFAULT_PREFIXES)
+        if columns['default'][i] and not prose and (doc_defaults[i] is None) != (schema_default is None):
+            yield {**where, 'kind': 'default',
+                   'documented': doc_defaults[i], 'schema': schema_default}
+
+        if model_name not in fk_cache:
+            fk_cache[model_name] = foreign_keys(model)
+        is_fk = names[i] in fk_cache[model_name]
+        if doc_relations[i] != is_fk and (doc_relations[i] or columns['constraints'][i]):
+            yield {**where, 'kind': 'relation',
+                   'documented': 'foreign key' if doc_relations[i] else 'plain column',
+                   'schema': 'foreign key' if is_fk else 'plain column'}
+
+
+KIND_LABELS = {
+    'missing_field': 'Field not in schema',
+    'type': 'Type mismatch',
+    'nullability': 'Nullability mismatch',
+    'default': 'Default mismatch',
+    'relation': 'Relation mismatch',
+}
+
+# kind -> (rule, severity)
+KIND_RULES = {
+    'missing_field': ('missing-field', 'error'),
+    'type': ('type-mismatch', 'error'),
+    'nullability': ('nullability-mismatch', 'warning'),
+    'default': ('default-mismatch', 'warning'),
+    'relation': ('relation-mismatch', 'warning'),
+}
+
+
+def iter_mismatches(docs, models, enums, corpus, stats):
+    """Parse every doc's rows in one pass, then yield compare() results grouped by file;
+    stats counts parsed and matched rows"""
+    columns = collect_rows(docs, models, corpus)
+    stats['rows'] += len(columns['name'])
+    stats['matched'] += sum(1 for m in columns['model'] if m is not None)
+    yield from compare(columns, models, enums)
+
+
+def to_finding(item):
+    rule, severity = KIND_RULES[item['kind']]
+    return finding(item['file'], rule, severity,
+                   f"{KIND_LABELS[item['kind']]} {item['model']}.{item['field']} - documented "
+                   f"{item['documented']!r}, schema {item['schema']!r}", item['line'])
+
+
+def main(argv=None, corpus=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--schema', type=Path, default=SCHEMA_PATH)
+    parser.add_argument('--json', action='store_true', help="Print findings as JSON")
+    parser.add_argument('--ndjson', action='store_true', help="Stream findings as NDJSON")
+    parser.add_argument('files', nargs='*', type=Path, help="DD files (default: all)")
+    args = parser.parse_args(argv)
+    corpus = corpus or Corpus()
+
+    started = time.perf_counter()
+    models = parse_prisma_models(args.schema)
+    enums = parse_prisma_enums(args.schema)
+    docs = args.files or corpus.find(('DD',))
+    stats = Counter()
+    mismatches = iter_mismatches(docs, models, enums, corpus, stats)
+
+    if args.json:
+        print(json.dumps(list(mismatches), indent=2))
+        return 0
+    findings = (to_finding(item) for item in mismatches)
+    if args.ndjson:
+        report(findings, ndjson=True)
+        return 0
+
+    print("VERIFYING DD FIELD TABLES AGAINST PRISMA TYPES")
+    print(f"{'='*80}")
+    counts = report(findings).by_rule
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*80}")
+    print("SUMMARY")
+    print(f"{'='*80}")
+    print(f"DD files scanned: {len(docs)}")
+    print(f"Field rows parsed: {stats['rows']} ({stats['matched']} matched to schema models)")
+    for kind, label in KIND_LABELS.items():
+        print(f"{label}: {counts[KIND_RULES[kind][0]]}")
+    print(f"⏱️  {elapsed * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())